@@ -1,4 +1,5 @@
 import asyncio
+import re
 from logging.config import fileConfig
 
 from alembic import context
@@ -8,7 +9,18 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.config import settings
 from app.db.base import Base
-from app.models import RefreshToken, Task, User, Workspace, WorkspaceMember  # noqa: F401
+from app.models import (  # noqa: F401
+    RefreshToken,
+    Task,
+    TaskArchive,
+    TaskChange,
+    User,
+    Workspace,
+    WorkspaceDeletion,
+    WorkspaceMember,
+    WorkspaceTaskCounter,
+    WorkspaceTaskStats,
+)
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
@@ -18,6 +30,16 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Partitions of tasks and the tables kept around while it is being
+# partitioned are not in the models; autogenerate should not drop them.
+UNMANAGED_TABLES = re.compile(r"tasks_(p\d+|partitioned|unpartitioned)")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    if type_ == "table":
+        return not UNMANAGED_TABLES.fullmatch(name)
+    return True
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -26,6 +48,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -35,6 +58,7 @@ def do_run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
+        include_name=include_name,
     )
     with context.begin_transaction():
         context.run_migrations()
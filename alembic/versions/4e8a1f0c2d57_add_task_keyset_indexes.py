@@ -0,0 +1,46 @@
+"""add task keyset pagination indexes
+
+Revision ID: 4e8a1f0c2d57
+Revises: 9c1d2e7a4b30
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8a1f0c2d57"
+down_revision: Union[str, Sequence[str], None] = "9c1d2e7a4b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_tasks_workspace_created": "(workspace_id, created_at, id)",
+    "ix_tasks_workspace_completed_created": "(workspace_id, is_completed, created_at, id)",
+    "ix_tasks_workspace_priority_created": "(workspace_id, priority, created_at, id)",
+    "ix_tasks_workspace_due_date": "(workspace_id, due_date)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so tasks stays writable while they build.
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES.items():
+            # An earlier failed run leaves an INVALID index behind.
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(f"CREATE INDEX CONCURRENTLY {name} ON tasks {definition}")
+        # Every new index starts with workspace_id, so this one is redundant.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_workspace_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_workspace_id")
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_workspace_id ON tasks (workspace_id)")
+        for name in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
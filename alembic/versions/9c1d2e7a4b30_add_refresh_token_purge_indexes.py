@@ -0,0 +1,59 @@
+"""add refresh token purge indexes
+
+Revision ID: 9c1d2e7a4b30
+Revises: b28a24a19a2a
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1d2e7a4b30"
+down_revision: Union[str, Sequence[str], None] = "b28a24a19a2a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so logins and refreshes keep writing refresh_tokens.
+    with op.get_context().autocommit_block():
+        # An earlier failed run leaves INVALID indexes behind.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_refresh_tokens_revoked_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_refresh_tokens_expires_at_active")
+        op.create_index(
+            "ix_refresh_tokens_revoked_at",
+            "refresh_tokens",
+            ["revoked_at"],
+            unique=False,
+            postgresql_where=sa.text("revoked_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_refresh_tokens_expires_at_active",
+            "refresh_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_refresh_tokens_expires_at_active",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_revoked_at",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+        )
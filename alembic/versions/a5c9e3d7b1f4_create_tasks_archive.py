@@ -0,0 +1,114 @@
+"""create tasks archive
+
+Revision ID: a5c9e3d7b1f4
+Revises: f2d8b4e6a0c3
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5c9e3d7b1f4"
+down_revision: Union[str, Sequence[str], None] = "f2d8b4e6a0c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CANDIDATES_INDEX = "ix_tasks_completed_updated"
+CANDIDATES_DEFINITION = "(updated_at, id) WHERE is_completed = true"
+
+
+def _create_candidates_index() -> None:
+    """Build the archiver's index on tasks without blocking writes.
+
+    CREATE INDEX CONCURRENTLY doesn't work on a partitioned table, so the
+    parent gets an invalid index ON ONLY itself, each partition builds
+    its own concurrently and is attached; the parent index turns valid
+    once every partition has one. Safe to rerun after a failure.
+    """
+    bind = op.get_bind()
+    partitioned = bind.scalar(sa.text("SELECT relkind = 'p' FROM pg_class WHERE oid = 'tasks'::regclass"))
+    if not partitioned:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {CANDIDATES_INDEX}")
+        op.execute(f"CREATE INDEX CONCURRENTLY {CANDIDATES_INDEX} ON tasks {CANDIDATES_DEFINITION}")
+        return
+
+    op.execute(f"CREATE INDEX IF NOT EXISTS {CANDIDATES_INDEX} ON ONLY tasks {CANDIDATES_DEFINITION}")
+    partitions = bind.execute(
+        sa.text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'tasks'::regclass")
+    ).scalars().all()
+    for partition in partitions:
+        name = f"{partition}_completed_updated_idx"
+        valid = bind.scalar(
+            sa.text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+            {"name": name},
+        )
+        # A build that failed earlier leaves an invalid, unattached index.
+        if not valid:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(f"CREATE INDEX CONCURRENTLY {name} ON {partition} {CANDIDATES_DEFINITION}")
+        op.execute(f"ALTER INDEX {CANDIDATES_INDEX} ATTACH PARTITION {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tasks_archive",
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("number", sa.BigInteger(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("is_completed", sa.Boolean(), nullable=False),
+        sa.Column("priority", sa.SmallInteger(), nullable=False),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("workspace_id", "id"),
+    )
+    op.create_index(
+        "uq_tasks_archive_workspace_number",
+        "tasks_archive",
+        ["workspace_id", "number"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_tasks_archive_workspace_created",
+        "tasks_archive",
+        ["workspace_id", "created_at", "id"],
+        unique=False,
+    )
+    op.add_column(
+        "workspace_deletions",
+        sa.Column("archived_deleted", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    with op.get_context().autocommit_block():
+        _create_candidates_index()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Archived tasks go back to the hot table rather than being lost.
+    columns = (
+        "id, workspace_id, number, title, description, is_completed, priority, due_date, "
+        "user_id, created_at, updated_at"
+    )
+    op.execute(f"INSERT INTO tasks ({columns}) SELECT {columns} FROM tasks_archive")
+    op.execute(f"DROP INDEX {CANDIDATES_INDEX}")
+    op.drop_column("workspace_deletions", "archived_deleted")
+    op.drop_index("ix_tasks_archive_workspace_created", table_name="tasks_archive")
+    op.drop_index("uq_tasks_archive_workspace_number", table_name="tasks_archive")
+    op.drop_table("tasks_archive")
@@ -0,0 +1,167 @@
+"""create workspace task stats
+
+Revision ID: a7c4e2f9d1b6
+Revises: d3f5a9b1c8e2
+Create Date: 2026-10-18 13:00:00.000000
+
+Statement-level triggers on tasks keep one counters row per workspace.
+Every task write upserts that row and holds its lock until commit, so
+writes to tasks of the same workspace are serialized on it; writes to
+different workspaces do not contend. A statement touching several
+workspaces upserts their rows in workspace_id order, so two such
+statements (the archiver's delete, say) cannot deadlock each other.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e2f9d1b6"
+down_revision: Union[str, Sequence[str], None] = "d3f5a9b1c8e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _apply_delta(source: str) -> str:
+    """Upsert signed per-workspace deltas computed from ``source``.
+
+    ``source`` yields (workspace_id, sign, is_completed, priority) rows.
+    Workspaces deleted in the same statement (cascade) are skipped, their
+    stats row goes away with them. Rows are upserted in workspace_id
+    order, which fixes the order their locks are taken in.
+    """
+    return f"""
+        INSERT INTO workspace_task_stats AS s
+            (workspace_id, open_count, completed_count, open_low, open_medium, open_high, updated_at)
+        SELECT d.workspace_id,
+               coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed), 0),
+               coalesce(sum(d.sign) FILTER (WHERE d.is_completed), 0),
+               coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 'low'), 0),
+               coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 'medium'), 0),
+               coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 'high'), 0),
+               now()
+        FROM ({source}) AS d
+        WHERE EXISTS (SELECT 1 FROM workspaces w WHERE w.id = d.workspace_id)
+        GROUP BY d.workspace_id
+        ORDER BY d.workspace_id
+        ON CONFLICT (workspace_id) DO UPDATE SET
+            open_count = s.open_count + EXCLUDED.open_count,
+            completed_count = s.completed_count + EXCLUDED.completed_count,
+            open_low = s.open_low + EXCLUDED.open_low,
+            open_medium = s.open_medium + EXCLUDED.open_medium,
+            open_high = s.open_high + EXCLUDED.open_high,
+            updated_at = EXCLUDED.updated_at;
+    """
+
+
+INSERTED = "SELECT workspace_id, 1 AS sign, is_completed, priority FROM new_rows"
+DELETED = "SELECT workspace_id, -1 AS sign, is_completed, priority FROM old_rows"
+# Only rows whose counted attributes changed; title edits cost nothing.
+UPDATED = """
+    SELECT n.workspace_id, 1 AS sign, n.is_completed, n.priority
+    FROM new_rows n JOIN old_rows o ON o.id = n.id
+    WHERE (n.workspace_id, n.is_completed, n.priority)
+          IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+    UNION ALL
+    SELECT o.workspace_id, -1 AS sign, o.is_completed, o.priority
+    FROM new_rows n JOIN old_rows o ON o.id = n.id
+    WHERE (n.workspace_id, n.is_completed, n.priority)
+          IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+"""
+
+STATS_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION workspace_task_stats_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_apply_delta(INSERTED)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {_apply_delta(DELETED)}
+    ELSE
+        {_apply_delta(UPDATED)}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "workspace_task_stats",
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("open_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("completed_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("open_low", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("open_medium", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("open_high", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("workspace_id"),
+    )
+    op.execute(STATS_FUNCTION)
+    op.execute(
+        """
+        CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workspace_task_stats_apply()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_stats_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workspace_task_stats_apply()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workspace_task_stats_apply()
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO workspace_task_stats
+            (workspace_id, open_count, completed_count, open_low, open_medium, open_high)
+        SELECT workspace_id,
+               count(*) FILTER (WHERE NOT is_completed),
+               count(*) FILTER (WHERE is_completed),
+               count(*) FILTER (WHERE NOT is_completed AND priority = 'low'),
+               count(*) FILTER (WHERE NOT is_completed AND priority = 'medium'),
+               count(*) FILTER (WHERE NOT is_completed AND priority = 'high')
+        FROM tasks
+        GROUP BY workspace_id
+        """
+    )
+
+    # Built concurrently so tasks stays writable while it builds.
+    with op.get_context().autocommit_block():
+        # An earlier failed run leaves an INVALID index behind.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_workspace_open_due_date")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_workspace_open_due_date "
+            "ON tasks (workspace_id, due_date) WHERE is_completed = false"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_workspace_open_due_date")
+    op.execute("DROP TRIGGER tasks_stats_delete ON tasks")
+    op.execute("DROP TRIGGER tasks_stats_update ON tasks")
+    op.execute("DROP TRIGGER tasks_stats_insert ON tasks")
+    op.execute("DROP FUNCTION workspace_task_stats_apply()")
+    op.drop_table("workspace_task_stats")
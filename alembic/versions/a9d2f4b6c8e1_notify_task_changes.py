@@ -0,0 +1,74 @@
+"""notify task changes
+
+Revision ID: a9d2f4b6c8e1
+Revises: f1a3c6e8b2d4
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d2f4b6c8e1"
+down_revision: Union[str, Sequence[str], None] = "f1a3c6e8b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _notify(source: str) -> str:
+    return f"""
+        PERFORM pg_notify(
+            'task_changes',
+            json_build_object('type', 'changed', 'workspace_id', s.workspace_id, 'version', s.version)::text
+        )
+        FROM workspace_task_stats s
+        WHERE s.workspace_id IN ({source});
+    """
+
+
+# One small message per workspace and statement, delivered on commit. It
+# carries only the new version; listeners fetch the rows through the
+# changes endpoint, which keeps payloads far below the 8000-byte limit.
+# Fires after tasks_stats_* (name order), so the version is already bumped.
+NOTIFY_FUNCTION = f"""
+CREATE FUNCTION task_changes_notify() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_notify("SELECT workspace_id FROM new_rows")}
+    ELSIF TG_OP = 'DELETE' THEN
+        {_notify("SELECT workspace_id FROM old_rows")}
+    ELSE
+        {_notify("SELECT workspace_id FROM new_rows UNION SELECT workspace_id FROM old_rows")}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(NOTIFY_FUNCTION)
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER tasks_sync_notify_{event.lower()} AFTER {event} ON tasks
+            REFERENCING {transition}
+            FOR EACH STATEMENT EXECUTE FUNCTION task_changes_notify()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for event in ("delete", "update", "insert"):
+        op.execute(f"DROP TRIGGER tasks_sync_notify_{event} ON tasks")
+    op.execute("DROP FUNCTION task_changes_notify()")
@@ -0,0 +1,58 @@
+"""index workspace members
+
+Revision ID: b3e7c1d5f9a2
+Revises: a9d2f4b6c8e1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e7c1d5f9a2"
+down_revision: Union[str, Sequence[str], None] = "a9d2f4b6c8e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLE_RANK = "CASE {role} WHEN 'OWNER' THEN 2 WHEN 'ADMIN' THEN 1 ELSE 0 END"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nothing stopped a user from being added to a workspace twice. Keep
+    # the highest role, and the earliest row among equals.
+    op.execute(
+        f"""
+        DELETE FROM workspace_members m
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY workspace_id, user_id
+                ORDER BY {ROLE_RANK.format(role="role")} DESC, joined_at, id
+            ) AS rank
+            FROM workspace_members
+        ) ranked
+        WHERE m.id = ranked.id AND ranked.rank > 1
+        """
+    )
+    with op.get_context().autocommit_block():
+        # An earlier failed run leaves an INVALID index behind.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_workspace_members_workspace_user")
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_workspace_members_workspace_user "
+            "ON workspace_members (workspace_id, user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workspace_members_user_id")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_workspace_members_user_id "
+            "ON workspace_members (user_id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workspace_members_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_workspace_members_workspace_user")
@@ -0,0 +1,192 @@
+"""store task priority as smallint
+
+Revision ID: c5e1b7a3f902
+Revises: a7c4e2f9d1b6
+Create Date: 2026-10-18 15:00:00.000000
+
+Runs online: the new column is added empty, kept in sync by a trigger
+while it is backfilled in small committed batches, indexed CONCURRENTLY
+and made NOT NULL through a validated CHECK, so no step holds a long
+lock on tasks. Only the final swap takes ACCESS EXCLUSIVE, and it
+touches the catalog only.
+"""
+
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e1b7a3f902"
+down_revision: Union[str, Sequence[str], None] = "a7c4e2f9d1b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10_000
+
+PRIORITY_CODE = "CASE {column} WHEN 'low' THEN 1 WHEN 'high' THEN 3 ELSE 2 END"
+
+SYNC_FUNCTION = f"""
+CREATE FUNCTION tasks_priority_code_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.priority_code := {PRIORITY_CODE.format(column="NEW.priority")};
+    RETURN NEW;
+END;
+$$;
+"""
+
+# Fills one batch of tasks after :id, in primary key order.
+BACKFILL_SQL = sa.text(
+    f"""
+    UPDATE tasks t SET priority_code = {PRIORITY_CODE.format(column="t.priority")}
+    FROM (
+        SELECT id FROM tasks
+        WHERE id > :id AND priority_code IS NULL
+        ORDER BY id
+        LIMIT :batch_size
+    ) b
+    WHERE t.id = b.id
+    RETURNING t.id
+    """
+)
+
+
+def _stats_function(low: str, medium: str, high: str) -> str:
+    """workspace_task_stats_apply() with the given priority literals."""
+
+    def apply_delta(source: str) -> str:
+        return f"""
+            INSERT INTO workspace_task_stats AS s
+                (workspace_id, open_count, completed_count, open_low, open_medium, open_high, updated_at)
+            SELECT d.workspace_id,
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = {low}), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = {medium}), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = {high}), 0),
+                   now()
+            FROM ({source}) AS d
+            WHERE EXISTS (SELECT 1 FROM workspaces w WHERE w.id = d.workspace_id)
+            GROUP BY d.workspace_id
+            ORDER BY d.workspace_id
+            ON CONFLICT (workspace_id) DO UPDATE SET
+                open_count = s.open_count + EXCLUDED.open_count,
+                completed_count = s.completed_count + EXCLUDED.completed_count,
+                open_low = s.open_low + EXCLUDED.open_low,
+                open_medium = s.open_medium + EXCLUDED.open_medium,
+                open_high = s.open_high + EXCLUDED.open_high,
+                updated_at = EXCLUDED.updated_at;
+        """
+
+    inserted = "SELECT workspace_id, 1 AS sign, is_completed, priority FROM new_rows"
+    deleted = "SELECT workspace_id, -1 AS sign, is_completed, priority FROM old_rows"
+    updated = """
+        SELECT n.workspace_id, 1 AS sign, n.is_completed, n.priority
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.workspace_id, n.is_completed, n.priority)
+              IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+        UNION ALL
+        SELECT o.workspace_id, -1 AS sign, o.is_completed, o.priority
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.workspace_id, n.is_completed, n.priority)
+              IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+    """
+    return f"""
+    CREATE OR REPLACE FUNCTION workspace_task_stats_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {apply_delta(inserted)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {apply_delta(deleted)}
+        ELSE
+            {apply_delta(updated)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("priority_code", sa.SmallInteger(), nullable=True))
+    op.execute(SYNC_FUNCTION)
+    op.execute(
+        """
+        CREATE TRIGGER tasks_priority_code_sync BEFORE INSERT OR UPDATE OF priority ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_priority_code_sync()
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        # Batches commit on their own and resume from the last id;
+        # priority itself is unchanged, so the stats trigger sees no delta.
+        task_id = uuid.UUID(int=0)
+        while ids := bind.execute(
+            BACKFILL_SQL, {"id": task_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).scalars().all():
+            task_id = max(ids)
+
+        # Validated CHECKs take no long lock. The range check follows the
+        # column through the rename; the NOT NULL one only lets SET NOT NULL
+        # skip its table scan.
+        op.execute(
+            "ALTER TABLE tasks ADD CONSTRAINT ck_tasks_priority "
+            "CHECK (priority_code BETWEEN 1 AND 3) NOT VALID"
+        )
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT ck_tasks_priority")
+        op.execute(
+            "ALTER TABLE tasks ADD CONSTRAINT ck_tasks_priority_code_not_null "
+            "CHECK (priority_code IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT ck_tasks_priority_code_not_null")
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_workspace_priority_code_created "
+            "ON tasks (workspace_id, priority_code, created_at, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_workspace_open_priority_due "
+            "ON tasks (workspace_id, priority_code DESC, due_date) WHERE is_completed = false"
+        )
+
+    # The swap: catalog-only changes under one short ACCESS EXCLUSIVE lock.
+    op.execute("LOCK TABLE tasks IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER tasks_priority_code_sync ON tasks")
+    op.execute("DROP FUNCTION tasks_priority_code_sync()")
+    op.execute("ALTER TABLE tasks ALTER COLUMN priority_code SET NOT NULL")
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT ck_tasks_priority_code_not_null")
+    op.drop_index("ix_tasks_workspace_priority_created", table_name="tasks")
+    op.drop_column("tasks", "priority")
+    op.alter_column("tasks", "priority_code", new_column_name="priority")
+    op.alter_column("tasks", "priority", server_default=sa.text("2"))
+    op.execute(
+        "ALTER INDEX ix_tasks_workspace_priority_code_created RENAME TO ix_tasks_workspace_priority_created"
+    )
+    op.execute(_stats_function("1", "2", "3"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_workspace_open_priority_due", table_name="tasks")
+    op.drop_index("ix_tasks_workspace_priority_created", table_name="tasks")
+    op.drop_constraint("ck_tasks_priority", "tasks", type_="check")
+    op.alter_column(
+        "tasks",
+        "priority",
+        type_=sa.String(length=20),
+        server_default=sa.text("'medium'"),
+        postgresql_using="(ARRAY['low', 'medium', 'high'])[priority]",
+    )
+    op.create_index(
+        "ix_tasks_workspace_priority_created",
+        "tasks",
+        ["workspace_id", "priority", "created_at", "id"],
+        unique=False,
+    )
+    op.execute(_stats_function("'low'", "'medium'", "'high'"))
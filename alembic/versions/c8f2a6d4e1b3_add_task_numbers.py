@@ -0,0 +1,132 @@
+"""add task numbers
+
+Revision ID: c8f2a6d4e1b3
+Revises: b3e7c1d5f9a2
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8f2a6d4e1b3"
+down_revision: Union[str, Sequence[str], None] = "b3e7c1d5f9a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10_000
+
+# Rows inserted without a number, e.g. by code deployed before this
+# migration, take the next one from the counter.
+ASSIGN_FUNCTION = """
+CREATE FUNCTION tasks_number_assign() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF NEW.number IS NULL THEN
+        INSERT INTO workspace_task_counters AS c (workspace_id, next_number)
+        VALUES (NEW.workspace_id, 2)
+        ON CONFLICT (workspace_id) DO UPDATE SET next_number = c.next_number + 1
+        RETURNING c.next_number - 1 INTO NEW.number;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+"""
+
+# Numbers existing tasks of one workspace after the key (created_at, id),
+# oldest first, continuing from :offset.
+BACKFILL_SQL = sa.text(
+    """
+    UPDATE tasks t SET number = :offset + b.n
+    FROM (
+        SELECT id, row_number() OVER (ORDER BY created_at, id) AS n
+        FROM tasks
+        WHERE workspace_id = :workspace_id AND number IS NULL
+          AND (created_at, id) > (:created_at, :id)
+        ORDER BY created_at, id
+        LIMIT :batch_size
+    ) b
+    WHERE t.id = b.id
+    RETURNING t.number, t.created_at, t.id
+    """
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "workspace_task_counters",
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("next_number", sa.BigInteger(), server_default=sa.text("1"), nullable=False),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("workspace_id"),
+    )
+    op.add_column("tasks", sa.Column("number", sa.BigInteger(), nullable=True))
+    op.execute(ASSIGN_FUNCTION)
+    # Creating the trigger blocks inserts until this transaction commits,
+    # so the counts below cover exactly the tasks left without a number:
+    # they keep 1..count and everything inserted later comes after them.
+    op.execute(
+        """
+        CREATE TRIGGER tasks_number_assign BEFORE INSERT ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_number_assign()
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO workspace_task_counters (workspace_id, next_number)
+        SELECT workspace_id, count(*) + 1 FROM tasks GROUP BY workspace_id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        workspace_ids = bind.execute(
+            sa.text("SELECT DISTINCT workspace_id FROM tasks WHERE number IS NULL")
+        ).scalars().all()
+        for workspace_id in workspace_ids:
+            # Batches commit on their own and resume from the last key.
+            # Tasks deleted meanwhile just leave gaps.
+            offset, created_at, task_id = 0, datetime.min.replace(tzinfo=timezone.utc), uuid.UUID(int=0)
+            while rows := bind.execute(
+                BACKFILL_SQL,
+                {
+                    "workspace_id": workspace_id,
+                    "offset": offset,
+                    "created_at": created_at,
+                    "id": task_id,
+                    "batch_size": BACKFILL_BATCH_SIZE,
+                },
+            ).all():
+                offset, created_at, task_id = max(rows)
+
+        op.execute(
+            "ALTER TABLE tasks ADD CONSTRAINT ck_tasks_number_not_null "
+            "CHECK (number IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT ck_tasks_number_not_null")
+        # An earlier failed run leaves an INVALID index behind.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_tasks_workspace_number")
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_tasks_workspace_number "
+            "ON tasks (workspace_id, number)"
+        )
+
+    # SET NOT NULL relies on the validated CHECK and skips the table scan.
+    op.execute("ALTER TABLE tasks ALTER COLUMN number SET NOT NULL")
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT ck_tasks_number_not_null")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER tasks_number_assign ON tasks")
+    op.execute("DROP FUNCTION tasks_number_assign()")
+    op.drop_index("uq_tasks_workspace_number", table_name="tasks")
+    op.drop_column("tasks", "number")
+    op.drop_table("workspace_task_counters")
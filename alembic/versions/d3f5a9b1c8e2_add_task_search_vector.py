@@ -0,0 +1,94 @@
+"""add task search vector
+
+Revision ID: d3f5a9b1c8e2
+Revises: 4e8a1f0c2d57
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f5a9b1c8e2"
+down_revision: Union[str, Sequence[str], None] = "4e8a1f0c2d57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def _search_vector(row: str) -> str:
+    """Must match app.models.task.SEARCH_VECTOR_EXPRESSION at this revision."""
+    return (
+        f"setweight(to_tsvector('simple', coalesce({row}.title, '')), 'A') || "
+        f"setweight(to_tsvector('simple', coalesce({row}.description, '')), 'B')"
+    )
+
+
+# A trigger rather than a generated column: adding a STORED generated
+# column rewrites the whole table under an ACCESS EXCLUSIVE lock.
+UPDATE_FUNCTION = f"""
+CREATE FUNCTION tasks_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := {_search_vector("NEW")};
+    RETURN NEW;
+END;
+$$;
+"""
+
+# Fills one batch of tasks after :id, in primary key order.
+BACKFILL_SQL = sa.text(
+    f"""
+    UPDATE tasks t SET search_vector = {_search_vector("t")}
+    FROM (
+        SELECT id FROM tasks
+        WHERE id > :id AND search_vector IS NULL
+        ORDER BY id
+        LIMIT :batch_size
+    ) b
+    WHERE t.id = b.id
+    RETURNING t.id
+    """
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.execute(UPDATE_FUNCTION)
+    # From here on every new or edited task gets its vector; the backfill
+    # below only has to cover rows that existed before.
+    op.execute(
+        """
+        CREATE TRIGGER tasks_search_vector_update BEFORE INSERT OR UPDATE OF title, description
+        ON tasks FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update()
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        # Batches commit on their own and resume from the last id.
+        task_id = uuid.UUID(int=0)
+        while ids := bind.execute(
+            BACKFILL_SQL, {"id": task_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).scalars().all():
+            task_id = max(ids)
+
+        # An earlier failed run leaves an INVALID index behind.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_search_vector")
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_search_vector ON tasks USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_search_vector", table_name="tasks")
+    op.execute("DROP TRIGGER tasks_search_vector_update ON tasks")
+    op.execute("DROP FUNCTION tasks_search_vector_update()")
+    op.drop_column("tasks", "search_vector")
@@ -0,0 +1,126 @@
+"""add workspace deletions
+
+Revision ID: d4a8e2c6f0b7
+Revises: c8f2a6d4e1b3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a8e2c6f0b7"
+down_revision: Union[str, Sequence[str], None] = "c8f2a6d4e1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _stats_function(skip_deleting: bool) -> str:
+    """workspace_task_stats_apply(), optionally ignoring deleting workspaces.
+
+    The workspace deleter removes the stats row up front. With
+    skip_deleting it is never recreated, and since the change log and
+    NOTIFY triggers join the stats row, the deleter's batches write no
+    tombstones and send no notifications.
+    """
+    live = " AND w.deleting_at IS NULL" if skip_deleting else ""
+
+    def apply_delta(source: str) -> str:
+        return f"""
+            INSERT INTO workspace_task_stats AS s
+                (workspace_id, open_count, completed_count, open_low, open_medium, open_high,
+                 updated_at, version)
+            SELECT d.workspace_id,
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 1), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 2), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 3), 0),
+                   now(), 1
+            FROM ({source}) AS d
+            WHERE EXISTS (SELECT 1 FROM workspaces w WHERE w.id = d.workspace_id{live})
+            GROUP BY d.workspace_id
+            ORDER BY d.workspace_id
+            ON CONFLICT (workspace_id) DO UPDATE SET
+                open_count = s.open_count + EXCLUDED.open_count,
+                completed_count = s.completed_count + EXCLUDED.completed_count,
+                open_low = s.open_low + EXCLUDED.open_low,
+                open_medium = s.open_medium + EXCLUDED.open_medium,
+                open_high = s.open_high + EXCLUDED.open_high,
+                updated_at = EXCLUDED.updated_at,
+                version = s.version + 1;
+        """
+
+    changed = """
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.workspace_id, n.is_completed, n.priority)
+              IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+    """
+    inserted = "SELECT workspace_id, 1 AS sign, is_completed, priority FROM new_rows"
+    deleted = "SELECT workspace_id, -1 AS sign, is_completed, priority FROM old_rows"
+    updated = f"""
+        SELECT n.workspace_id, 1 AS sign, n.is_completed, n.priority {changed}
+        UNION ALL
+        SELECT o.workspace_id, -1 AS sign, o.is_completed, o.priority {changed}
+        UNION ALL
+        SELECT workspace_id, 0 AS sign, is_completed, priority FROM new_rows
+    """
+    return f"""
+    CREATE OR REPLACE FUNCTION workspace_task_stats_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {apply_delta(inserted)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {apply_delta(deleted)}
+        ELSE
+            {apply_delta(updated)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("workspaces", sa.Column("deleting_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_table(
+        "workspace_deletions",
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("requested_by", sa.UUID(), nullable=True),
+        sa.Column(
+            "requested_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("tasks_total", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("tasks_deleted", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("changes_deleted", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("members_deleted", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("batches", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["requested_by"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("workspace_id"),
+    )
+    op.create_index(
+        "ix_workspace_deletions_pending",
+        "workspace_deletions",
+        ["requested_at"],
+        unique=False,
+        postgresql_where=sa.text("finished_at IS NULL"),
+    )
+    op.execute(_stats_function(skip_deleting=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(_stats_function(skip_deleting=False))
+    op.drop_index("ix_workspace_deletions_pending", table_name="workspace_deletions")
+    op.drop_table("workspace_deletions")
+    op.drop_column("workspaces", "deleting_at")
@@ -0,0 +1,105 @@
+"""add workspace task version
+
+Revision ID: e2b9d4c7a6f1
+Revises: c5e1b7a3f902
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b9d4c7a6f1"
+down_revision: Union[str, Sequence[str], None] = "c5e1b7a3f902"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _stats_function(bump_version: bool) -> str:
+    """workspace_task_stats_apply(), optionally bumping version per statement.
+
+    With bump_version, updates contribute a zero-delta row for every
+    updated task so that edits which leave the counters alone still reach
+    the upsert and advance the workspace version.
+    """
+    version_insert = ", version" if bump_version else ""
+    version_value = ", 1" if bump_version else ""
+    version_update = ",\n                version = s.version + 1" if bump_version else ""
+
+    def apply_delta(source: str) -> str:
+        return f"""
+            INSERT INTO workspace_task_stats AS s
+                (workspace_id, open_count, completed_count, open_low, open_medium, open_high,
+                 updated_at{version_insert})
+            SELECT d.workspace_id,
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE d.is_completed), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 1), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 2), 0),
+                   coalesce(sum(d.sign) FILTER (WHERE NOT d.is_completed AND d.priority = 3), 0),
+                   now(){version_value}
+            FROM ({source}) AS d
+            WHERE EXISTS (SELECT 1 FROM workspaces w WHERE w.id = d.workspace_id)
+            GROUP BY d.workspace_id
+            ORDER BY d.workspace_id
+            ON CONFLICT (workspace_id) DO UPDATE SET
+                open_count = s.open_count + EXCLUDED.open_count,
+                completed_count = s.completed_count + EXCLUDED.completed_count,
+                open_low = s.open_low + EXCLUDED.open_low,
+                open_medium = s.open_medium + EXCLUDED.open_medium,
+                open_high = s.open_high + EXCLUDED.open_high,
+                updated_at = EXCLUDED.updated_at{version_update};
+        """
+
+    changed = """
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.workspace_id, n.is_completed, n.priority)
+              IS DISTINCT FROM (o.workspace_id, o.is_completed, o.priority)
+    """
+    touched = (
+        "\n        UNION ALL\n"
+        "        SELECT workspace_id, 0 AS sign, is_completed, priority FROM new_rows"
+        if bump_version
+        else ""
+    )
+    inserted = "SELECT workspace_id, 1 AS sign, is_completed, priority FROM new_rows"
+    deleted = "SELECT workspace_id, -1 AS sign, is_completed, priority FROM old_rows"
+    updated = f"""
+        SELECT n.workspace_id, 1 AS sign, n.is_completed, n.priority {changed}
+        UNION ALL
+        SELECT o.workspace_id, -1 AS sign, o.is_completed, o.priority {changed}{touched}
+    """
+    return f"""
+    CREATE OR REPLACE FUNCTION workspace_task_stats_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {apply_delta(inserted)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {apply_delta(deleted)}
+        ELSE
+            {apply_delta(updated)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "workspace_task_stats",
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    op.execute(_stats_function(bump_version=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(_stats_function(bump_version=False))
+    op.drop_column("workspace_task_stats", "version")
@@ -0,0 +1,146 @@
+"""create partitioned tasks
+
+Revision ID: e7c3a1f5b9d2
+Revises: d4a8e2c6f0b7
+Create Date: 2026-10-19 01:00:00.000000
+
+First step of moving ``tasks`` to hash partitioning on workspace_id:
+creates the empty partitioned copy and a trigger that mirrors every
+write on ``tasks`` into it. Existing rows are copied afterwards with
+``python -m app.cli partition-tasks``; revision f2d8b4e6a0c3 then swaps
+the tables.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c3a1f5b9d2"
+down_revision: Union[str, Sequence[str], None] = "d4a8e2c6f0b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id",
+    "workspace_id",
+    "number",
+    "title",
+    "description",
+    "is_completed",
+    "priority",
+    "due_date",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+# Same indexes as on tasks, under a "_part" suffix until the swap. Built
+# on the partitioned parent, so every partition gets its own copy.
+INDEXES = {
+    "ix_tasks_is_completed": "(is_completed)",
+    "ix_tasks_user_id": "(user_id)",
+    "ix_tasks_workspace_created": "(workspace_id, created_at, id)",
+    "ix_tasks_workspace_completed_created": "(workspace_id, is_completed, created_at, id)",
+    "ix_tasks_workspace_priority_created": "(workspace_id, priority, created_at, id)",
+    "ix_tasks_workspace_due_date": "(workspace_id, due_date)",
+    "ix_tasks_workspace_open_due_date": "(workspace_id, due_date) WHERE is_completed = false",
+    "ix_tasks_workspace_open_priority_due": "(workspace_id, priority DESC, due_date) WHERE is_completed = false",
+    "ix_tasks_search_vector": "USING gin (search_vector)",
+}
+UNIQUE_INDEXES = {
+    "uq_tasks_workspace_number": "(workspace_id, number)",
+}
+
+_new_values = ", ".join(f"NEW.{name}" for name in COLUMNS)
+_assignments = ", ".join(f"{name} = NEW.{name}" for name in COLUMNS)
+
+# Row-level and AFTER, so NEW.number is already filled in. The copy
+# command locks the rows it reads (FOR SHARE), so an update either lands
+# before the copy reads the row or waits and is mirrored after it.
+MIRROR_FUNCTION = f"""
+CREATE FUNCTION tasks_partition_mirror() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO tasks_partitioned ({", ".join(COLUMNS)})
+        VALUES ({_new_values})
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE tasks_partitioned SET {_assignments}
+        WHERE id = OLD.id AND workspace_id = OLD.workspace_id;
+    ELSE
+        DELETE FROM tasks_partitioned WHERE id = OLD.id AND workspace_id = OLD.workspace_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    partitions = settings.TASK_PARTITIONS
+    # The primary key has to include the partition key.
+    op.execute(
+        """
+        CREATE TABLE tasks_partitioned (
+            id uuid NOT NULL DEFAULT gen_random_uuid(),
+            workspace_id uuid NOT NULL,
+            number bigint NOT NULL,
+            title varchar(200) NOT NULL,
+            description text,
+            is_completed boolean NOT NULL DEFAULT false,
+            priority smallint NOT NULL DEFAULT 2,
+            due_date timestamptz,
+            user_id uuid NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            search_vector tsvector,
+            CONSTRAINT tasks_partitioned_pkey PRIMARY KEY (id, workspace_id),
+            CONSTRAINT tasks_partitioned_workspace_id_fkey FOREIGN KEY (workspace_id)
+                REFERENCES workspaces (id) ON DELETE CASCADE,
+            CONSTRAINT tasks_partitioned_user_id_fkey FOREIGN KEY (user_id)
+                REFERENCES users (id) ON DELETE CASCADE,
+            CONSTRAINT ck_tasks_priority CHECK (priority BETWEEN 1 AND 3)
+        ) PARTITION BY HASH (workspace_id)
+        """
+    )
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE tasks_p{remainder} PARTITION OF tasks_partitioned "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+    # Same function as on tasks, so mirrored and copied rows get their
+    # vector computed here rather than copied.
+    op.execute(
+        """
+        CREATE TRIGGER tasks_search_vector_update BEFORE INSERT OR UPDATE OF title, description
+        ON tasks_partitioned FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update()
+        """
+    )
+    # Built while the table is empty: adding them after the copy would
+    # lock every partition, and through the mirror trigger, tasks itself.
+    for name, definition in INDEXES.items():
+        op.execute(f"CREATE INDEX {name}_part ON tasks_partitioned {definition}")
+    for name, definition in UNIQUE_INDEXES.items():
+        op.execute(f"CREATE UNIQUE INDEX {name}_part ON tasks_partitioned {definition}")
+
+    op.execute(MIRROR_FUNCTION)
+    op.execute(
+        """
+        CREATE TRIGGER tasks_partition_mirror AFTER INSERT OR UPDATE OR DELETE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_partition_mirror()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER tasks_partition_mirror ON tasks")
+    op.execute("DROP FUNCTION tasks_partition_mirror()")
+    op.execute("DROP TABLE tasks_partitioned")
@@ -0,0 +1,127 @@
+"""create task changes
+
+Revision ID: f1a3c6e8b2d4
+Revises: e2b9d4c7a6f1
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a3c6e8b2d4"
+down_revision: Union[str, Sequence[str], None] = "e2b9d4c7a6f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _record(source: str, deleted: bool, where: str = "") -> str:
+    """Upsert one task_changes row per task in ``source`` (alias r)."""
+    return f"""
+        INSERT INTO task_changes AS c (workspace_id, task_id, version, deleted, changed_at)
+        SELECT r.workspace_id, r.id, s.version, {str(deleted).lower()}, now()
+        FROM {source}
+        JOIN workspace_task_stats s ON s.workspace_id = r.workspace_id
+        WHERE EXISTS (SELECT 1 FROM workspaces w WHERE w.id = r.workspace_id) {where}
+        ON CONFLICT (workspace_id, task_id) DO UPDATE SET
+            version = EXCLUDED.version,
+            deleted = EXCLUDED.deleted,
+            changed_at = EXCLUDED.changed_at;
+    """
+
+
+# Triggers on the same event fire in name order, so tasks_sync_log_* runs
+# after tasks_stats_*: the stats row is already bumped and locked by this
+# transaction, which also makes versions commit in order per workspace.
+CHANGES_FUNCTION = f"""
+CREATE FUNCTION task_changes_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        {_record("old_rows r", deleted=True)}
+    ELSE
+        {_record("new_rows r", deleted=False)}
+        IF TG_OP = 'UPDATE' THEN
+            -- A task moved to another workspace leaves a tombstone behind.
+            {_record("old_rows r JOIN new_rows n ON n.id = r.id", deleted=True,
+                     where="AND n.workspace_id <> r.workspace_id")}
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_changes",
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("task_id", sa.UUID(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("workspace_id", "task_id"),
+    )
+    op.create_index(
+        "ix_task_changes_workspace_version",
+        "task_changes",
+        ["workspace_id", "version", "task_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_changes_tombstones",
+        "task_changes",
+        ["changed_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted"),
+    )
+    op.add_column(
+        "workspace_task_stats",
+        sa.Column("changes_horizon", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+
+    op.execute(CHANGES_FUNCTION)
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER tasks_sync_log_{event.lower()} AFTER {event} ON tasks
+            REFERENCING {transition}
+            FOR EACH STATEMENT EXECUTE FUNCTION task_changes_apply()
+            """
+        )
+
+    op.execute(
+        """
+        INSERT INTO task_changes (workspace_id, task_id, version, deleted, changed_at)
+        SELECT t.workspace_id, t.id, s.version, false, t.updated_at
+        FROM tasks t
+        JOIN workspace_task_stats s ON s.workspace_id = t.workspace_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for event in ("delete", "update", "insert"):
+        op.execute(f"DROP TRIGGER tasks_sync_log_{event} ON tasks")
+    op.execute("DROP FUNCTION task_changes_apply()")
+    op.drop_column("workspace_task_stats", "changes_horizon")
+    op.drop_index("ix_task_changes_tombstones", table_name="task_changes")
+    op.drop_index("ix_task_changes_workspace_version", table_name="task_changes")
+    op.drop_table("task_changes")
@@ -0,0 +1,174 @@
+"""swap in partitioned tasks
+
+Revision ID: f2d8b4e6a0c3
+Revises: e7c3a1f5b9d2
+Create Date: 2026-10-19 02:00:00.000000
+
+Second step of partitioning ``tasks``: run after
+``python -m app.cli partition-tasks`` has copied every row. Only
+renames happen under the lock; the old table stays behind as
+``tasks_unpartitioned`` and can be dropped once the new one is trusted.
+Needs PostgreSQL 13+ for the BEFORE INSERT row trigger on a partitioned
+table.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2d8b4e6a0c3"
+down_revision: Union[str, Sequence[str], None] = "e7c3a1f5b9d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id",
+    "workspace_id",
+    "number",
+    "title",
+    "description",
+    "is_completed",
+    "priority",
+    "due_date",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+INDEXES = (
+    "ix_tasks_is_completed",
+    "ix_tasks_user_id",
+    "ix_tasks_workspace_created",
+    "ix_tasks_workspace_completed_created",
+    "ix_tasks_workspace_priority_created",
+    "ix_tasks_workspace_due_date",
+    "ix_tasks_workspace_open_due_date",
+    "ix_tasks_workspace_open_priority_due",
+    "uq_tasks_workspace_number",
+    "ix_tasks_search_vector",
+)
+
+TRANSITIONS = {
+    "INSERT": "REFERENCING NEW TABLE AS new_rows",
+    "UPDATE": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "REFERENCING OLD TABLE AS old_rows",
+}
+
+# Trigger name prefix -> function, one statement-level trigger per event.
+STATEMENT_TRIGGERS = {
+    "tasks_stats": "workspace_task_stats_apply",
+    "tasks_sync_log": "task_changes_apply",
+    "tasks_sync_notify": "task_changes_notify",
+}
+
+_new_values = ", ".join(f"NEW.{name}" for name in COLUMNS)
+_assignments = ", ".join(f"{name} = NEW.{name}" for name in COLUMNS)
+
+MIRROR_FUNCTION = f"""
+CREATE FUNCTION tasks_partition_mirror() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO tasks_partitioned ({", ".join(COLUMNS)})
+        VALUES ({_new_values})
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE tasks_partitioned SET {_assignments}
+        WHERE id = OLD.id AND workspace_id = OLD.workspace_id;
+    ELSE
+        DELETE FROM tasks_partitioned WHERE id = OLD.id AND workspace_id = OLD.workspace_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+MISSING_ROWS_SQL = sa.text(
+    """
+    SELECT count(*) FROM tasks t
+    WHERE NOT EXISTS (
+        SELECT 1 FROM tasks_partitioned p WHERE p.id = t.id AND p.workspace_id = t.workspace_id
+    )
+    """
+)
+
+
+def _drop_task_triggers(table: str) -> None:
+    for prefix in STATEMENT_TRIGGERS:
+        for event in TRANSITIONS:
+            op.execute(f"DROP TRIGGER {prefix}_{event.lower()} ON {table}")
+    op.execute(f"DROP TRIGGER tasks_number_assign ON {table}")
+
+
+def _create_task_triggers(table: str) -> None:
+    for prefix, function in STATEMENT_TRIGGERS.items():
+        for event, transition in TRANSITIONS.items():
+            op.execute(
+                f"""
+                CREATE TRIGGER {prefix}_{event.lower()} AFTER {event} ON {table}
+                {transition}
+                FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+                """
+            )
+    op.execute(
+        f"""
+        CREATE TRIGGER tasks_number_assign BEFORE INSERT ON {table}
+        FOR EACH ROW EXECUTE FUNCTION tasks_number_assign()
+        """
+    )
+
+
+def _rename_table(old: str, new: str, index_suffixes: tuple[str, str]) -> None:
+    """Rename a tasks table together with its key, foreign keys and indexes."""
+    old_suffix, new_suffix = index_suffixes
+    op.execute(f"ALTER TABLE {old} RENAME TO {new}")
+    op.execute(f"ALTER INDEX {old}_pkey RENAME TO {new}_pkey")
+    for column in ("workspace_id", "user_id"):
+        op.execute(f"ALTER TABLE {new} RENAME CONSTRAINT {old}_{column}_fkey TO {new}_{column}_fkey")
+    for name in INDEXES:
+        op.execute(f"ALTER INDEX {name}{old_suffix} RENAME TO {name}{new_suffix}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Checked before taking the lock: the mirror trigger keeps the copy
+    # complete from here on, so a miss means the copy never finished.
+    missing = op.get_bind().scalar(MISSING_ROWS_SQL)
+    if missing:
+        raise RuntimeError(
+            f"{missing} tasks are not in tasks_partitioned yet; run python -m app.cli partition-tasks"
+        )
+
+    op.execute("LOCK TABLE tasks, tasks_partitioned IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER tasks_partition_mirror ON tasks")
+    op.execute("DROP FUNCTION tasks_partition_mirror()")
+    _drop_task_triggers("tasks")
+    _rename_table("tasks", "tasks_unpartitioned", ("", "_old"))
+    _rename_table("tasks_partitioned", "tasks", ("_part", ""))
+    _create_task_triggers("tasks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("LOCK TABLE tasks, tasks_unpartitioned IN ACCESS EXCLUSIVE MODE")
+    _drop_task_triggers("tasks")
+    _rename_table("tasks", "tasks_partitioned", ("", "_part"))
+    _rename_table("tasks_unpartitioned", "tasks", ("_old", ""))
+
+    # The old table stopped receiving writes at the swap.
+    columns = ", ".join(COLUMNS)
+    op.execute("TRUNCATE tasks")
+    op.execute(f"INSERT INTO tasks ({columns}) SELECT {columns} FROM tasks_partitioned")
+
+    _create_task_triggers("tasks")
+    op.execute(MIRROR_FUNCTION)
+    op.execute(
+        """
+        CREATE TRIGGER tasks_partition_mirror AFTER INSERT OR UPDATE OR DELETE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_partition_mirror()
+        """
+    )
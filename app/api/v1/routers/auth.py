@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user
+from app.core.dependencies import CurrentUser, get_current_user
+from app.core.rate_limit import login_rate_limiter
 from app.db.session import get_async_session
-from app.models.user import User
 from app.schemas.user import (
     AccessTokenResponse,
     RefreshTokenRequest,
@@ -29,8 +29,14 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_s
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_session)):
-    return await login_user(db, user_data)
+async def login(
+    user_data: UserLogin,
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+):
+    ip_address = request.client.host if request.client else None
+    await login_rate_limiter.check(user_data.email, ip_address)
+    return await login_user(db, user_data, ip_address=ip_address)
 
 
 @router.post("/refresh", response_model=AccessTokenResponse)
@@ -48,7 +54,7 @@ async def logout(
 
 @router.post("/logout-all")
 async def logout_all(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
 ):
     return await logout_all_sessions(db, current_user.id)
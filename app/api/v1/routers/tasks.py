@@ -0,0 +1,370 @@
+import asyncio
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import (
+    CurrentUser,
+    authenticate_token,
+    check_workspace_role,
+    get_current_user,
+    require_workspace_role,
+)
+from app.core.etag import etag_matches, workspace_etag
+from app.db.session import async_session, get_async_session
+from app.repositories.task import TaskFilters
+from app.schemas.task import (
+    TaskBatchComplete,
+    TaskBatchResult,
+    TaskChangesPage,
+    TaskImportReport,
+    TaskPage,
+    TaskPriority,
+    TaskResponse,
+    TaskSearchPage,
+    WorkspaceTaskStatsResponse,
+)
+from app.services.task import (
+    batch_complete_tasks,
+    batch_create_tasks,
+    batch_update_tasks,
+    get_task_by_key,
+    get_workspace_task,
+    list_archived_workspace_tasks,
+    list_workspace_changes,
+    list_urgent_tasks,
+    list_workspace_tasks,
+    resolve_workspace_key,
+    restore_workspace_task,
+    search_workspace_tasks,
+)
+from app.services.task_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_filename,
+    stream_task_export,
+)
+from app.services.task_events import stream_workspace_events
+from app.services.task_import import ImportFormat, import_tasks
+from app.services.task_stats import get_workspace_stats, get_workspace_version
+
+router = APIRouter(prefix="/workspaces", tags=["Tasks"])
+# Tasks addressed by their human-readable key, e.g. /tasks/ABC-123.
+keys_router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+# Every HTTP route here is scoped to a workspace its caller must belong to.
+require_member = require_workspace_role()
+
+
+async def _not_modified(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    request: Request,
+    response: Response,
+) -> Response | None:
+    """Return a 304 if the client's ETag is current, else tag the response.
+
+    The version is read before the tasks, so a write that lands while they
+    are loaded can only make the tag older than the body, never newer: the
+    next poll sees a new version and refetches.
+    """
+    etag = workspace_etag(workspace_id, await get_workspace_version(db, workspace_id))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+@router.get(
+    "/{workspace_id}/tasks",
+    response_model=TaskPage,
+    dependencies=[Depends(require_member)],
+)
+async def list_tasks(
+    workspace_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    is_completed: bool | None = None,
+    priority: TaskPriority | None = None,
+    due_before: datetime | None = None,
+    due_after: datetime | None = None,
+    db: AsyncSession = Depends(get_async_session),
+):
+    if not_modified := await _not_modified(db, workspace_id, request, response):
+        return not_modified
+    filters = TaskFilters(
+        is_completed=is_completed,
+        priority=priority,
+        due_before=due_before,
+        due_after=due_after,
+    )
+    return await list_workspace_tasks(
+        db, workspace_id, limit=limit, cursor=cursor, filters=filters
+    )
+
+
+@router.get(
+    "/{workspace_id}/tasks/urgent",
+    response_model=list[TaskResponse],
+    dependencies=[Depends(require_member)],
+)
+async def urgent_tasks(
+    workspace_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Open tasks, highest priority first, then earliest due date."""
+    if not_modified := await _not_modified(db, workspace_id, request, response):
+        return not_modified
+    return await list_urgent_tasks(db, workspace_id, limit=limit)
+
+
+@router.post(
+    "/{workspace_id}/tasks/batch",
+    response_model=TaskBatchResult,
+    dependencies=[Depends(require_member)],
+)
+async def create_tasks_batch(
+    workspace_id: uuid.UUID,
+    items: list[Any] = Body(description="List of TaskCreate payloads."),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await batch_create_tasks(db, workspace_id, current_user.id, items)
+
+
+@router.patch(
+    "/{workspace_id}/tasks/batch",
+    response_model=TaskBatchResult,
+    dependencies=[Depends(require_member)],
+)
+async def update_tasks_batch(
+    workspace_id: uuid.UUID,
+    items: list[Any] = Body(description="List of TaskUpdate payloads with the task id."),
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await batch_update_tasks(db, workspace_id, items)
+
+
+@router.post(
+    "/{workspace_id}/tasks/batch/complete",
+    response_model=TaskBatchResult,
+    dependencies=[Depends(require_member)],
+)
+async def complete_tasks_batch(
+    workspace_id: uuid.UUID,
+    payload: TaskBatchComplete,
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await batch_complete_tasks(db, workspace_id, payload.ids)
+
+
+@router.get("/{workspace_id}/tasks/export", dependencies=[Depends(require_member)])
+async def export_tasks(
+    workspace_id: uuid.UUID,
+    format: ExportFormat = "ndjson",
+    gzip: bool = False,
+):
+    filename = export_filename(workspace_id, format, gzip)
+    return StreamingResponse(
+        stream_task_export(workspace_id, format, compress=gzip),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/{workspace_id}/tasks/import",
+    response_model=TaskImportReport,
+    dependencies=[Depends(require_member)],
+)
+async def import_tasks_file(
+    workspace_id: uuid.UUID,
+    request: Request,
+    format: ImportFormat = "ndjson",
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Load a CSV (with header) or NDJSON request body of TaskCreate records."""
+    report = await import_tasks(db, request.stream(), format, workspace_id, current_user.id)
+    return {
+        **asdict(report),
+        "rows_per_second": report.rows_per_second,
+    }
+
+
+@router.get(
+    "/{workspace_id}/tasks/search",
+    response_model=TaskSearchPage,
+    dependencies=[Depends(require_member)],
+)
+async def search_tasks(
+    workspace_id: uuid.UUID,
+    q: str = Query(min_length=1, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await search_workspace_tasks(db, workspace_id, q, limit=limit, cursor=cursor)
+
+
+@router.get(
+    "/{workspace_id}/tasks/stats",
+    response_model=WorkspaceTaskStatsResponse,
+    dependencies=[Depends(require_member)],
+)
+async def workspace_task_stats(
+    workspace_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await get_workspace_stats(db, workspace_id)
+
+
+@router.get(
+    "/{workspace_id}/tasks/changes",
+    response_model=TaskChangesPage,
+    dependencies=[Depends(require_member)],
+)
+async def task_changes(
+    workspace_id: uuid.UUID,
+    since: str | None = None,
+    limit: int = Query(default=500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Tasks created, updated or deleted after the ``since`` cursor."""
+    return await list_workspace_changes(db, workspace_id, limit=limit, since=since)
+
+
+@router.get(
+    "/{workspace_id}/tasks/archive",
+    response_model=TaskPage,
+    dependencies=[Depends(require_member)],
+)
+async def list_archived_tasks(
+    workspace_id: uuid.UUID,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Task history: completed tasks moved to the archive, newest first."""
+    return await list_archived_workspace_tasks(db, workspace_id, limit=limit, cursor=cursor)
+
+
+@router.get("/{workspace_id}/tasks/events", dependencies=[Depends(require_member)])
+async def task_events_sse(
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Server-sent events: one ``data:`` line per change notification."""
+    # The stream can stay open for hours; don't keep a pooled connection.
+    await db.close()
+
+    async def body():
+        async for event in stream_workspace_events(workspace_id, current_user.id):
+            yield f"data: {event}\n\n"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{workspace_id}/tasks/events/ws")
+async def task_events_ws(websocket: WebSocket, workspace_id: uuid.UUID, token: str):
+    """WebSocket variant; browsers can't set headers, so the token is a query parameter."""
+    try:
+        async with async_session() as db:
+            user = await authenticate_token(token, db)
+            await check_workspace_role(db, workspace_id, user.id)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    async def forward() -> None:
+        async for event in stream_workspace_events(workspace_id, user.id):
+            await websocket.send_text(event)
+
+    async def drain() -> None:
+        while True:
+            await websocket.receive_text()
+
+    sender = asyncio.create_task(forward())
+    receiver = asyncio.create_task(drain())
+    done, pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    # A failure on either side means the client is gone. The event stream
+    # only ends by itself once membership is revoked.
+    failed = [task for task in done if task.exception() is not None]
+    if sender in done and not failed:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+
+
+@router.get(
+    "/{workspace_id}/tasks/{task_id}",
+    response_model=TaskResponse,
+    dependencies=[Depends(require_member)],
+)
+async def get_task(
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_session),
+):
+    if not_modified := await _not_modified(db, workspace_id, request, response):
+        return not_modified
+    return await get_workspace_task(db, workspace_id, task_id)
+
+
+@router.post(
+    "/{workspace_id}/tasks/{task_id}/restore",
+    response_model=TaskResponse,
+    dependencies=[Depends(require_member)],
+)
+async def restore_task(
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Move an archived task back to the active tasks."""
+    return await restore_workspace_task(db, workspace_id, task_id)
+
+
+@keys_router.get("/{task_key}", response_model=TaskResponse)
+async def task_by_key(
+    task_key: str,
+    request: Request,
+    response: Response,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """A task by its key: the workspace key, a dash and the task number."""
+    workspace_id, number = await resolve_workspace_key(db, task_key, current_user.id)
+    if not_modified := await _not_modified(db, workspace_id, request, response):
+        return not_modified
+    return await get_task_by_key(db, workspace_id, number)
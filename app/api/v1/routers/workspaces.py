@@ -0,0 +1,36 @@
+import uuid
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import CurrentUser, get_current_user, require_workspace_role
+from app.db.session import get_async_session
+from app.models.workspacemember import WorkspaceRole
+from app.schemas.workspace import WorkspaceDeletionResponse
+from app.services.workspace_deletion import get_workspace_deletion, request_workspace_deletion
+
+router = APIRouter(prefix="/workspaces", tags=["Workspaces"])
+
+
+@router.delete(
+    "/{workspace_id}",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=WorkspaceDeletionResponse,
+    dependencies=[Depends(require_workspace_role(WorkspaceRole.OWNER))],
+)
+async def delete_workspace(
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Hide the workspace now; its tasks and members are removed in the background."""
+    return await request_workspace_deletion(db, workspace_id, current_user.id)
+
+
+@router.get("/{workspace_id}/deletion", response_model=WorkspaceDeletionResponse)
+async def workspace_deletion_progress(
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    return await get_workspace_deletion(db, workspace_id, current_user.id)
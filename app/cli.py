@@ -0,0 +1,219 @@
+"""Maintenance commands.
+
+    python -m app.cli <command> [options]
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from app.db.session import engine
+
+
+async def _purge_refresh_tokens(args: argparse.Namespace) -> None:
+    from app.services.token_janitor import purge_refresh_tokens
+
+    report = await purge_refresh_tokens(batch_size=args.batch_size, pause_seconds=args.pause)
+    print(json.dumps({**asdict(report), "total_deleted": report.total_deleted}))
+
+
+async def _calibrate_argon2(args: argparse.Namespace) -> None:
+    from app.core.password_calibration import calibrate_argon2, write_env
+
+    calibration = calibrate_argon2(
+        target_ms=args.target_ms,
+        memory_cost=args.memory_kib,
+        parallelism=args.parallelism,
+        samples=args.samples,
+    )
+    print(json.dumps(asdict(calibration)))
+    if args.env_file:
+        write_env(Path(args.env_file), calibration.as_env())
+        print(f"written to {args.env_file}")
+
+
+async def _import_tasks(args: argparse.Namespace) -> None:
+    import uuid
+
+    from app.db.session import async_session
+    from app.services.task_import import import_tasks
+
+    path = Path(args.file)
+    fmt = args.format or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+
+    async def read_file():
+        with path.open("rb") as source:
+            while data := source.read(1 << 20):
+                yield data
+
+    reject_file = open(args.reject_file, "w", encoding="utf-8") if args.reject_file else None
+    try:
+        def write_reject(entry: dict) -> None:
+            reject_file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+        async with async_session() as db:
+            report = await import_tasks(
+                db,
+                read_file(),
+                fmt,
+                workspace_id=uuid.UUID(args.workspace_id),
+                user_id=uuid.UUID(args.user_id),
+                reject_sink=write_reject if reject_file else None,
+                max_kept_rejects=0,
+                chunk_size=args.chunk_size,
+            )
+    finally:
+        if reject_file:
+            reject_file.close()
+
+    summary = asdict(report)
+    summary.pop("rejects")
+    print(json.dumps({**summary, "rows_per_second": report.rows_per_second}))
+
+
+async def _reconcile_task_stats(args: argparse.Namespace) -> None:
+    import uuid
+
+    from app.services.task_stats import reconcile_task_stats
+
+    report = await reconcile_task_stats(
+        fix=args.fix,
+        workspace_id=uuid.UUID(args.workspace_id) if args.workspace_id else None,
+    )
+    print(json.dumps(asdict(report)))
+
+
+async def _purge_task_tombstones(args: argparse.Namespace) -> None:
+    from app.services.task_changes import purge_task_tombstones
+
+    report = await purge_task_tombstones(retention_hours=args.retention_hours, batch_size=args.batch_size)
+    print(json.dumps(asdict(report)))
+
+
+async def _delete_workspaces(args: argparse.Namespace) -> None:
+    from app.services.workspace_deletion import delete_pending_workspaces
+
+    report = await delete_pending_workspaces(batch_size=args.batch_size, pause_seconds=args.pause)
+    print(json.dumps(asdict(report)))
+
+
+async def _partition_tasks(args: argparse.Namespace) -> None:
+    import uuid
+
+    from app.services.task_partitioning import copy_tasks_to_partitions
+
+    report = await copy_tasks_to_partitions(
+        batch_size=args.batch_size,
+        pause_seconds=args.pause,
+        after=uuid.UUID(args.after) if args.after else None,
+    )
+    print(json.dumps(asdict(report), default=str))
+
+
+async def _archive_tasks(args: argparse.Namespace) -> None:
+    from app.services.task_archive import archive_completed_tasks
+
+    report = await archive_completed_tasks(
+        older_than_days=args.older_than_days,
+        batch_size=args.batch_size,
+        pause_seconds=args.pause,
+    )
+    print(json.dumps(asdict(report)))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    purge = commands.add_parser(
+        "purge-refresh-tokens",
+        help="delete expired and revoked refresh tokens in batches",
+    )
+    purge.add_argument("--batch-size", type=int, default=None)
+    purge.add_argument("--pause", type=float, default=None, help="seconds between batches")
+    purge.set_defaults(handler=_purge_refresh_tokens)
+
+    calibrate = commands.add_parser(
+        "calibrate-argon2",
+        help="pick argon2 parameters that hit a target verification time on this host",
+    )
+    calibrate.add_argument("--target-ms", type=float, default=250.0)
+    calibrate.add_argument("--memory-kib", type=int, default=65536)
+    calibrate.add_argument("--parallelism", type=int, default=None)
+    calibrate.add_argument("--samples", type=int, default=5)
+    calibrate.add_argument("--env-file", default=None, help="write ARGON2_* settings to this file")
+    calibrate.set_defaults(handler=_calibrate_argon2)
+
+    load = commands.add_parser(
+        "import-tasks",
+        help="bulk-load tasks from a CSV or NDJSON file with COPY",
+    )
+    load.add_argument("file")
+    load.add_argument("--workspace-id", required=True)
+    load.add_argument("--user-id", required=True, help="author recorded on imported tasks")
+    load.add_argument("--format", choices=["csv", "ndjson"], default=None, help="default: from file extension")
+    load.add_argument("--reject-file", default=None, help="write rejected records here as NDJSON")
+    load.add_argument("--chunk-size", type=int, default=5000)
+    load.set_defaults(handler=_import_tasks)
+
+    reconcile = commands.add_parser(
+        "reconcile-task-stats",
+        help="compare per-workspace task counters with a full recount",
+    )
+    reconcile.add_argument("--fix", action="store_true", help="rewrite drifted counters")
+    reconcile.add_argument("--workspace-id", default=None, help="check a single workspace")
+    reconcile.set_defaults(handler=_reconcile_task_stats)
+
+    tombstones = commands.add_parser(
+        "purge-task-tombstones",
+        help="drop old deletion records from the task change log",
+    )
+    tombstones.add_argument("--retention-hours", type=int, default=None)
+    tombstones.add_argument("--batch-size", type=int, default=None)
+    tombstones.set_defaults(handler=_purge_task_tombstones)
+
+    deleter = commands.add_parser(
+        "delete-workspaces",
+        help="finish pending workspace deletions in batches",
+    )
+    deleter.add_argument("--batch-size", type=int, default=None)
+    deleter.add_argument("--pause", type=float, default=None, help="seconds between batches")
+    deleter.set_defaults(handler=_delete_workspaces)
+
+    partition = commands.add_parser(
+        "partition-tasks",
+        help="copy existing tasks into the hash-partitioned table in batches",
+    )
+    partition.add_argument("--batch-size", type=int, default=None)
+    partition.add_argument("--pause", type=float, default=None, help="seconds between batches")
+    partition.add_argument("--after", default=None, help="resume after this task id")
+    partition.set_defaults(handler=_partition_tasks)
+
+    archive = commands.add_parser(
+        "archive-tasks",
+        help="move old completed tasks to tasks_archive and report table and index sizes",
+    )
+    archive.add_argument("--older-than-days", type=int, default=None)
+    archive.add_argument("--batch-size", type=int, default=None)
+    archive.add_argument("--pause", type=float, default=None, help="seconds between batches")
+    archive.set_defaults(handler=_archive_tasks)
+
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        await args.handler(args)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
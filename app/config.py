@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -9,6 +11,66 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     APP_NAME: str = "Task Tracker"
     DEBUG: bool = False
+    CACHE_STATS_ENABLED: bool = False
+
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    ARGON2_TIME_COST: int | None = None
+    ARGON2_MEMORY_COST: int | None = None
+    ARGON2_PARALLELISM: int | None = None
+
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+
+    TOKEN_CACHE_SIZE: int = 50_000
+    TOKEN_CACHE_TTL_SECONDS: float = 300.0
+
+    MEMBERSHIP_CACHE_SIZE: int = 50_000
+    MEMBERSHIP_CACHE_TTL_SECONDS: float = 30.0
+
+    TOKEN_JANITOR_ENABLED: bool = True
+    TOKEN_JANITOR_INTERVAL_SECONDS: float = 3600.0
+    TOKEN_JANITOR_BATCH_SIZE: int = 1000
+    TOKEN_JANITOR_BATCH_PAUSE_SECONDS: float = 0.1
+    TOKEN_JANITOR_REVOKED_RETENTION_HOURS: int = 24
+
+    REVOKED_TOKEN_SET_SIZE: int = 200_000
+
+    REFRESH_TOKEN_WRITE_BEHIND: bool = False
+    REFRESH_TOKEN_FLUSH_INTERVAL_MS: float = 5.0
+    REFRESH_TOKEN_FLUSH_MAX_ROWS: int = 500
+
+    TASK_BATCH_MAX_ITEMS: int = 10_000
+
+    TASK_PARTITIONS: int = 16
+    TASK_PARTITION_COPY_BATCH_SIZE: int = 10_000
+    TASK_PARTITION_COPY_PAUSE_SECONDS: float = 0.05
+
+    TASK_ARCHIVE_ENABLED: bool = False
+    TASK_ARCHIVE_AFTER_DAYS: int = 180
+    TASK_ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+    TASK_ARCHIVE_BATCH_SIZE: int = 5000
+    TASK_ARCHIVE_BATCH_PAUSE_SECONDS: float = 0.05
+
+    TASK_TOMBSTONE_RETENTION_HOURS: int = 720
+    TASK_TOMBSTONE_PURGE_BATCH_SIZE: int = 5000
+
+    TASK_EVENTS_ENABLED: bool = True
+    TASK_EVENTS_QUEUE_SIZE: int = 64
+    TASK_EVENTS_HEARTBEAT_SECONDS: float = 15.0
+
+    WORKSPACE_DELETION_ENABLED: bool = True
+    WORKSPACE_DELETION_INTERVAL_SECONDS: float = 5.0
+    WORKSPACE_DELETION_BATCH_SIZE: int = 5000
+    WORKSPACE_DELETION_BATCH_PAUSE_SECONDS: float = 0.05
+
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_EMAIL_BURST: int = 5
+    LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE: float = 5.0
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 60.0
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100_000
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,23 +1,74 @@
 import uuid
+from dataclasses import dataclass
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.core.security import decode_token
 from app.db.session import get_async_session
 from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspacemember import WorkspaceMember, WorkspaceRole
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_session),
-) -> User:
-    token = credentials.credentials
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """Authenticated principal: only the fields request handlers rely on."""
+
+    id: uuid.UUID
+    email: str
+    is_active: bool
+
+
+principal_cache: TTLCache[uuid.UUID, CurrentUser] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+_PRINCIPALS_TO_INVALIDATE = "principals_to_invalidate"
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    """Drop a cached principal, e.g. after bulk UPDATEs that bypass the ORM."""
+    principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session: Session, flush_context) -> None:
+    changed = {
+        obj.id
+        for obj in session.dirty
+        if isinstance(obj, User) and inspect(obj).attrs.is_active.history.has_changes()
+    }
+    changed.update(obj.id for obj in session.deleted if isinstance(obj, User))
+    if changed:
+        session.info.setdefault(_PRINCIPALS_TO_INVALIDATE, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session: Session) -> None:
+    for user_id in session.info.pop(_PRINCIPALS_TO_INVALIDATE, ()):
+        invalidate_principal(user_id)
+
 
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changed_principals(session: Session, previous_transaction) -> None:
+    session.info.pop(_PRINCIPALS_TO_INVALIDATE, None)
+
+
+async def authenticate_token(token: str, db: AsyncSession) -> CurrentUser:
+    """Resolve an access token to its active user; raises HTTPException otherwise.
+
+    Shared by the bearer dependency below and by WebSocket endpoints, which
+    cannot send an Authorization header from browsers.
+    """
     payload = decode_token(token)
     if payload is None:
         raise HTTPException(
@@ -46,10 +97,15 @@ async def get_current_user(
             detail="Некорректный идентификатор пользователя в токене",
         )
 
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = principal_cache.get(user_id)
+    if user is None:
+        result = await db.execute(
+            select(User.id, User.email, User.is_active).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is not None:
+            user = CurrentUser(id=row.id, email=row.email, is_active=row.is_active)
+            principal_cache.set(user_id, user)
 
     if user is None:
         raise HTTPException(
@@ -64,3 +120,124 @@ async def get_current_user(
         )
 
     return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_session),
+) -> CurrentUser:
+    return await authenticate_token(credentials.credentials, db)
+
+
+ROLE_RANK = {WorkspaceRole.MEMBER: 0, WorkspaceRole.ADMIN: 1, WorkspaceRole.OWNER: 2}
+
+# (workspace_id, user_id) -> role. Only memberships are cached: a refused
+# lookup always goes to the database, so a user added to a workspace gets
+# in immediately.
+membership_cache: TTLCache[tuple[uuid.UUID, uuid.UUID], WorkspaceRole] = TTLCache(
+    maxsize=settings.MEMBERSHIP_CACHE_SIZE,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+
+_MEMBERSHIPS_TO_INVALIDATE = "memberships_to_invalidate"
+
+
+def invalidate_membership(workspace_id: uuid.UUID, user_id: uuid.UUID | None = None) -> None:
+    """Drop cached roles after changes that bypass the ORM.
+
+    Without user_id every cached member of the workspace is dropped, e.g.
+    when the workspace itself is deleted.
+    """
+    if user_id is None:
+        membership_cache.invalidate_where(lambda key: key[0] == workspace_id)
+    else:
+        membership_cache.invalidate((workspace_id, user_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_memberships(session: Session, flush_context) -> None:
+    changed = set()
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, WorkspaceMember):
+            continue
+        attrs = inspect(obj).attrs
+        old_workspace = attrs.workspace_id.history.deleted or [obj.workspace_id]
+        old_user = attrs.user_id.history.deleted or [obj.user_id]
+        changed.add((obj.workspace_id, obj.user_id))
+        changed.add((old_workspace[0], old_user[0]))
+    if changed:
+        session.info.setdefault(_MEMBERSHIPS_TO_INVALIDATE, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_memberships(session: Session) -> None:
+    for workspace_id, user_id in session.info.pop(_MEMBERSHIPS_TO_INVALIDATE, ()):
+        invalidate_membership(workspace_id, user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changed_memberships(session: Session, previous_transaction) -> None:
+    session.info.pop(_MEMBERSHIPS_TO_INVALIDATE, None)
+
+
+async def get_workspace_role(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> WorkspaceRole | None:
+    """The user's role in the workspace, or None if not a member.
+
+    Workspaces being deleted have no members as far as reads are concerned.
+
+    Cached per process for MEMBERSHIP_CACHE_TTL_SECONDS. Changes made
+    through the ORM in this process invalidate the entry on commit; other
+    workers see them once the TTL expires.
+    """
+    key = (workspace_id, user_id)
+    role = membership_cache.get(key)
+    if role is None:
+        role = await db.scalar(
+            select(WorkspaceMember.role)
+            .join(Workspace, Workspace.id == WorkspaceMember.workspace_id)
+            .where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == user_id,
+                Workspace.deleting_at.is_(None),
+            )
+        )
+        if role is not None:
+            membership_cache.set(key, role)
+    return role
+
+
+async def check_workspace_role(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    minimum: WorkspaceRole = WorkspaceRole.MEMBER,
+) -> WorkspaceRole:
+    role = await get_workspace_role(db, workspace_id, user_id)
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workspace not found",
+        )
+    if ROLE_RANK[role] < ROLE_RANK[minimum]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Недостаточно прав в рабочем пространстве",
+        )
+    return role
+
+
+def require_workspace_role(minimum: WorkspaceRole = WorkspaceRole.MEMBER):
+    """Dependency for routes with a ``workspace_id`` path parameter."""
+
+    async def dependency(
+        workspace_id: uuid.UUID,
+        current_user: CurrentUser = Depends(get_current_user),
+        db: AsyncSession = Depends(get_async_session),
+    ) -> WorkspaceRole:
+        return await check_workspace_role(db, workspace_id, current_user.id, minimum)
+
+    return dependency
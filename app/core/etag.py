@@ -0,0 +1,14 @@
+import uuid
+
+
+def workspace_etag(workspace_id: uuid.UUID, version: int) -> str:
+    """Strong ETag for reads derived from a workspace's task version."""
+    return f'"{workspace_id.hex}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check (RFC 9110 weak comparison: W/ prefixes are ignored)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
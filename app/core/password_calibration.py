@@ -0,0 +1,76 @@
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.security import build_pwd_context
+
+CALIBRATION_PASSWORD = "calibration-password"
+
+
+@dataclass
+class Argon2Calibration:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    verify_ms: float
+
+    def as_env(self) -> dict[str, str]:
+        return {
+            "ARGON2_TIME_COST": str(self.time_cost),
+            "ARGON2_MEMORY_COST": str(self.memory_cost),
+            "ARGON2_PARALLELISM": str(self.parallelism),
+        }
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """Median wall time of one argon2 verification with the given parameters."""
+    context = build_pwd_context(time_cost, memory_cost, parallelism)
+    hashed = context.hash(CALIBRATION_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(CALIBRATION_PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_argon2(
+    target_ms: float,
+    memory_cost: int = 65536,
+    parallelism: int | None = None,
+    max_time_cost: int = 20,
+    samples: int = 5,
+) -> Argon2Calibration:
+    """Find the time_cost whose verification time is closest to target_ms.
+
+    Memory (KiB) and parallelism are fixed first: memory cost is what makes
+    argon2 expensive for attackers, and parallelism defaults to the number
+    of cores (capped at 4) so one verification doesn't starve other workers.
+    time_cost is then raised until verification reaches the target.
+    """
+    if parallelism is None:
+        parallelism = min(os.cpu_count() or 1, 4)
+
+    best: Argon2Calibration | None = None
+    for time_cost in range(1, max_time_cost + 1):
+        elapsed = measure_verify_ms(time_cost, memory_cost, parallelism, samples)
+        candidate = Argon2Calibration(time_cost, memory_cost, parallelism, round(elapsed, 2))
+        if best is None or abs(elapsed - target_ms) < abs(best.verify_ms - target_ms):
+            best = candidate
+        if elapsed >= target_ms:
+            break
+    return best
+
+
+def write_env(path: Path, values: dict[str, str]) -> None:
+    """Set KEY=value lines in an env file, keeping every other line."""
+    lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+    pending = dict(values)
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in pending:
+            lines[index] = f"{key}={pending.pop(key)}"
+    lines.extend(f"{key}={value}" for key, value in pending.items())
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
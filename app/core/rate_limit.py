@@ -0,0 +1,86 @@
+import abc
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+
+class RateLimitBackend(abc.ABC):
+    """Storage for token buckets.
+
+    The in-memory backend is per process; a shared implementation (e.g.
+    Redis) only has to provide ``consume`` to make limits global.
+    """
+
+    @abc.abstractmethod
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """Take one token from the bucket for key.
+
+        Returns 0 if the token was taken, otherwise the number of seconds
+        until one becomes available.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class LoginRateLimiter:
+    """Token buckets per client IP and per email, checked before any hashing."""
+
+    def __init__(self, backend: RateLimitBackend) -> None:
+        self.backend = backend
+
+    async def retry_after(self, email: str, ip_address: str | None) -> float:
+        if ip_address:
+            wait = await self.backend.consume(
+                f"login:ip:{ip_address}",
+                settings.LOGIN_RATE_LIMIT_IP_BURST,
+                settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE / 60,
+            )
+            if wait:
+                return wait
+
+        return await self.backend.consume(
+            f"login:email:{email.lower()}",
+            settings.LOGIN_RATE_LIMIT_EMAIL_BURST,
+            settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE / 60,
+        )
+
+    async def check(self, email: str, ip_address: str | None) -> None:
+        if not settings.LOGIN_RATE_LIMIT_ENABLED:
+            return
+        wait = await self.retry_after(email, ip_address)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Слишком много попыток входа, повторите позже",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+
+login_rate_limiter = LoginRateLimiter(
+    InMemoryRateLimitBackend(max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+)
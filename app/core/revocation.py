@@ -0,0 +1,89 @@
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.refresh_token import RefreshToken
+
+
+class RevokedTokenSet:
+    """Compact in-process set of revoked refresh token JTIs.
+
+    Membership is exact, so a hit means "revoked" and the request can be
+    rejected without touching the database. A miss only means "not known
+    to this process": the database stays the source of truth. Entries are
+    dropped once the token itself expires, since the JWT ``exp`` check
+    rejects it anyway.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._expiry: dict[bytes, float] = {}
+        self.hits = 0
+
+    @staticmethod
+    def _key(jti: str) -> bytes | None:
+        try:
+            return uuid.UUID(jti).bytes
+        except ValueError:
+            return None
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        key = self._key(jti)
+        if key is None:
+            return
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if len(self._expiry) >= self.maxsize:
+            self.prune()
+            if len(self._expiry) >= self.maxsize:
+                return
+        self._expiry[key] = expires_at.timestamp()
+
+    def is_revoked(self, jti: str) -> bool:
+        key = self._key(jti)
+        if key is None or key not in self._expiry:
+            return False
+        self.hits += 1
+        return True
+
+    def prune(self) -> int:
+        now = time.time()
+        expired = [key for key, expires_at in self._expiry.items() if expires_at <= now]
+        for key in expired:
+            del self._expiry[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        self._expiry.clear()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._expiry), "maxsize": self.maxsize, "hits": self.hits}
+
+
+revoked_tokens = RevokedTokenSet(maxsize=settings.REVOKED_TOKEN_SET_SIZE)
+
+
+async def load_revoked_tokens(db: AsyncSession) -> int:
+    """Fill the set with revoked, not yet expired tokens; called on startup."""
+    result = await db.stream(
+        select(RefreshToken.token_jti, RefreshToken.expires_at)
+        .where(
+            RefreshToken.revoked_at.is_not(None),
+            RefreshToken.expires_at > datetime.now(timezone.utc),
+        )
+        .order_by(RefreshToken.expires_at.desc())
+        .limit(settings.REVOKED_TOKEN_SET_SIZE)
+        .execution_options(yield_per=5000)
+    )
+    loaded = 0
+    async for jti, expires_at in result:
+        revoked_tokens.add(jti, expires_at)
+        loaded += 1
+    return loaded
@@ -1,13 +1,56 @@
+import asyncio
+import hashlib
+import time
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.core.cache import TTLCache
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+def build_pwd_context(
+    time_cost: int | None = None,
+    memory_cost: int | None = None,
+    parallelism: int | None = None,
+) -> CryptContext:
+    """Build the argon2 context; unset parameters keep the library defaults."""
+    params = {
+        "argon2__time_cost": time_cost,
+        "argon2__memory_cost": memory_cost,
+        "argon2__parallelism": parallelism,
+    }
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        **{key: value for key, value in params.items() if value is not None},
+    )
+
+
+pwd_context = build_pwd_context(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+T = TypeVar("T")
+
+_hash_executor: Executor | None = None
+_hash_slots: asyncio.Semaphore | None = None
+_hash_pending = 0
+
+token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+class PasswordHashQueueFull(RuntimeError):
+    """Raised when too many hashing jobs are already waiting for a worker."""
 
 
 def hash_password(password: str) -> str:
@@ -20,6 +63,80 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify password; also return a new hash if the stored one uses outdated parameters."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def get_hash_executor() -> Executor:
+    """Return the executor used for argon2 work, creating it on first use."""
+    global _hash_executor
+    if _hash_executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+            )
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Stop hashing workers; called from the application lifespan."""
+    global _hash_executor, _hash_slots
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True, cancel_futures=True)
+    _hash_executor = None
+    _hash_slots = None
+
+
+async def _run_hashing(func: Callable[..., T], *args: Any) -> T:
+    """Run func in the hashing executor with a bounded wait queue.
+
+    At most PASSWORD_HASH_WORKERS jobs are handed to the executor at once,
+    and at most PASSWORD_HASH_MAX_PENDING callers may wait for a slot.
+    """
+    global _hash_slots, _hash_pending
+    if _hash_slots is None:
+        _hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+
+    if _hash_slots.locked() and _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHashQueueFull("Password hashing queue is full")
+
+    _hash_pending += 1
+    try:
+        await _hash_slots.acquire()
+    finally:
+        _hash_pending -= 1
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_hash_executor(), func, *args)
+    finally:
+        _hash_slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash plain password without blocking the event loop."""
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify plain password against hash without blocking the event loop."""
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, str | None]:
+    """Async counterpart of verify_and_update_password."""
+    return await _run_hashing(verify_and_update_password, plain_password, hashed_password)
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: timedelta | None = None,
@@ -48,9 +165,30 @@ def create_refresh_token(
     return token, jti
 
 
-def decode_token(token: str) -> dict[str, Any] | None:
-    """Decode JWT token and return payload."""
-    try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except JWTError:
+def decode_token(token: str, token_type: str | None = None) -> dict[str, Any] | None:
+    """Decode JWT token and return payload.
+
+    Verified payloads are cached by token digest until the token's own
+    ``exp`` (or TOKEN_CACHE_TTL_SECONDS, whichever is sooner). When
+    token_type is given, tokens with a different ``type`` claim are
+    rejected.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+
+    if payload is None:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            token_cache.set(key, payload, ttl=exp - time.time())
+    elif payload["exp"] <= time.time():
+        token_cache.invalidate(key)
+        return None
+
+    if token_type is not None and payload.get("type") != token_type:
         return None
+    return dict(payload)
@@ -1,3 +1,5 @@
+import asyncpg
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from typing import AsyncGenerator
 from app.config import settings
@@ -11,3 +13,12 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+async def connect_listener() -> asyncpg.Connection:
+    """Open a raw asyncpg connection outside the pool, for LISTEN.
+
+    A listening connection is held for the life of the worker, so it must
+    not take one of the pooled connections that requests share.
+    """
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return await asyncpg.connect(url.render_as_string(hide_password=False))
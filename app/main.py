@@ -1,11 +1,75 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from app.api.v1.routers import auth
+from app.api.v1.routers import auth, tasks, workspaces
+from app.config import settings
+from app.core.dependencies import membership_cache, principal_cache
+from app.core.revocation import load_revoked_tokens, revoked_tokens
+from app.core.security import shutdown_hash_executor, token_cache
+from app.db.session import async_session
+from app.services.refresh_token_writer import refresh_token_writer
+from app.services.task_archive import run_task_archiver
+from app.services.task_events import task_event_hub
+from app.services.token_janitor import run_token_janitor
+from app.services.workspace_deletion import run_workspace_deleter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with async_session() as db:
+        await load_revoked_tokens(db)
+
+    if settings.REFRESH_TOKEN_WRITE_BEHIND:
+        refresh_token_writer.start()
+
+    if settings.TASK_EVENTS_ENABLED:
+        task_event_hub.start()
+
+    background: list[asyncio.Task] = []
+    if settings.TOKEN_JANITOR_ENABLED:
+        background.append(asyncio.create_task(run_token_janitor()))
+    if settings.WORKSPACE_DELETION_ENABLED:
+        background.append(asyncio.create_task(run_workspace_deleter()))
+    if settings.TASK_ARCHIVE_ENABLED:
+        background.append(asyncio.create_task(run_task_archiver()))
+
+    yield
 
-app = FastAPI()
+    for task in background:
+        task.cancel()
+    for task in background:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await task_event_hub.stop()
+    await refresh_token_writer.stop()
+    shutdown_hash_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth.router)
+app.include_router(tasks.router)
+app.include_router(tasks.keys_router)
+app.include_router(workspaces.router)
 
 @app.get("/")
 def start():
     return {"status": "ok"}
 
+
+def cache_stats():
+    return {
+        "principals": principal_cache.stats(),
+        "memberships": membership_cache.stats(),
+        "tokens": token_cache.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "task_events": task_event_hub.stats(),
+    }
+
+
+# Unauthenticated and exposes cache internals: for local profiling only.
+if settings.CACHE_STATS_ENABLED:
+    app.add_api_route("/stats/caches", cache_stats, methods=["GET"], include_in_schema=False)
+
@@ -3,6 +3,11 @@ from app.models.task import Task
 from app.models.workspace import Workspace
 from app.models.workspacemember import WorkspaceMember
 from app.models.refresh_token import RefreshToken
+from app.models.workspace_task_stats import WorkspaceTaskStats
+from app.models.task_change import TaskChange
+from app.models.workspace_task_counter import WorkspaceTaskCounter
+from app.models.workspace_deletion import WorkspaceDeletion
+from app.models.task_archive import TaskArchive
 
 __all__ = [
     "User",
@@ -10,4 +15,9 @@ __all__ = [
     "Workspace",
     "WorkspaceMember",
     "RefreshToken",
+    "WorkspaceTaskStats",
+    "TaskChange",
+    "WorkspaceTaskCounter",
+    "WorkspaceDeletion",
+    "TaskArchive",
 ]
\ No newline at end of file
@@ -57,4 +57,14 @@ class RefreshToken(Base):
 
     __table_args__ = (
         Index("ix_refresh_tokens_user_id_revoked", "user_id", "revoked_at"),
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_refresh_tokens_expires_at_active",
+            "expires_at",
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
     )
@@ -1,12 +1,52 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
+# Language-neutral text search configuration: titles are written in
+# several languages, so no stemming is applied.
+SEARCH_CONFIG = "simple"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+# Priority is stored as a smallint so that it sorts in urgency order and
+# takes two bytes per row and index entry; the API keeps the names.
+PRIORITY_CODES = {"low": 1, "medium": 2, "high": 3}
+PRIORITY_NAMES = {code: name for name, code in PRIORITY_CODES.items()}
+
+
+class PriorityType(TypeDecorator):
+    """Ordered priority enum: 'low'/'medium'/'high' in Python, 1/2/3 in the database."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else PRIORITY_CODES[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else PRIORITY_NAMES[value]
+
 
 class Task(Base):
     __tablename__ = "tasks"
@@ -16,10 +56,19 @@ class Task(Base):
         primary_key=True,
         server_default=text("gen_random_uuid()"),
     )
+    # Part of the primary key because tasks is hash-partitioned on it:
+    # PostgreSQL requires the partition key in every unique constraint.
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
-        index=True,
+        primary_key=True,
+    )
+    # Per-workspace sequence number: the 123 in "ABC-123". Filled in by
+    # reserve_task_numbers, or by the tasks_number_assign trigger when an
+    # insert leaves it out.
+    number: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=FetchedValue(),
         nullable=False,
     )
 
@@ -40,8 +89,8 @@ class Task(Base):
     )
 
     priority: Mapped[str] = mapped_column(
-        String(20),
-        server_default=text("'medium'"),
+        PriorityType(),
+        server_default=text(str(PRIORITY_CODES["medium"])),
         nullable=False,
     )
 
@@ -68,5 +117,61 @@ class Task(Base):
         onupdate=datetime.utcnow,
     )
 
+    # SEARCH_VECTOR_EXPRESSION over the row, kept up to date by the
+    # tasks_search_vector_update trigger; never written by the application.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        deferred=True,
+    )
+
+    __table_args__ = (
+        # Keyset pagination: (workspace_id, <filter>, created_at, id).
+        Index("ix_tasks_workspace_created", "workspace_id", "created_at", "id"),
+        Index(
+            "ix_tasks_workspace_completed_created",
+            "workspace_id",
+            "is_completed",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_workspace_priority_created",
+            "workspace_id",
+            "priority",
+            "created_at",
+            "id",
+        ),
+        Index("ix_tasks_workspace_due_date", "workspace_id", "due_date"),
+        Index(
+            "ix_tasks_workspace_open_due_date",
+            "workspace_id",
+            "due_date",
+            postgresql_where=text("is_completed = false"),
+        ),
+        # Open tasks by urgency: highest priority first, then earliest due date.
+        Index(
+            "ix_tasks_workspace_open_priority_due",
+            "workspace_id",
+            text("priority DESC"),
+            "due_date",
+            postgresql_where=text("is_completed = false"),
+        ),
+        Index("uq_tasks_workspace_number", "workspace_id", "number", unique=True),
+        # Archiver candidates, oldest first; small once the backlog is archived.
+        Index(
+            "ix_tasks_completed_updated",
+            "updated_at",
+            "id",
+            postgresql_where=text("is_completed = true"),
+        ),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        CheckConstraint("priority BETWEEN 1 AND 3", name="ck_tasks_priority"),
+        # Partitions tasks_p0 .. tasks_p{TASK_PARTITIONS - 1} are created by
+        # the migration; every index above exists on each of them.
+        {"postgresql_partition_by": "HASH (workspace_id)"},
+    )
+
     def __repr__(self) -> str:
         return f"Task(id={self.id}, title={self.title}, completed={self.is_completed})"
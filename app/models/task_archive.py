@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.task import PriorityType
+
+
+class TaskArchive(Base):
+    """Completed tasks moved out of ``tasks`` by the task archiver.
+
+    Same columns as ``tasks`` minus the search vector, and only the
+    indexes needed for reads by id, by number and the history listing,
+    so old tasks no longer weigh on the hot table and its indexes.
+    Restoring a task moves it back unchanged, number included.
+    """
+
+    __tablename__ = "tasks_archive"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    number: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    is_completed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    priority: Mapped[str] = mapped_column(PriorityType(), nullable=False)
+    due_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("now()"),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("uq_tasks_archive_workspace_number", "workspace_id", "number", unique=True),
+        # History listing, in the same (created_at, id) order as tasks.
+        Index("ix_tasks_archive_workspace_created", "workspace_id", "created_at", "id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"TaskArchive(id={self.id}, title={self.title}, archived_at={self.archived_at})"
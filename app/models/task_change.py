@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskChange(Base):
+    """Latest change of every task, stamped with the workspace version.
+
+    One row per task, upserted by triggers on ``tasks``, so the log is
+    compacted by construction; deletes leave a tombstone (``deleted``)
+    until the tombstone purge removes it and advances
+    ``workspace_task_stats.changes_horizon``.
+    """
+
+    __tablename__ = "task_changes"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # No foreign key: tombstones outlive their task.
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
+
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("now()"),
+    )
+
+    __table_args__ = (
+        Index("ix_task_changes_workspace_version", "workspace_id", "version", "task_id"),
+        Index(
+            "ix_task_changes_tombstones",
+            "changed_at",
+            postgresql_where=text("deleted"),
+        ),
+    )
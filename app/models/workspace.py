@@ -36,4 +36,10 @@ class Workspace(Base):
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-    )
\ No newline at end of file
+    )
+
+    # Set when deletion is requested: the workspace disappears from reads at
+    # once and the workspace deleter removes its rows in batches.
+    deleting_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
@@ -0,0 +1,53 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class WorkspaceDeletion(Base):
+    """Progress of a workspace deletion, advanced one batch at a time.
+
+    Every batch commits together with its counters, so a deleter that
+    crashes resumes where the last committed batch stopped. The row
+    outlives the workspace as a record of the deletion.
+    """
+
+    __tablename__ = "workspace_deletions"
+
+    # No foreign key: the workspace row is the last thing deleted.
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    requested_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    requested_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("now()"),
+    )
+
+    # Task count from workspace_task_stats when deletion was requested.
+    tasks_total: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    tasks_deleted: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    archived_deleted: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    changes_deleted: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    members_deleted: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    batches: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_workspace_deletions_pending",
+            "requested_at",
+            postgresql_where=text("finished_at IS NULL"),
+        ),
+    )
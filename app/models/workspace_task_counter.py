@@ -0,0 +1,26 @@
+import uuid
+
+from sqlalchemy import BigInteger, ForeignKey, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class WorkspaceTaskCounter(Base):
+    """Next task number of a workspace, for keys like ``ABC-123``.
+
+    Numbers are handed out in blocks by ``reserve_task_numbers`` with one
+    upsert ... RETURNING; rows inserted without a number get one from the
+    tasks_number_assign trigger. Created on first use.
+    """
+
+    __tablename__ = "workspace_task_counters"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    next_number: Mapped[int] = mapped_column(BigInteger, server_default=text("1"), nullable=False)
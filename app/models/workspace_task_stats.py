@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class WorkspaceTaskStats(Base):
+    """Per-workspace task counters kept current by triggers on ``tasks``.
+
+    Written only by the statement-level triggers created in migration
+    a7c4e2f9d1b6 and by the reconcile command; the application just reads.
+    """
+
+    __tablename__ = "workspace_task_stats"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    open_count: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    completed_count: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    open_low: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    open_medium: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    open_high: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+
+    # Bumped by every statement that touches the workspace's tasks, including
+    # edits that leave the counters alone; the source of task list ETags.
+    version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+    # Highest version among purged tombstones: sync cursors below it may
+    # have missed deletions.
+    changes_horizon: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("now()"),
+    )
@@ -0,0 +1,401 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    Boolean,
+    Select,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import SEARCH_CONFIG, Task
+from app.models.task_archive import TaskArchive
+from app.models.task_change import TaskChange
+from app.models.workspace import Workspace
+from app.models.workspace_task_counter import WorkspaceTaskCounter
+
+UPDATABLE_FIELDS = ("title", "description", "is_completed", "priority", "due_date")
+
+# Keeps each UPDATE well under the 32767 bind parameters asyncpg allows.
+UPDATE_CHUNK_SIZE = 1000
+
+# Columns a task keeps when it moves between tasks and tasks_archive.
+ARCHIVED_COLUMNS = (
+    "id",
+    "workspace_id",
+    "number",
+    "title",
+    "description",
+    "is_completed",
+    "priority",
+    "due_date",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+
+
+@dataclass(frozen=True)
+class TaskFilters:
+    is_completed: bool | None = None
+    priority: str | None = None
+    due_before: datetime | None = None
+    due_after: datetime | None = None
+
+
+@dataclass(frozen=True)
+class TaskKey:
+    """Position of a task in (created_at DESC, id DESC) order."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class SearchKey:
+    """Position of a hit in (rank DESC, id DESC) order."""
+
+    rank: float
+    id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class ChangeKey:
+    """Position in the change log, in (version, task_id) order."""
+
+    version: int
+    task_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    task: Task
+    rank: float
+    title_snippet: str
+    description_snippet: str | None
+
+
+def _apply_filters(query: Select, filters: TaskFilters) -> Select:
+    if filters.is_completed is not None:
+        query = query.where(Task.is_completed == filters.is_completed)
+    if filters.priority is not None:
+        query = query.where(Task.priority == filters.priority)
+    if filters.due_before is not None:
+        query = query.where(Task.due_date < filters.due_before)
+    if filters.due_after is not None:
+        query = query.where(Task.due_date >= filters.due_after)
+    return query
+
+
+async def list_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    after: TaskKey | None = None,
+    filters: TaskFilters = TaskFilters(),
+) -> Sequence[Task]:
+    """Return up to limit tasks of a workspace, newest first, after a keyset position.
+
+    The row-value comparison on (created_at, id) lets PostgreSQL continue an
+    index scan from the cursor instead of skipping OFFSET rows, so deep pages
+    cost the same as the first one.
+    """
+    query = _apply_filters(select(Task).where(Task.workspace_id == workspace_id), filters)
+    if after is not None:
+        query = query.where(tuple_(Task.created_at, Task.id) < tuple_(after.created_at, after.id))
+    query = query.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_task(db: AsyncSession, workspace_id: uuid.UUID, task_id: uuid.UUID) -> Task | None:
+    result = await db.execute(
+        select(Task).where(Task.workspace_id == workspace_id, Task.id == task_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_task_by_number(db: AsyncSession, workspace_id: uuid.UUID, number: int) -> Task | None:
+    result = await db.execute(
+        select(Task).where(Task.workspace_id == workspace_id, Task.number == number)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_archived_task(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+) -> TaskArchive | None:
+    return await db.get(TaskArchive, (workspace_id, task_id))
+
+
+async def get_archived_task_by_number(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    number: int,
+) -> TaskArchive | None:
+    result = await db.execute(
+        select(TaskArchive).where(TaskArchive.workspace_id == workspace_id, TaskArchive.number == number)
+    )
+    return result.scalar_one_or_none()
+
+
+async def list_archived_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    after: TaskKey | None = None,
+) -> Sequence[TaskArchive]:
+    """Archived tasks of a workspace, newest first; keyset paging as in list_tasks."""
+    query = select(TaskArchive).where(TaskArchive.workspace_id == workspace_id)
+    if after is not None:
+        query = query.where(
+            tuple_(TaskArchive.created_at, TaskArchive.id) < tuple_(after.created_at, after.id)
+        )
+    query = query.order_by(TaskArchive.created_at.desc(), TaskArchive.id.desc()).limit(limit)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def restore_archived_task(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+) -> Task | None:
+    """Move a task from the archive back to tasks; None if it isn't archived.
+
+    The restored task gets a fresh updated_at, so the archiver does not
+    pick it up again on its next run.
+    """
+    archive = TaskArchive.__table__
+    row = (
+        await db.execute(
+            delete(archive)
+            .where(archive.c.workspace_id == workspace_id, archive.c.id == task_id)
+            .returning(*(archive.c[name] for name in ARCHIVED_COLUMNS))
+        )
+    ).mappings().one_or_none()
+    if row is None:
+        return None
+    return await db.scalar(insert(Task).values({**row, "updated_at": func.now()}).returning(Task))
+
+
+async def get_workspace_id_by_key(db: AsyncSession, key: str) -> uuid.UUID | None:
+    return await db.scalar(
+        select(Workspace.id).where(Workspace.key == key, Workspace.deleting_at.is_(None))
+    )
+
+
+async def reserve_task_numbers(db: AsyncSession, workspace_id: uuid.UUID, count: int) -> int:
+    """Reserve ``count`` consecutive task numbers and return the first one.
+
+    A single upsert ... RETURNING on the workspace's counter row, so a
+    batch costs one round trip however large it is. The row stays locked
+    until the caller's transaction ends, which is no longer than the
+    workspace_task_stats row its inserts lock anyway; a rollback returns
+    the block.
+    """
+    counters = WorkspaceTaskCounter.__table__
+    next_number = await db.scalar(
+        pg_insert(counters)
+        .values(workspace_id=workspace_id, next_number=1 + count)
+        .on_conflict_do_update(
+            index_elements=[counters.c.workspace_id],
+            set_={"next_number": counters.c.next_number + count},
+        )
+        .returning(counters.c.next_number)
+    )
+    return next_number - count
+
+
+async def list_open_tasks_by_urgency(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+) -> Sequence[Task]:
+    """Open tasks of a workspace, highest priority first, then earliest due date.
+
+    The ORDER BY matches ix_tasks_workspace_open_priority_due column for
+    column, so this is an ordered scan of the partial index with no sort.
+    """
+    result = await db.execute(
+        select(Task)
+        .where(Task.workspace_id == workspace_id, Task.is_completed.is_(False))
+        .order_by(Task.priority.desc(), Task.due_date.asc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def insert_tasks(db: AsyncSession, rows: list[dict[str, Any]]) -> list[uuid.UUID]:
+    """Insert rows with multi-row INSERT ... RETURNING; ids come back in input order."""
+    if not rows:
+        return []
+    result = await db.execute(
+        insert(Task).returning(Task.id, sort_by_parameter_order=True),
+        rows,
+    )
+    return list(result.scalars().all())
+
+
+async def update_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    rows: list[dict[str, Any]],
+) -> set[uuid.UUID]:
+    """Apply per-row partial updates with UPDATE ... FROM (VALUES ...).
+
+    Each row carries the task id, a ``set_<field>`` flag per updatable field
+    and the new value; fields whose flag is false keep their current value.
+    Returns the ids that were found in the workspace and updated.
+    """
+    tasks = Task.__table__
+    updated: set[uuid.UUID] = set()
+    for start in range(0, len(rows), UPDATE_CHUNK_SIZE):
+        chunk = rows[start:start + UPDATE_CHUNK_SIZE]
+        changes = values(
+            column("id", UUID(as_uuid=True)),
+            *(column(f"set_{name}", Boolean) for name in UPDATABLE_FIELDS),
+            *(column(name, tasks.c[name].type) for name in UPDATABLE_FIELDS),
+            name="changes",
+        ).data(
+            [
+                (
+                    row["id"],
+                    *(f"set_{name}" in row for name in UPDATABLE_FIELDS),
+                    *(row.get(name) for name in UPDATABLE_FIELDS),
+                )
+                for row in chunk
+            ]
+        )
+        result = await db.execute(
+            update(tasks)
+            .where(tasks.c.id == changes.c.id, tasks.c.workspace_id == workspace_id)
+            .values(
+                {
+                    **{
+                        name: case((changes.c[f"set_{name}"], changes.c[name]), else_=tasks.c[name])
+                        for name in UPDATABLE_FIELDS
+                    },
+                    "updated_at": func.now(),
+                }
+            )
+            .returning(tasks.c.id)
+        )
+        updated.update(result.scalars().all())
+    return updated
+
+
+async def complete_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    ids: list[uuid.UUID],
+) -> set[uuid.UUID]:
+    """Mark tasks completed in one UPDATE; returns the ids found in the workspace."""
+    if not ids:
+        return set()
+    tasks = Task.__table__
+    result = await db.execute(
+        update(tasks)
+        .where(tasks.c.workspace_id == workspace_id, tasks.c.id.in_(ids))
+        .values(is_completed=True, updated_at=func.now())
+        .returning(tasks.c.id)
+    )
+    return set(result.scalars().all())
+
+
+async def search_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    query_text: str,
+    *,
+    limit: int,
+    after: SearchKey | None = None,
+) -> list[SearchHit]:
+    """Full-text search within a workspace, best matches first.
+
+    Matches come from the GIN index on search_vector. Ranking and keyset
+    filtering happen in an inner query; ts_headline, which re-parses the
+    document text, only runs in the outer query for the rows of the page.
+    """
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    query = func.websearch_to_tsquery(config, query_text)
+    rank = func.ts_rank(Task.search_vector, query)
+
+    page = select(Task.id, rank.label("rank")).where(
+        Task.workspace_id == workspace_id,
+        Task.search_vector.op("@@")(query),
+    )
+    if after is not None:
+        page = page.where(tuple_(rank, Task.id) < tuple_(after.rank, after.id))
+    page = page.order_by(rank.desc(), Task.id.desc()).limit(limit).subquery()
+
+    result = await db.execute(
+        select(
+            Task,
+            page.c.rank,
+            func.ts_headline(config, Task.title, query, HEADLINE_OPTIONS),
+            func.ts_headline(config, Task.description, query, HEADLINE_OPTIONS),
+        )
+        .join(page, page.c.id == Task.id)
+        .where(Task.workspace_id == workspace_id)
+        .order_by(page.c.rank.desc(), Task.id.desc())
+    )
+    return [
+        SearchHit(task=task, rank=rank_value, title_snippet=title, description_snippet=description)
+        for task, rank_value, title, description in result.all()
+    ]
+
+
+async def list_task_changes(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    after: ChangeKey | None = None,
+    include_deleted: bool = True,
+) -> list[tuple[TaskChange, Task | None]]:
+    """Changes after a log position, oldest first, with the current task row.
+
+    Reads ix_task_changes_workspace_version from the cursor onwards, so the
+    cost depends on the number of changes returned, not on workspace size.
+    Tombstones come back with ``None`` in place of the task.
+    """
+    query = (
+        select(TaskChange, Task)
+        .outerjoin(
+            Task,
+            (Task.id == TaskChange.task_id) & (Task.workspace_id == TaskChange.workspace_id),
+        )
+        .where(TaskChange.workspace_id == workspace_id)
+    )
+    if after is not None:
+        query = query.where(
+            tuple_(TaskChange.version, TaskChange.task_id) > tuple_(after.version, after.task_id)
+        )
+    if not include_deleted:
+        query = query.where(TaskChange.deleted.is_(False))
+    query = query.order_by(TaskChange.version, TaskChange.task_id).limit(limit)
+
+    result = await db.execute(query)
+    return [(change, task) for change, task in result.all()]
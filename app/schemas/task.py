@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -67,6 +67,7 @@ class TaskUpdate(BaseModel):
 
 class TaskResponse(BaseModel):
     id: uuid.UUID
+    number: int = Field(description='Task number within the workspace, as in "ABC-123".')
     title: str
     description: str | None = None
     is_completed: bool
@@ -76,5 +77,99 @@ class TaskResponse(BaseModel):
     user_id: uuid.UUID
     created_at: datetime
     updated_at: datetime
+    archived_at: datetime | None = Field(
+        default=None,
+        description="Set when the task was read from the archive.",
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskPage(BaseModel):
+    items: list[TaskResponse]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor for the next page; null on the last page.",
+    )
+
+
+class TaskSearchHit(BaseModel):
+    task: TaskResponse
+    rank: float
+    title_snippet: str = Field(description="Title with matches wrapped in <mark>.")
+    description_snippet: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskSearchPage(BaseModel):
+    items: list[TaskSearchHit]
+    next_cursor: str | None = None
+
+
+class TaskChangeItem(BaseModel):
+    task_id: uuid.UUID
+    version: int
+    deleted: bool
+    task: TaskResponse | None = Field(
+        default=None,
+        description="Current state of the task; null for deletions.",
+    )
+
+
+class TaskChangesPage(BaseModel):
+    items: list[TaskChangeItem]
+    next_cursor: str = Field(description="Pass as ?since= on the next sync.")
+    has_more: bool
+
+
+class TaskBatchUpdateItem(TaskUpdate):
+    id: uuid.UUID
+
+
+class TaskBatchComplete(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1)
+
+
+class TaskBatchItemResult(BaseModel):
+    index: int
+    ok: bool
+    id: uuid.UUID | None = None
+    errors: list[str] = Field(default_factory=list)
+
+
+class TaskBatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[TaskBatchItemResult]
+
+
+class TaskImportReject(BaseModel):
+    record: int
+    errors: list[str]
+    data: Any = None
+
+
+class TaskImportReport(BaseModel):
+    rows_read: int
+    rows_loaded: int
+    rows_rejected: int
+    rows_per_second: float
+    elapsed_seconds: float
+    rejects: list[TaskImportReject] = Field(
+        description="First rejected records; rows_rejected has the full count.",
+    )
+
+
+class TaskPriorityCounts(BaseModel):
+    low: int
+    medium: int
+    high: int
+
+
+class WorkspaceTaskStatsResponse(BaseModel):
+    open: int
+    completed: int
+    total: int
+    open_by_priority: TaskPriorityCounts
+    overdue: int = Field(description="Open tasks whose due date has passed.")
@@ -21,4 +21,14 @@ class WorkspaceResponse(BaseModel):
     description: str | None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class WorkspaceDeletionResponse(BaseModel):
+    workspace_id: uuid.UUID
+    requested_at: datetime
+    tasks_total: int
+    tasks_deleted: int
+    members_deleted: int
+    finished_at: datetime | None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,59 +2,77 @@ import uuid
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.dependencies import invalidate_principal
+from app.core.revocation import revoked_tokens
+from app.services.refresh_token_writer import refresh_token_writer
 from app.core.security import (
+    PasswordHashQueueFull,
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
 )
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin
 
+HASH_QUEUE_RETRY_AFTER_SECONDS = 1
 
-async def register_user(db: AsyncSession, user_data: UserCreate) -> User:
-    existing_by_email = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    if existing_by_email.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Пользователь с таким email уже существует",
-        )
 
-    existing_by_username = await db.execute(
-        select(User).where(User.username == user_data.username)
+def _hashing_overloaded() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Сервер перегружен, повторите попытку позже",
+        headers={"Retry-After": str(HASH_QUEUE_RETRY_AFTER_SECONDS)},
     )
-    if existing_by_username.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Этот username уже занят",
-        )
 
-    new_user = User(
-        email=user_data.email,
-        username=user_data.username,
-        hashed_password=hash_password(user_data.password),
+
+async def _registration_conflict_detail(db: AsyncSession, user_data: UserCreate) -> str:
+    result = await db.execute(
+        select(User.email, User.username).where(
+            or_(User.email == user_data.email, User.username == user_data.username)
+        )
     )
-    db.add(new_user)
+    rows = result.all()
+    if any(row.email == user_data.email for row in rows):
+        return "Пользователь с таким email уже существует"
+    if any(row.username == user_data.username for row in rows):
+        return "Этот username уже занят"
+    return "Пользователь уже существует"
+
 
+async def register_user(db: AsyncSession, user_data: UserCreate) -> User:
     try:
-        await db.commit()
-    except IntegrityError:
+        hashed_password = await hash_password_async(user_data.password)
+    except PasswordHashQueueFull:
+        raise _hashing_overloaded()
+
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            hashed_password=hashed_password,
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
+    )
+    new_user = result.scalar_one_or_none()
+
+    if new_user is None:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Пользователь уже существует",
+            detail=await _registration_conflict_detail(db, user_data),
         )
 
-    await db.refresh(new_user)
+    await db.commit()
     return new_user
 
 
@@ -67,7 +85,16 @@ async def login_user(
     result = await db.execute(select(User).where(User.email == user_data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    password_ok, new_hash = False, None
+    try:
+        if user is not None:
+            password_ok, new_hash = await verify_and_update_password_async(
+                user_data.password, user.hashed_password
+            )
+    except PasswordHashQueueFull:
+        raise _hashing_overloaded()
+
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неверный email или пароль",
@@ -79,6 +106,12 @@ async def login_user(
             detail="Аккаунт деактивирован",
         )
 
+    if new_hash is not None:
+        # Stored hash predates the current argon2 parameters; the new one is
+        # written by the refresh-token commit below, not by a separate one
+        # (in write-behind mode that commit exists only for this case).
+        user.hashed_password = new_hash
+
     access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
     refresh_token, jti = create_refresh_token(data={"sub": str(user.id)})
 
@@ -94,9 +127,14 @@ async def login_user(
     if hasattr(RefreshToken, "ip_address"):
         refresh_token_data["ip_address"] = ip_address
 
-    db_refresh_token = RefreshToken(**refresh_token_data)
-    db.add(db_refresh_token)
-    await db.commit()
+    if settings.REFRESH_TOKEN_WRITE_BEHIND and refresh_token_writer.accepts():
+        refresh_token_writer.enqueue(refresh_token_data)
+        if new_hash is not None:
+            await db.commit()
+    else:
+        db_refresh_token = RefreshToken(**refresh_token_data)
+        db.add(db_refresh_token)
+        await db.commit()
 
     return {
         "access_token": access_token,
@@ -137,6 +175,13 @@ async def refresh_access_token(db: AsyncSession, refresh_token: str) -> dict:
             detail="Некорректный идентификатор пользователя в токене",
         )
 
+    if revoked_tokens.is_revoked(jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Токен отозван или не существует",
+        )
+
+    await refresh_token_writer.flush_if_pending(jti)
     result = await db.execute(
         select(RefreshToken).where(
             RefreshToken.token_jti == jti,
@@ -180,8 +225,8 @@ async def refresh_access_token(db: AsyncSession, refresh_token: str) -> dict:
 
 
 async def logout_user(db: AsyncSession, refresh_token: str) -> dict:
-    payload = decode_token(refresh_token)
-    if not payload or payload.get("type") != "refresh":
+    payload = decode_token(refresh_token, token_type="refresh")
+    if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неверный refresh token",
@@ -194,6 +239,10 @@ async def logout_user(db: AsyncSession, refresh_token: str) -> dict:
             detail="Некорректный токен",
         )
 
+    if revoked_tokens.is_revoked(jti):
+        return {"message": "Logged out successfully"}
+
+    await refresh_token_writer.flush_if_pending(jti)
     result = await db.execute(
         select(RefreshToken).where(
             RefreshToken.token_jti == jti,
@@ -205,18 +254,25 @@ async def logout_user(db: AsyncSession, refresh_token: str) -> dict:
     if stored_token:
         stored_token.revoked_at = datetime.now(timezone.utc)
         await db.commit()
+        revoked_tokens.add(jti, stored_token.expires_at)
 
     return {"message": "Logged out successfully"}
 
 
 async def logout_all_sessions(db: AsyncSession, user_id: uuid.UUID) -> dict:
-    await db.execute(
+    await refresh_token_writer.flush()
+    result = await db.execute(
         update(RefreshToken)
         .where(
             RefreshToken.user_id == user_id,
             RefreshToken.revoked_at.is_(None),
         )
         .values(revoked_at=datetime.now(timezone.utc))
+        .returning(RefreshToken.token_jti, RefreshToken.expires_at)
     )
+    revoked = result.all()
     await db.commit()
+    for jti, expires_at in revoked:
+        revoked_tokens.add(jti, expires_at)
+    invalidate_principal(user_id)
     return {"message": "All sessions logged out"}
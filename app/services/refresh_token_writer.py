@@ -0,0 +1,129 @@
+import asyncio
+import contextlib
+import logging
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import async_session
+from app.models.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenWriteBehind:
+    """Buffers new refresh-token rows and inserts them with multi-row INSERTs.
+
+    Rows stay in the buffer until the INSERT that carries them commits, so a
+    token is always visible either here or in the database. Readers that
+    need a just-issued token call ``flush_if_pending`` first. Tokens still
+    buffered when the process dies are lost and their users have to log in
+    again; that is the price of skipping one commit per login.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval: float,
+        max_rows: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def accepts(self) -> bool:
+        """False when stopped or when the backlog is too large to keep buffering."""
+        return self.running and len(self._pending) < self.max_rows * 10
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        self._pending[row["token_jti"]] = row
+        if len(self._pending) >= self.max_rows:
+            self._wakeup.set()
+
+    def is_pending(self, jti: str) -> bool:
+        return jti in self._pending
+
+    async def flush_if_pending(self, jti: str) -> None:
+        if jti in self._pending:
+            await self.flush()
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            rows = list(self._pending.values())
+            if not rows:
+                return 0
+            async with self._session_factory() as db:
+                for start in range(0, len(rows), self.max_rows):
+                    await self._insert_chunk(db, rows[start:start + self.max_rows])
+                await db.commit()
+            for row in rows:
+                self._pending.pop(row["token_jti"], None)
+            return len(rows)
+
+    @staticmethod
+    async def _insert(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        # A jti already written (a flush retried after its commit) is skipped.
+        async with db.begin_nested():
+            await db.execute(
+                insert(RefreshToken).values(rows).on_conflict_do_nothing(index_elements=["token_jti"])
+            )
+
+    async def _insert_chunk(self, db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """Insert a chunk; if it is rejected, insert its rows one by one.
+
+        Each attempt runs in a savepoint, so a row that can never be
+        written, e.g. of a user deleted meanwhile, is dropped alone
+        instead of taking the rest of the buffer with it.
+        """
+        try:
+            await self._insert(db, rows)
+            return
+        except IntegrityError:
+            if len(rows) == 1:
+                logger.exception("Dropping buffered refresh token %s", rows[0]["token_jti"])
+                return
+        for row in rows:
+            try:
+                await self._insert(db, [row])
+            except IntegrityError:
+                logger.exception("Dropping buffered refresh token %s", row["token_jti"])
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Refresh token flush failed, will retry")
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+
+refresh_token_writer = RefreshTokenWriteBehind(
+    session_factory=async_session,
+    flush_interval=settings.REFRESH_TOKEN_FLUSH_INTERVAL_MS / 1000,
+    max_rows=settings.REFRESH_TOKEN_FLUSH_MAX_ROWS,
+)
@@ -0,0 +1,419 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.dependencies import get_workspace_role
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.repositories.task import (
+    UPDATABLE_FIELDS,
+    ChangeKey,
+    SearchKey,
+    TaskFilters,
+    TaskKey,
+    complete_tasks,
+    get_archived_task,
+    get_archived_task_by_number,
+    get_task,
+    get_task_by_number,
+    get_workspace_id_by_key,
+    insert_tasks,
+    list_archived_tasks,
+    list_task_changes,
+    list_open_tasks_by_urgency,
+    list_tasks,
+    reserve_task_numbers,
+    restore_archived_task,
+    search_tasks,
+    update_tasks,
+)
+from app.schemas.task import TaskBatchUpdateItem, TaskCreate
+from app.services.task_stats import get_changes_horizon, get_workspace_version
+
+M = TypeVar("M", bound=BaseModel)
+
+task_create_list = TypeAdapter(list[TaskCreate])
+task_update_list = TypeAdapter(list[TaskBatchUpdateItem])
+
+# Fields that may be explicitly cleared with null; the rest are NOT NULL.
+NULLABLE_FIELDS = {"description", "due_date"}
+
+# Sorts after every real task id: a change cursor at (version, MAX_TASK_ID)
+# has seen everything up to and including that version.
+MAX_TASK_ID = uuid.UUID(int=(1 << 128) - 1)
+
+
+def _pack_cursor(data: dict[str, Any]) -> str:
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _unpack_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        raise _invalid_cursor()
+    return data
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Некорректный курсор",
+    )
+
+
+def encode_cursor(key: TaskKey) -> str:
+    return _pack_cursor({"c": key.created_at.isoformat(), "i": str(key.id)})
+
+
+def decode_cursor(cursor: str) -> TaskKey:
+    data = _unpack_cursor(cursor)
+    try:
+        return TaskKey(created_at=datetime.fromisoformat(data["c"]), id=uuid.UUID(data["i"]))
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+
+
+def encode_search_cursor(key: SearchKey) -> str:
+    return _pack_cursor({"r": key.rank, "i": str(key.id)})
+
+
+def decode_search_cursor(cursor: str) -> SearchKey:
+    data = _unpack_cursor(cursor)
+    try:
+        return SearchKey(rank=float(data["r"]), id=uuid.UUID(data["i"]))
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+
+
+def encode_change_cursor(key: ChangeKey, full_sync: bool = False) -> str:
+    data: dict[str, Any] = {"v": key.version, "i": str(key.task_id)}
+    if full_sync:
+        data["f"] = 1
+    return _pack_cursor(data)
+
+
+def decode_change_cursor(cursor: str) -> tuple[ChangeKey, bool]:
+    data = _unpack_cursor(cursor)
+    try:
+        key = ChangeKey(version=int(data["v"]), task_id=uuid.UUID(data["i"]))
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+    return key, bool(data.get("f"))
+
+
+async def list_workspace_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    cursor: str | None,
+    filters: TaskFilters,
+) -> dict:
+    after = decode_cursor(cursor) if cursor else None
+    tasks = await list_tasks(db, workspace_id, limit=limit + 1, after=after, filters=filters)
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        next_cursor = encode_cursor(TaskKey(created_at=last.created_at, id=last.id))
+
+    return {"items": tasks, "next_cursor": next_cursor}
+
+
+async def list_archived_workspace_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    cursor: str | None,
+) -> dict:
+    after = decode_cursor(cursor) if cursor else None
+    tasks = await list_archived_tasks(db, workspace_id, limit=limit + 1, after=after)
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        next_cursor = encode_cursor(TaskKey(created_at=last.created_at, id=last.id))
+
+    return {"items": tasks, "next_cursor": next_cursor}
+
+
+async def get_workspace_task(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+) -> Task | TaskArchive:
+    """A task by id; archived tasks are found too and carry archived_at."""
+    task = await get_task(db, workspace_id, task_id) or await get_archived_task(db, workspace_id, task_id)
+    if task is None:
+        raise _task_not_found()
+    return task
+
+
+async def restore_workspace_task(db: AsyncSession, workspace_id: uuid.UUID, task_id: uuid.UUID) -> Task:
+    task = await restore_archived_task(db, workspace_id, task_id)
+    if task is None:
+        raise _task_not_found()
+    await db.commit()
+    return task
+
+
+def _task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Задача не найдена",
+    )
+
+
+def parse_task_key(task_key: str) -> tuple[str, int] | None:
+    """Split "ABC-123" into the workspace key and task number."""
+    workspace_key, _, number = task_key.rpartition("-")
+    if not workspace_key or not number.isdigit():
+        return None
+    return workspace_key, int(number)
+
+
+async def resolve_workspace_key(
+    db: AsyncSession,
+    task_key: str,
+    user_id: uuid.UUID,
+) -> tuple[uuid.UUID, int]:
+    """Workspace id and task number for a key the user may read.
+
+    Unknown keys and workspaces the user is not a member of both give the
+    same 404, so keys can't be used to probe for workspaces.
+    """
+    parsed = parse_task_key(task_key)
+    workspace_id = await get_workspace_id_by_key(db, parsed[0]) if parsed else None
+    if workspace_id is None or await get_workspace_role(db, workspace_id, user_id) is None:
+        raise _task_not_found()
+    return workspace_id, parsed[1]
+
+
+async def get_task_by_key(db: AsyncSession, workspace_id: uuid.UUID, number: int) -> Task | TaskArchive:
+    task = await get_task_by_number(db, workspace_id, number) or await get_archived_task_by_number(
+        db, workspace_id, number
+    )
+    if task is None:
+        raise _task_not_found()
+    return task
+
+
+async def list_urgent_tasks(db: AsyncSession, workspace_id: uuid.UUID, *, limit: int) -> list[Task]:
+    return list(await list_open_tasks_by_urgency(db, workspace_id, limit=limit))
+
+
+async def list_workspace_changes(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    *,
+    limit: int,
+    since: str | None,
+) -> dict:
+    """One page of task changes after ``since``; without it, a full sync.
+
+    The first page of a full sync skips tombstones, which a fresh client
+    has no use for. Later pages include them: a task returned on an
+    earlier page may have been deleted since, and its tombstone is the
+    only way the client learns about it. Once a sync has no more pages, the
+    cursor jumps to the workspace version read before the query: every
+    change up to it was already committed and therefore returned.
+
+    Incremental cursors older than the tombstone horizon may have missed
+    deletions and get 410, telling the client to sync from scratch. The
+    horizon is read after the changes so that a purge racing with this
+    request is always noticed.
+    """
+    after, full_sync = decode_change_cursor(since) if since else (None, True)
+    current_version = await get_workspace_version(db, workspace_id)
+    rows = await list_task_changes(
+        db, workspace_id, limit=limit + 1, after=after, include_deleted=after is not None
+    )
+
+    if after is not None and not full_sync and after.version < await get_changes_horizon(db, workspace_id):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Курсор устарел, выполните полную синхронизацию",
+        )
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if has_more:
+        last = rows[-1][0]
+        next_cursor = encode_change_cursor(ChangeKey(last.version, last.task_id), full_sync)
+    else:
+        positions = [(current_version, MAX_TASK_ID)]
+        if rows:
+            positions.append((rows[-1][0].version, rows[-1][0].task_id))
+        if after is not None:
+            positions.append((after.version, after.task_id))
+        version, task_id = max(positions)
+        next_cursor = encode_change_cursor(ChangeKey(version, task_id))
+
+    return {
+        "items": [
+            {"task_id": change.task_id, "version": change.version, "deleted": change.deleted, "task": task}
+            for change, task in rows
+        ],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+
+
+async def search_workspace_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    query_text: str,
+    *,
+    limit: int,
+    cursor: str | None,
+) -> dict:
+    after = decode_search_cursor(cursor) if cursor else None
+    hits = await search_tasks(db, workspace_id, query_text, limit=limit + 1, after=after)
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        last = hits[-1]
+        next_cursor = encode_search_cursor(SearchKey(rank=last.rank, id=last.task.id))
+
+    return {"items": hits, "next_cursor": next_cursor}
+
+
+def validate_batch(
+    adapter: TypeAdapter[list[M]],
+    raw_items: list[Any],
+) -> tuple[list[tuple[int, M]], dict[int, list[str]]]:
+    """Validate a whole list at once and split it into valid items and errors.
+
+    Returns (index, model) pairs for valid items and error messages keyed by
+    the index of each invalid item. Only when some items fail is the valid
+    remainder validated a second time.
+    """
+    try:
+        return list(enumerate(adapter.validate_python(raw_items))), {}
+    except ValidationError as exc:
+        errors: dict[int, list[str]] = {}
+        for error in exc.errors():
+            index, *field = error["loc"]
+            location = ".".join(str(part) for part in field)
+            errors.setdefault(index, []).append(f"{location}: {error['msg']}" if location else error["msg"])
+
+    valid_indexes = [index for index in range(len(raw_items)) if index not in errors]
+    models = adapter.validate_python([raw_items[index] for index in valid_indexes])
+    return list(zip(valid_indexes, models)), errors
+
+
+def _check_batch_size(raw_items: list[Any]) -> None:
+    if not raw_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Пустой список",
+        )
+    if len(raw_items) > settings.TASK_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Не более {settings.TASK_BATCH_MAX_ITEMS} элементов за запрос",
+        )
+
+
+def _batch_result(total: int, ids: dict[int, uuid.UUID], errors: dict[int, list[str]]) -> dict:
+    results = [
+        {"index": index, "ok": True, "id": ids[index]}
+        if index in ids
+        else {"index": index, "ok": False, "errors": errors.get(index, [])}
+        for index in range(total)
+    ]
+    return {"succeeded": len(ids), "failed": total - len(ids), "results": results}
+
+
+async def batch_create_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    raw_items: list[Any],
+) -> dict:
+    _check_batch_size(raw_items)
+    valid, errors = validate_batch(task_create_list, raw_items)
+
+    first_number = await reserve_task_numbers(db, workspace_id, len(valid)) if valid else 0
+    rows = [
+        {
+            **item.model_dump(),
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "number": first_number + offset,
+        }
+        for offset, (_, item) in enumerate(valid)
+    ]
+    created = await insert_tasks(db, rows)
+    await db.commit()
+
+    ids = {index: task_id for (index, _), task_id in zip(valid, created)}
+    return _batch_result(len(raw_items), ids, errors)
+
+
+async def batch_update_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    raw_items: list[Any],
+) -> dict:
+    _check_batch_size(raw_items)
+    valid, errors = validate_batch(task_update_list, raw_items)
+
+    rows: list[dict[str, Any]] = []
+    row_indexes: list[int] = []
+    seen: set[uuid.UUID] = set()
+    for index, item in valid:
+        if item.id in seen:
+            errors[index] = ["id: duplicated in this batch"]
+            continue
+        seen.add(item.id)
+
+        row: dict[str, Any] = {"id": item.id}
+        for name in UPDATABLE_FIELDS:
+            value = getattr(item, name)
+            if name in item.model_fields_set and (value is not None or name in NULLABLE_FIELDS):
+                row[f"set_{name}"] = True
+                row[name] = value
+        rows.append(row)
+        row_indexes.append(index)
+
+    updated = await update_tasks(db, workspace_id, rows)
+    await db.commit()
+
+    ids: dict[int, uuid.UUID] = {}
+    for index, row in zip(row_indexes, rows):
+        if row["id"] in updated:
+            ids[index] = row["id"]
+        else:
+            errors[index] = ["Task not found"]
+    return _batch_result(len(raw_items), ids, errors)
+
+
+async def batch_complete_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    task_ids: list[uuid.UUID],
+) -> dict:
+    _check_batch_size(task_ids)
+    completed = await complete_tasks(db, workspace_id, list(set(task_ids)))
+    await db.commit()
+
+    ids = {index: task_id for index, task_id in enumerate(task_ids) if task_id in completed}
+    errors = {index: ["Task not found"] for index in range(len(task_ids)) if index not in ids}
+    return _batch_result(len(task_ids), ids, errors)
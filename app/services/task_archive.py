@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import async_session
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.repositories.task import ARCHIVED_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Sizes summed over pg_partition_tree, so they are right whether or not
+# tasks is partitioned: for a plain table the tree is the table itself.
+TABLE_SIZE_SQL = text(
+    "SELECT coalesce(sum(pg_table_size(relid)), 0) FROM pg_partition_tree(CAST(:table AS regclass))"
+)
+INDEX_SIZES_SQL = text(
+    """
+    SELECT c.relname,
+           (SELECT coalesce(sum(pg_relation_size(t.relid)), 0) FROM pg_partition_tree(i.indexrelid) t)
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = CAST(:table AS regclass)
+    ORDER BY c.relname
+    """
+)
+
+
+@dataclass
+class RelationSizes:
+    table_bytes: int = 0
+    index_bytes: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class TaskArchiveReport:
+    archived: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    before: RelationSizes = field(default_factory=RelationSizes)
+    after: RelationSizes = field(default_factory=RelationSizes)
+
+
+async def get_relation_sizes(db: AsyncSession, table: str = "tasks") -> RelationSizes:
+    """Heap size of a table and the size of each of its indexes, in bytes."""
+    table_bytes = await db.scalar(TABLE_SIZE_SQL, {"table": table})
+    indexes = (await db.execute(INDEX_SIZES_SQL, {"table": table})).all()
+    return RelationSizes(
+        table_bytes=int(table_bytes),
+        index_bytes={name: int(size) for name, size in indexes},
+    )
+
+
+async def _archive_batch(
+    db: AsyncSession,
+    cutoff: datetime,
+    after: tuple[datetime, uuid.UUID] | None,
+    batch_size: int,
+) -> list[tuple[datetime, uuid.UUID]]:
+    """Move one batch of old completed tasks to tasks_archive in one statement.
+
+    Candidates come from ix_tasks_completed_updated in (updated_at, id)
+    order, continuing after the last batch, so later batches don't wade
+    through the index entries earlier ones left dead. The delete fires
+    the usual task triggers: counters drop the tasks and sync clients get
+    tombstones, exactly as for a deleted task. Locked rows are skipped,
+    so a task being edited stays where it is. Returns the moved keys.
+    """
+    batch = select(Task.id, Task.workspace_id).where(
+        Task.is_completed.is_(True), Task.updated_at < cutoff
+    )
+    if after is not None:
+        batch = batch.where(tuple_(Task.updated_at, Task.id) > tuple_(*after))
+    batch = (
+        batch.order_by(Task.updated_at, Task.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    moved = (
+        delete(Task)
+        .where(tuple_(Task.id, Task.workspace_id).in_(batch))
+        .returning(*(Task.__table__.c[name] for name in ARCHIVED_COLUMNS))
+        .cte("moved")
+    )
+    archived = (
+        insert(TaskArchive)
+        .from_select(ARCHIVED_COLUMNS, select(*(moved.c[name] for name in ARCHIVED_COLUMNS)))
+        .returning(TaskArchive.updated_at, TaskArchive.id)
+        .cte("archived")
+    )
+    keys = (await db.execute(select(archived.c.updated_at, archived.c.id))).all()
+    await db.commit()
+    return [tuple(key) for key in keys]
+
+
+async def archive_completed_tasks(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    older_than_days: int | None = None,
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> TaskArchiveReport:
+    """Move completed tasks untouched for ``older_than_days`` to the archive.
+
+    Each batch is its own short transaction followed by a pause. Sizes of
+    tasks and its indexes are taken before and after; the space freed by
+    the moved rows is reused once VACUUM has processed them.
+    """
+    older_than_days = older_than_days or settings.TASK_ARCHIVE_AFTER_DAYS
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+    if pause_seconds is None:
+        pause_seconds = settings.TASK_ARCHIVE_BATCH_PAUSE_SECONDS
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+    report = TaskArchiveReport()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        report.before = await get_relation_sizes(db)
+        after = None
+        while True:
+            keys = await _archive_batch(db, cutoff, after, batch_size)
+            report.batches += 1
+            report.archived += len(keys)
+            if len(keys) < batch_size:
+                break
+            after = max(keys)
+            await asyncio.sleep(pause_seconds)
+        report.after = await get_relation_sizes(db)
+        await db.rollback()
+
+    report.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return report
+
+
+async def run_task_archiver() -> None:
+    """Archive old completed tasks forever; started from the application lifespan."""
+    while True:
+        try:
+            report = await archive_completed_tasks()
+        except Exception:
+            logger.exception("Task archiving failed")
+        else:
+            if report.archived:
+                logger.info(
+                    "Archived %d tasks in %.3fs, %d batches; tasks indexes %d -> %d bytes",
+                    report.archived,
+                    report.elapsed_seconds,
+                    report.batches,
+                    sum(report.before.index_bytes.values()),
+                    sum(report.after.index_bytes.values()),
+                )
+        await asyncio.sleep(settings.TASK_ARCHIVE_INTERVAL_SECONDS)
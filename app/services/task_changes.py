@@ -0,0 +1,84 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import async_session
+from app.models.task_change import TaskChange
+from app.models.workspace_task_stats import WorkspaceTaskStats
+
+
+@dataclass
+class TombstonePurgeReport:
+    deleted: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+
+async def _purge_batch(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """Delete one batch of old tombstones and raise the affected horizons.
+
+    Both happen in one statement, so a sync request either sees the
+    tombstones or the horizon that replaced them.
+    """
+    batch = (
+        select(TaskChange.workspace_id, TaskChange.task_id)
+        .where(TaskChange.deleted.is_(True), TaskChange.changed_at < cutoff)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    purged = (
+        delete(TaskChange)
+        .where(tuple_(TaskChange.workspace_id, TaskChange.task_id).in_(batch))
+        .returning(TaskChange.workspace_id, TaskChange.version)
+        .cte("purged")
+    )
+    horizons = (
+        select(purged.c.workspace_id, func.max(purged.c.version).label("version"))
+        .group_by(purged.c.workspace_id)
+        .subquery()
+    )
+    advanced = (
+        update(WorkspaceTaskStats)
+        .where(WorkspaceTaskStats.workspace_id == horizons.c.workspace_id)
+        .values(changes_horizon=func.greatest(WorkspaceTaskStats.changes_horizon, horizons.c.version))
+        .returning(WorkspaceTaskStats.workspace_id)
+        .cte("advanced")
+    )
+    deleted = await db.scalar(select(func.count()).select_from(purged).add_cte(advanced))
+    await db.commit()
+    return deleted or 0
+
+
+async def purge_task_tombstones(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    retention_hours: int | None = None,
+    batch_size: int | None = None,
+    pause_seconds: float = 0.1,
+) -> TombstonePurgeReport:
+    """Compact the change log by dropping tombstones older than the retention.
+
+    Clients whose cursor predates a purged tombstone get 410 and resync, so
+    the retention should exceed the longest time a client stays offline.
+    """
+    retention_hours = retention_hours or settings.TASK_TOMBSTONE_RETENTION_HOURS
+    batch_size = batch_size or settings.TASK_TOMBSTONE_PURGE_BATCH_SIZE
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+
+    report = TombstonePurgeReport()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        while True:
+            deleted = await _purge_batch(db, cutoff, batch_size)
+            report.batches += 1
+            report.deleted += deleted
+            if deleted < batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+
+    report.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return report
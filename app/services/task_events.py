@@ -0,0 +1,209 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from typing import AsyncIterator
+
+import asyncpg
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core.dependencies import check_workspace_role, invalidate_membership
+from app.db.session import async_session, connect_listener
+
+logger = logging.getLogger(__name__)
+
+# Channel the tasks_sync_notify_* triggers NOTIFY on, one message per
+# workspace and statement: {"type": "changed", "workspace_id", "version"}.
+TASK_EVENTS_CHANNEL = "task_changes"
+
+# Sent after the listener reconnects: notifications may have been missed,
+# so clients should catch up through GET .../tasks/changes.
+RESYNC_EVENT = json.dumps({"type": "resync"})
+HEARTBEAT_EVENT = json.dumps({"type": "heartbeat"})
+
+# Sent on the same channel when deletion of a workspace is requested, so
+# every worker drops its cached memberships right away.
+WORKSPACE_DELETED_TYPE = "workspace_deleted"
+
+HEALTH_CHECK_SECONDS = 30.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+class Subscription:
+    """Bounded queue of encoded events for one connected client.
+
+    Events only say "the workspace is now at version N", so a newer one
+    supersedes older ones: when a slow client's queue is full the oldest
+    event is dropped rather than blocking the fan-out or growing memory.
+    """
+
+    def __init__(self, workspace_id: uuid.UUID, maxsize: int) -> None:
+        self.workspace_id = workspace_id
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def push(self, event: str) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> str:
+        return await self._queue.get()
+
+
+class TaskEventHub:
+    """Per-process fan-out of task change notifications.
+
+    Holds one LISTEN connection outside the request pool and hands every
+    notification to the subscriptions of its workspace. Payloads are
+    forwarded as received, so fan-out costs one JSON parse per message,
+    not per subscriber.
+    """
+
+    def __init__(self, channel: str = TASK_EVENTS_CHANNEL, queue_size: int | None = None) -> None:
+        self.channel = channel
+        self.queue_size = queue_size or settings.TASK_EVENTS_QUEUE_SIZE
+        self._subscriptions: dict[uuid.UUID, set[Subscription]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+        self.received = 0
+        self.delivered = 0
+        self.reconnects = 0
+
+    def subscribe(self, workspace_id: uuid.UUID) -> Subscription:
+        subscription = Subscription(workspace_id, self.queue_size)
+        self._subscriptions[workspace_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.workspace_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.workspace_id]
+
+    def publish(self, payload: str) -> None:
+        """Route one notification payload to its workspace's subscribers."""
+        self.received += 1
+        try:
+            event = json.loads(payload)
+            workspace_id = uuid.UUID(event["workspace_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed task event: %r", payload)
+            return
+        if event.get("type") == WORKSPACE_DELETED_TYPE:
+            invalidate_membership(workspace_id)
+        for subscription in self._subscriptions.get(workspace_id, ()):
+            subscription.push(payload)
+            self.delivered += 1
+
+    def _broadcast(self, event: str) -> None:
+        for subscribers in self._subscriptions.values():
+            for subscription in subscribers:
+                subscription.push(event)
+
+    def _on_notify(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        self.publish(payload)
+
+    async def _listen_once(self) -> None:
+        connection = await connect_listener()
+        terminated = asyncio.get_running_loop().create_future()
+        connection.add_termination_listener(
+            lambda _: terminated.done() or terminated.set_result(None)
+        )
+        try:
+            await connection.add_listener(self.channel, self._on_notify)
+            if self.reconnects:
+                self._broadcast(RESYNC_EVENT)
+            while not terminated.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(terminated), HEALTH_CHECK_SECONDS)
+                except asyncio.TimeoutError:
+                    # A half-open TCP connection never reports termination.
+                    await connection.execute("SELECT 1")
+        finally:
+            with contextlib.suppress(Exception):
+                await connection.close(timeout=5)
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await self._listen_once()
+                delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Task event listener failed, reconnecting in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+            self.reconnects += 1
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> dict[str, int]:
+        subscriptions = [s for subscribers in self._subscriptions.values() for s in subscribers]
+        return {
+            "subscribers": len(subscriptions),
+            "workspaces": len(self._subscriptions),
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": sum(s.dropped for s in subscriptions),
+            "reconnects": self.reconnects,
+        }
+
+
+task_event_hub = TaskEventHub()
+
+
+async def _is_member(workspace_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    async with async_session() as db:
+        try:
+            await check_workspace_role(db, workspace_id, user_id)
+        except HTTPException:
+            return False
+    return True
+
+
+async def stream_workspace_events(
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    heartbeat_seconds: float | None = None,
+) -> AsyncIterator[str]:
+    """Yield encoded events for a workspace, with a heartbeat when idle.
+
+    Membership is checked again every ``heartbeat_seconds`` of wall-clock
+    time, however busy the workspace is, using a short-lived session; the
+    stream ends once the user has left the workspace. No pooled
+    connection is held while waiting.
+    """
+    heartbeat_seconds = heartbeat_seconds or settings.TASK_EVENTS_HEARTBEAT_SECONDS
+    subscription = task_event_hub.subscribe(workspace_id)
+    next_check = time.monotonic() + heartbeat_seconds
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), max(0.0, next_check - time.monotonic()))
+            except asyncio.TimeoutError:
+                event = HEARTBEAT_EVENT
+            if time.monotonic() >= next_check:
+                if not await _is_member(workspace_id, user_id):
+                    return
+                next_check = time.monotonic() + heartbeat_seconds
+            yield event
+    finally:
+        task_event_hub.unsubscribe(subscription)
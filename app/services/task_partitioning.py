@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import async_session
+
+logger = logging.getLogger(__name__)
+
+COPY_COLUMNS = (
+    "id",
+    "workspace_id",
+    "number",
+    "title",
+    "description",
+    "is_completed",
+    "priority",
+    "due_date",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+_columns = ", ".join(COPY_COLUMNS)
+
+# FOR SHARE makes a concurrent update of a row in the batch wait for the
+# copy to commit, after which the mirror trigger applies it to the copy.
+# Rows the trigger already inserted are skipped by ON CONFLICT.
+COPY_BATCH_SQL = text(
+    f"""
+    WITH batch AS (
+        SELECT {_columns} FROM tasks
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :limit
+        FOR SHARE
+    ), copied AS (
+        INSERT INTO tasks_partitioned ({_columns})
+        SELECT {_columns} FROM batch
+        ON CONFLICT DO NOTHING
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM batch),
+           (SELECT count(*) FROM copied),
+           (SELECT id FROM batch ORDER BY id DESC LIMIT 1)
+    """
+)
+
+
+@dataclass
+class TaskPartitionCopyReport:
+    scanned: int = 0
+    copied: int = 0
+    batches: int = 0
+    last_id: uuid.UUID | None = None
+    elapsed_seconds: float = 0.0
+
+
+async def _copy_batch(
+    db: AsyncSession,
+    after: uuid.UUID,
+    batch_size: int,
+) -> tuple[int, int, uuid.UUID | None]:
+    scanned, copied, last_id = (
+        await db.execute(COPY_BATCH_SQL, {"after": after, "limit": batch_size})
+    ).one()
+    await db.commit()
+    return scanned, copied, last_id
+
+
+async def copy_tasks_to_partitions(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+    after: uuid.UUID | None = None,
+) -> TaskPartitionCopyReport:
+    """Copy existing tasks into tasks_partitioned in primary key order.
+
+    Part of the migration to a hash-partitioned tasks table: the table and
+    the mirror trigger for new writes come from revision e7c3a1f5b9d2, the
+    swap from the revision after it. Each batch is a short transaction, so
+    the copy runs next to live traffic; ``after`` resumes an interrupted
+    run from the last id it logged.
+    """
+    batch_size = batch_size or settings.TASK_PARTITION_COPY_BATCH_SIZE
+    if pause_seconds is None:
+        pause_seconds = settings.TASK_PARTITION_COPY_PAUSE_SECONDS
+
+    report = TaskPartitionCopyReport(last_id=after)
+    started = time.perf_counter()
+    async with session_factory() as db:
+        while True:
+            scanned, copied, last_id = await _copy_batch(db, report.last_id or uuid.UUID(int=0), batch_size)
+            if not scanned:
+                break
+            report.scanned += scanned
+            report.copied += copied
+            report.batches += 1
+            report.last_id = last_id
+            if report.batches % 100 == 0:
+                logger.info("Copied %d tasks into partitions, last id %s", report.scanned, last_id)
+            if scanned < batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+
+    report.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return report
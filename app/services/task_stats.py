@@ -0,0 +1,153 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import async_session
+from app.models.task import Task
+from app.models.workspace import Workspace
+from app.models.workspace_task_stats import WorkspaceTaskStats
+
+COUNTER_FIELDS = ("open_count", "completed_count", "open_low", "open_medium", "open_high")
+
+
+def _actual_counts_query():
+    """Counts recomputed from ``tasks``, in the same shape as the stats row."""
+    open_ = Task.is_completed.is_(False)
+    # Workspaces being deleted have no stats row on purpose.
+    return select(
+        Task.workspace_id,
+        func.count().filter(open_).label("open_count"),
+        func.count().filter(Task.is_completed.is_(True)).label("completed_count"),
+        func.count().filter(open_, Task.priority == "low").label("open_low"),
+        func.count().filter(open_, Task.priority == "medium").label("open_medium"),
+        func.count().filter(open_, Task.priority == "high").label("open_high"),
+    ).join(Workspace, Workspace.id == Task.workspace_id).where(
+        Workspace.deleting_at.is_(None)
+    ).group_by(Task.workspace_id)
+
+
+async def get_workspace_version(db: AsyncSession, workspace_id: uuid.UUID) -> int:
+    """Current task version of a workspace; 0 until its first task is written."""
+    version = await db.scalar(
+        select(WorkspaceTaskStats.version).where(WorkspaceTaskStats.workspace_id == workspace_id)
+    )
+    return version or 0
+
+
+async def get_changes_horizon(db: AsyncSession, workspace_id: uuid.UUID) -> int:
+    """Highest version whose tombstones may have been purged from task_changes."""
+    horizon = await db.scalar(
+        select(WorkspaceTaskStats.changes_horizon).where(WorkspaceTaskStats.workspace_id == workspace_id)
+    )
+    return horizon or 0
+
+
+async def get_workspace_stats(db: AsyncSession, workspace_id: uuid.UUID) -> dict:
+    """Dashboard counters: one primary-key read plus an index-only overdue count."""
+    stats = await db.get(WorkspaceTaskStats, workspace_id)
+    counts = {name: getattr(stats, name) if stats else 0 for name in COUNTER_FIELDS}
+
+    # Overdue depends on the clock, so it can't be maintained by triggers;
+    # the partial index on open tasks' due dates keeps this count cheap.
+    overdue = await db.scalar(
+        select(func.count())
+        .select_from(Task)
+        .where(
+            Task.workspace_id == workspace_id,
+            Task.is_completed.is_(False),
+            Task.due_date < datetime.now(timezone.utc),
+        )
+    )
+
+    return {
+        "open": counts["open_count"],
+        "completed": counts["completed_count"],
+        "total": counts["open_count"] + counts["completed_count"],
+        "open_by_priority": {
+            "low": counts["open_low"],
+            "medium": counts["open_medium"],
+            "high": counts["open_high"],
+        },
+        "overdue": overdue,
+    }
+
+
+@dataclass
+class ReconcileReport:
+    workspaces_checked: int = 0
+    drifted: list[dict] = field(default_factory=list)
+    fixed: int = 0
+
+
+async def reconcile_task_stats(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    fix: bool = False,
+    workspace_id: uuid.UUID | None = None,
+) -> ReconcileReport:
+    """Compare workspace_task_stats with a full recount and optionally repair it.
+
+    Detection reads both sides from one snapshot. Each drifted workspace is
+    then repaired separately: its stats row is created if missing and
+    locked first, so concurrent task writes in that workspace wait, and the
+    recount is taken after the lock so it includes everything they committed.
+    """
+    report = ReconcileReport()
+    actual_query = _actual_counts_query()
+    if workspace_id is not None:
+        actual_query = actual_query.where(Task.workspace_id == workspace_id)
+
+    async with session_factory() as db:
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        actual = {row.workspace_id: row for row in (await db.execute(actual_query)).all()}
+        stored_query = select(WorkspaceTaskStats)
+        if workspace_id is not None:
+            stored_query = stored_query.where(WorkspaceTaskStats.workspace_id == workspace_id)
+        stored = {row.workspace_id: row for row in (await db.execute(stored_query)).scalars()}
+        await db.rollback()
+
+    for ws_id in actual.keys() | stored.keys():
+        report.workspaces_checked += 1
+        expected = {name: getattr(actual[ws_id], name) if ws_id in actual else 0 for name in COUNTER_FIELDS}
+        current = {name: getattr(stored[ws_id], name) if ws_id in stored else 0 for name in COUNTER_FIELDS}
+        if expected != current:
+            report.drifted.append({"workspace_id": str(ws_id), "stored": current, "actual": expected})
+
+    if not fix:
+        return report
+
+    for drift in report.drifted:
+        ws_id = uuid.UUID(drift["workspace_id"])
+        async with session_factory() as db:
+            # Make sure there is a row to lock: FOR UPDATE on a missing row
+            # locks nothing, and a trigger upsert could then race the rewrite.
+            # Workspaces being deleted are left without one.
+            await db.execute(
+                insert(WorkspaceTaskStats)
+                .from_select(
+                    ["workspace_id"],
+                    select(Workspace.id).where(Workspace.id == ws_id, Workspace.deleting_at.is_(None)),
+                )
+                .on_conflict_do_nothing(index_elements=[WorkspaceTaskStats.workspace_id])
+            )
+            locked = await db.scalar(
+                select(WorkspaceTaskStats.workspace_id)
+                .where(WorkspaceTaskStats.workspace_id == ws_id)
+                .with_for_update()
+            )
+            if locked is None:
+                await db.rollback()
+                continue
+            row = (await db.execute(_actual_counts_query().where(Task.workspace_id == ws_id))).one_or_none()
+            values = {name: getattr(row, name) if row else 0 for name in COUNTER_FIELDS}
+            await db.execute(
+                update(WorkspaceTaskStats)
+                .where(WorkspaceTaskStats.workspace_id == ws_id)
+                .values(**values, updated_at=func.now())
+            )
+            await db.commit()
+            report.fixed += 1
+    return report
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import ColumnElement, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.revocation import revoked_tokens
+from app.db.session import async_session
+from app.models.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant shared by every worker so only one of them purges at a time.
+JANITOR_ADVISORY_LOCK_ID = 7_420_315_001
+
+
+@dataclass
+class PurgeReport:
+    expired_deleted: int = 0
+    revoked_deleted: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    skipped: bool = False
+
+    @property
+    def total_deleted(self) -> int:
+        return self.expired_deleted + self.revoked_deleted
+
+
+async def _delete_batch(
+    db: AsyncSession,
+    condition: ColumnElement[bool],
+    batch_size: int,
+) -> int | None:
+    """Delete one batch; returns None if another worker holds the janitor lock."""
+    locked = await db.scalar(select(func.pg_try_advisory_xact_lock(JANITOR_ADVISORY_LOCK_ID)))
+    if not locked:
+        return None
+
+    batch = (
+        select(RefreshToken.id)
+        .where(condition)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.id.in_(batch))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def purge_refresh_tokens(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> PurgeReport:
+    """Delete expired and long-revoked refresh tokens in bounded batches.
+
+    Each batch is its own short transaction, followed by a pause, so the
+    purge never holds locks for long and its I/O rate stays bounded.
+    """
+    batch_size = batch_size or settings.TOKEN_JANITOR_BATCH_SIZE
+    if pause_seconds is None:
+        pause_seconds = settings.TOKEN_JANITOR_BATCH_PAUSE_SECONDS
+
+    now = datetime.now(timezone.utc)
+    revoked_cutoff = now - timedelta(hours=settings.TOKEN_JANITOR_REVOKED_RETENTION_HOURS)
+    passes = (
+        ("expired_deleted", RefreshToken.revoked_at.is_(None) & (RefreshToken.expires_at < now)),
+        ("revoked_deleted", RefreshToken.revoked_at.is_not(None) & (RefreshToken.revoked_at < revoked_cutoff)),
+    )
+
+    report = PurgeReport()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        for counter, condition in passes:
+            while True:
+                deleted = await _delete_batch(db, condition, batch_size)
+                if deleted is None:
+                    report.skipped = True
+                    break
+                report.batches += 1
+                setattr(report, counter, getattr(report, counter) + deleted)
+                if deleted < batch_size:
+                    break
+                await asyncio.sleep(pause_seconds)
+            if report.skipped:
+                break
+
+    report.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return report
+
+
+async def run_token_janitor() -> None:
+    """Purge refresh tokens forever; started from the application lifespan."""
+    while True:
+        revoked_tokens.prune()
+        try:
+            report = await purge_refresh_tokens()
+        except Exception:
+            logger.exception("Refresh token purge failed")
+        else:
+            if not report.skipped:
+                logger.info(
+                    "Purged %d refresh tokens (%d expired, %d revoked) in %.3fs, %d batches",
+                    report.total_deleted,
+                    report.expired_deleted,
+                    report.revoked_deleted,
+                    report.elapsed_seconds,
+                    report.batches,
+                )
+        await asyncio.sleep(settings.TOKEN_JANITOR_INTERVAL_SECONDS)
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.dependencies import invalidate_membership
+from app.db.session import async_session
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.models.task_change import TaskChange
+from app.models.workspace import Workspace
+from app.models.workspace_deletion import WorkspaceDeletion
+from app.models.workspace_task_stats import WorkspaceTaskStats
+from app.models.workspacemember import WorkspaceMember
+from app.services.task_events import TASK_EVENTS_CHANNEL, WORKSPACE_DELETED_TYPE
+
+logger = logging.getLogger(__name__)
+
+# Emptied in this order, one table per batch. The workspace row goes last;
+# its cascade then only finds rows of small tables, or stragglers written
+# by requests that passed the membership check just before the deletion.
+DELETION_PHASES = (
+    ("tasks_deleted", Task, (Task.id,)),
+    ("archived_deleted", TaskArchive, (TaskArchive.id,)),
+    ("changes_deleted", TaskChange, (TaskChange.task_id,)),
+    ("members_deleted", WorkspaceMember, (WorkspaceMember.id,)),
+)
+
+
+@dataclass
+class WorkspaceDeletionReport:
+    batches: int = 0
+    workspaces_finished: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def _workspace_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Workspace not found",
+    )
+
+
+async def request_workspace_deletion(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> WorkspaceDeletion:
+    """Hide the workspace and queue its rows for the workspace deleter.
+
+    Only catalog-sized work happens here. The stats row is removed along
+    with the mark, so the task triggers stay silent while the deleter
+    works: no counters, change log entries or notifications for rows that
+    are going away. The NOTIFY tells every worker to drop cached
+    memberships of the workspace.
+    """
+    marked = await db.scalar(
+        update(Workspace)
+        .where(Workspace.id == workspace_id, Workspace.deleting_at.is_(None))
+        .values(deleting_at=func.now())
+        .returning(Workspace.id)
+    )
+    if marked is None:
+        raise _workspace_not_found()
+
+    tasks_total = await db.scalar(
+        delete(WorkspaceTaskStats)
+        .where(WorkspaceTaskStats.workspace_id == workspace_id)
+        .returning(WorkspaceTaskStats.open_count + WorkspaceTaskStats.completed_count)
+    )
+    deletion = WorkspaceDeletion(
+        workspace_id=workspace_id,
+        requested_by=user_id,
+        tasks_total=tasks_total or 0,
+    )
+    db.add(deletion)
+    payload = json.dumps({"type": WORKSPACE_DELETED_TYPE, "workspace_id": str(workspace_id)})
+    await db.execute(select(func.pg_notify(TASK_EVENTS_CHANNEL, payload)))
+    await db.commit()
+    invalidate_membership(workspace_id)
+
+    await db.refresh(deletion)
+    return deletion
+
+
+async def get_workspace_deletion(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> WorkspaceDeletion:
+    """Deletion progress, visible to the user who requested it."""
+    deletion = await db.get(WorkspaceDeletion, workspace_id)
+    if deletion is None or deletion.requested_by != user_id:
+        raise _workspace_not_found()
+    return deletion
+
+
+async def delete_workspace_batch(db: AsyncSession, batch_size: int) -> WorkspaceDeletion | None:
+    """Advance one pending deletion by one batch; None when nothing is pending.
+
+    The deletion row is locked with SKIP LOCKED, so concurrent deleters
+    work on different workspaces, and the batch commits together with its
+    progress counters: after a crash the next run simply continues.
+    """
+    deletion = await db.scalar(
+        select(WorkspaceDeletion)
+        .where(WorkspaceDeletion.finished_at.is_(None))
+        .order_by(WorkspaceDeletion.requested_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .execution_options(populate_existing=True)
+    )
+    if deletion is None:
+        await db.rollback()
+        return None
+
+    for counter, model, keys in DELETION_PHASES:
+        batch = select(*keys).where(model.workspace_id == deletion.workspace_id).limit(batch_size)
+        result = await db.execute(
+            delete(model)
+            .where(model.workspace_id == deletion.workspace_id, tuple_(*keys).in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            setattr(deletion, counter, getattr(deletion, counter) + result.rowcount)
+            break
+    else:
+        await db.execute(delete(Workspace).where(Workspace.id == deletion.workspace_id))
+        deletion.finished_at = datetime.now(timezone.utc)
+
+    deletion.batches += 1
+    await db.commit()
+    return deletion
+
+
+async def delete_pending_workspaces(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> WorkspaceDeletionReport:
+    """Run pending workspace deletions until none is left for this worker.
+
+    Each batch is its own short transaction followed by a pause, which
+    bounds lock time and WAL rate however large the workspace is.
+    """
+    batch_size = batch_size or settings.WORKSPACE_DELETION_BATCH_SIZE
+    if pause_seconds is None:
+        pause_seconds = settings.WORKSPACE_DELETION_BATCH_PAUSE_SECONDS
+
+    report = WorkspaceDeletionReport()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        while (deletion := await delete_workspace_batch(db, batch_size)) is not None:
+            report.batches += 1
+            if deletion.finished_at is not None:
+                report.workspaces_finished += 1
+                logger.info(
+                    "Deleted workspace %s: %d tasks, %d members in %d batches",
+                    deletion.workspace_id,
+                    deletion.tasks_deleted,
+                    deletion.members_deleted,
+                    deletion.batches,
+                )
+            await asyncio.sleep(pause_seconds)
+
+    report.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return report
+
+
+async def run_workspace_deleter() -> None:
+    """Process workspace deletions forever; started from the application lifespan."""
+    while True:
+        try:
+            await delete_pending_workspaces()
+        except Exception:
+            logger.exception("Workspace deletion failed")
+        await asyncio.sleep(settings.WORKSPACE_DELETION_INTERVAL_SECONDS)
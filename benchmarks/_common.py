@@ -0,0 +1,51 @@
+import statistics
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (pct in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples_ms: list[float]) -> dict[str, float]:
+    """Return count and p50/p95/p99/max for a list of latencies in ms."""
+    return {
+        "count": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 3) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if samples_ms else 0.0,
+    }
+
+
+def print_table(title: str, rows: dict[str, dict[str, float]]) -> None:
+    print(f"\n{title}")
+    for name, summary in rows.items():
+        cells = "  ".join(f"{key}={value}" for key, value in summary.items())
+        print(f"  {name:<24} {cells}")
+
+
+class QueryCounter:
+    """Count statements sent through the application's engine."""
+
+    def __init__(self, engine) -> None:
+        self._engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        from sqlalchemy import event
+
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        from sqlalchemy import event
+
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
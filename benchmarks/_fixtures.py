@@ -0,0 +1,66 @@
+import uuid
+
+from sqlalchemy import text
+
+from app.core.security import create_access_token
+from app.db.session import async_session
+
+SEED_TASKS_SQL = text(
+    """
+    INSERT INTO tasks (workspace_id, user_id, number, title, priority, is_completed, created_at)
+    SELECT :workspace_id, :user_id, n, 'task ' || n,
+           1 + n % 3,
+           n % 4 = 0,
+           now() - make_interval(secs => n)
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+SEED_COUNTER_SQL = text(
+    "INSERT INTO workspace_task_counters (workspace_id, next_number) VALUES (:workspace_id, :count + 1)"
+)
+
+
+async def seed_workspace(task_count: int = 0) -> tuple[uuid.UUID, uuid.UUID]:
+    """Create a user owning a fresh workspace with task_count synthetic tasks.
+
+    Returns (workspace_id, user_id); pass them to ``cleanup`` when done.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    async with async_session() as db:
+        user_id = await db.scalar(
+            text(
+                "INSERT INTO users (email, username, hashed_password) "
+                "VALUES (:email, :username, 'x') RETURNING id"
+            ),
+            {"email": f"bench-{suffix}@example.com", "username": f"bench_{suffix}"},
+        )
+        workspace_id = await db.scalar(
+            text("INSERT INTO workspaces (name, key) VALUES (:name, :key) RETURNING id"),
+            {"name": f"bench {suffix}", "key": suffix[:10].upper()},
+        )
+        await db.execute(
+            text("INSERT INTO workspace_members (workspace_id, user_id, role) VALUES (:w, :u, 'OWNER')"),
+            {"w": workspace_id, "u": user_id},
+        )
+        if task_count:
+            params = {"workspace_id": workspace_id, "user_id": user_id, "count": task_count}
+            await db.execute(SEED_TASKS_SQL, params)
+            await db.execute(SEED_COUNTER_SQL, params)
+        await db.commit()
+        if task_count:
+            await db.execute(text("ANALYZE tasks"))
+            await db.commit()
+    return workspace_id, user_id
+
+
+async def cleanup(workspace_id: uuid.UUID, user_id: uuid.UUID) -> None:
+    async with async_session() as db:
+        await db.execute(text("DELETE FROM workspaces WHERE id = :id"), {"id": workspace_id})
+        await db.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+        await db.commit()
+
+
+def auth_headers(user_id: uuid.UUID) -> dict[str, str]:
+    token = create_access_token({"sub": str(user_id)})
+    return {"Authorization": f"Bearer {token}"}
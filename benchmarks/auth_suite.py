@@ -0,0 +1,215 @@
+"""Load test of the auth endpoints through the in-process ASGI app.
+
+Drives ``/auth/register``, ``/auth/login``, ``/auth/refresh``,
+``/auth/logout`` and ``/auth/logout-all`` against the PostgreSQL database
+from DATABASE_URL (migrations applied) and reports, per endpoint,
+throughput, p50/p95/p99 latency and SQL statements per request. Results
+are written as JSON so runs on different commits can be compared:
+
+    python -m benchmarks.auth_suite --users 500 --concurrency 32 --output before.json
+    python -m benchmarks.auth_suite --users 500 --concurrency 32 --compare before.json
+
+With ``--compare`` the process exits with status 1 if any endpoint's
+throughput drops or p95 latency grows by more than ``--threshold``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.config import settings
+from app.core import security
+from app.db.session import engine
+from app.main import app
+from benchmarks._common import QueryCounter, latency_summary, print_table
+
+PASSWORD = "benchmark-password"
+
+
+class Phase:
+    def __init__(self, concurrency: int) -> None:
+        self.slots = asyncio.Semaphore(concurrency)
+        self.samples: list[float] = []
+        self.errors = 0
+
+    async def call(self, request: Callable[[], Awaitable[httpx.Response]], expected: int) -> httpx.Response:
+        async with self.slots:
+            started = time.perf_counter()
+            response = await request()
+            self.samples.append((time.perf_counter() - started) * 1000)
+        if response.status_code != expected:
+            self.errors += 1
+        return response
+
+
+async def _measure(name: str, concurrency: int, calls, results: dict) -> list[httpx.Response]:
+    phase = Phase(concurrency)
+    with QueryCounter(engine) as queries:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(phase.call(request, expected) for request, expected in calls))
+        elapsed = time.perf_counter() - started
+
+    summary = latency_summary(phase.samples)
+    summary["requests_per_s"] = round(len(calls) / elapsed, 1) if elapsed else 0.0
+    summary["queries_per_request"] = round(queries.count / len(calls), 2) if calls else 0.0
+    summary["errors"] = phase.errors
+    results[name] = summary
+    return list(responses)
+
+
+async def run_suite(args: argparse.Namespace) -> dict[str, dict]:
+    run_id = uuid.uuid4().hex[:8]
+    users = [
+        {
+            "email": f"suite-{run_id}-{n}@example.com",
+            "username": f"suite_{run_id}_{n}",
+            "password": PASSWORD,
+        }
+        for n in range(args.users)
+    ]
+    results: dict[str, dict] = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _measure(
+                "POST /auth/register",
+                args.concurrency,
+                [(lambda u=u: client.post("/auth/register", json=u), 201) for u in users],
+                results,
+            )
+
+            logins = await _measure(
+                "POST /auth/login",
+                args.concurrency,
+                [
+                    (lambda u=u: client.post("/auth/login", json={"email": u["email"], "password": PASSWORD}), 200)
+                    for u in users
+                ],
+                results,
+            )
+            tokens = [response.json() for response in logins if response.status_code == 200]
+
+            await _measure(
+                "POST /auth/refresh",
+                args.concurrency,
+                [
+                    (lambda t=t: client.post("/auth/refresh", json={"refresh_token": t["refresh_token"]}), 200)
+                    for t in tokens
+                ],
+                results,
+            )
+
+            half = len(tokens) // 2
+            await _measure(
+                "POST /auth/logout",
+                args.concurrency,
+                [
+                    (lambda t=t: client.post("/auth/logout", json={"refresh_token": t["refresh_token"]}), 200)
+                    for t in tokens[:half]
+                ],
+                results,
+            )
+
+            await _measure(
+                "POST /auth/logout-all",
+                args.concurrency,
+                [
+                    (
+                        lambda t=t: client.post(
+                            "/auth/logout-all",
+                            headers={"Authorization": f"Bearer {t['access_token']}"},
+                        ),
+                        200,
+                    )
+                    for t in tokens[half:]
+                ],
+                results,
+            )
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Return human-readable regressions of current against baseline."""
+    regressions = []
+    for endpoint, now in current.items():
+        before = baseline.get(endpoint)
+        if not before:
+            continue
+        if before["requests_per_s"] and now["requests_per_s"] < before["requests_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{endpoint}: throughput {before['requests_per_s']} -> {now['requests_per_s']} req/s"
+            )
+        if before["p95_ms"] and now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(f"{endpoint}: p95 {before['p95_ms']} -> {now['p95_ms']} ms")
+        if now["queries_per_request"] > before["queries_per_request"]:
+            regressions.append(
+                f"{endpoint}: queries/request {before['queries_per_request']} -> {now['queries_per_request']}"
+            )
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--real-hash", action="store_true", help="keep the configured argon2 cost")
+    parser.add_argument("--output", type=Path, default=Path("bench_auth.json"))
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    settings.LOGIN_RATE_LIMIT_ENABLED = False
+    settings.TOKEN_JANITOR_ENABLED = False
+    if not args.real_hash:
+        security.pwd_context = security.build_pwd_context(time_cost=1, memory_cost=1024, parallelism=1)
+
+    results = await run_suite(args)
+    await engine.dispose()
+
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "users": args.users,
+            "concurrency": args.concurrency,
+            "real_hash": args.real_hash,
+            "write_behind": settings.REFRESH_TOKEN_WRITE_BEHIND,
+        },
+        "endpoints": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print_table(f"auth suite ({args.users} users, concurrency {args.concurrency})", results)
+    print(f"\nresults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["endpoints"], args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions against {args.compare} (commit {baseline.get('commit')})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,94 @@
+"""Latency of an unrelated endpoint while argon2 work runs on the same loop.
+
+Simulates a login storm by running many password verifications concurrently
+and, at the same time, probing ``GET /`` through the in-process ASGI app.
+The storm is run twice: once calling ``verify_password`` inline (the old
+behaviour) and once through ``verify_password_async``.
+
+    python -m benchmarks.login_storm --logins 200 --probe-interval-ms 5
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.security import (
+    PasswordHashQueueFull,
+    hash_password,
+    shutdown_hash_executor,
+    verify_password,
+    verify_password_async,
+)
+from app.main import app
+from benchmarks._common import latency_summary, print_table
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _probe(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> list[float]:
+    samples: list[float] = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/")
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def _blocking_login(hashed: str) -> bool:
+    verify_password(PASSWORD, hashed)
+    await asyncio.sleep(0)
+    return True
+
+
+async def _offloaded_login(hashed: str) -> bool:
+    """True if the password was verified, False if the queue rejected it (a 503)."""
+    try:
+        await verify_password_async(PASSWORD, hashed)
+    except PasswordHashQueueFull:
+        return False
+    return True
+
+
+async def _run(mode: str, logins: int, interval: float, hashed: str) -> dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, stop, interval))
+        login = _blocking_login if mode == "inline" else _offloaded_login
+
+        started = time.perf_counter()
+        verified = sum(await asyncio.gather(*(login(hashed) for _ in range(logins))))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        samples = await probe
+
+    summary = latency_summary(samples)
+    # Throughput counts verified logins only; rejections are instant.
+    summary["logins_per_s"] = round(verified / elapsed, 1)
+    summary["rejected"] = logins - verified
+    return summary
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probe-interval-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    hashed = hash_password(PASSWORD)
+    interval = args.probe_interval_ms / 1000
+    results = {
+        "inline verify_password": await _run("inline", args.logins, interval, hashed),
+        "verify_password_async": await _run("async", args.logins, interval, hashed),
+    }
+    shutdown_hash_executor()
+    print_table(f"GET / latency during {args.logins} concurrent logins", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Logins per second through ``POST /auth/login`` with refresh-token
+write-behind off and on.
+
+Needs the database from DATABASE_URL with migrations applied. By default
+argon2 is switched to minimal parameters so the numbers reflect the
+database work rather than password hashing; pass ``--real-hash`` to keep
+the configured cost.
+
+    python -m benchmarks.login_throughput --logins 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from app.config import settings
+from app.core import security
+from app.db.session import engine
+from app.main import app
+from app.services.refresh_token_writer import refresh_token_writer
+from benchmarks._common import QueryCounter, latency_summary, print_table
+
+PASSWORD = "benchmark-password"
+
+
+async def _run(client: httpx.AsyncClient, email: str, args: argparse.Namespace) -> dict[str, float]:
+    slots = asyncio.Semaphore(args.concurrency)
+    samples: list[float] = []
+
+    async def login() -> None:
+        async with slots:
+            started = time.perf_counter()
+            response = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+            samples.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.text
+
+    with QueryCounter(engine) as queries:
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        await refresh_token_writer.flush()
+        elapsed = time.perf_counter() - started
+
+    summary = latency_summary(samples)
+    summary["logins_per_s"] = round(args.logins / elapsed, 1)
+    summary["statements_per_login"] = round(queries.count / args.logins, 2)
+    return summary
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--real-hash", action="store_true")
+    args = parser.parse_args()
+
+    settings.LOGIN_RATE_LIMIT_ENABLED = False
+    if not args.real_hash:
+        security.pwd_context = security.build_pwd_context(time_cost=1, memory_cost=1024, parallelism=1)
+
+    suffix = uuid.uuid4().hex[:8]
+    email = f"bench-login-{suffix}@example.com"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post(
+            "/auth/register",
+            json={"email": email, "username": f"bench_login_{suffix}", "password": PASSWORD},
+        )
+        assert response.status_code == 201, response.text
+
+        results = {}
+        settings.REFRESH_TOKEN_WRITE_BEHIND = False
+        results["write-behind off"] = await _run(client, email, args)
+
+        settings.REFRESH_TOKEN_WRITE_BEHIND = True
+        refresh_token_writer.start()
+        results["write-behind on"] = await _run(client, email, args)
+        await refresh_token_writer.stop()
+
+    print_table(f"POST /auth/login x{args.logins}, concurrency {args.concurrency}", results)
+    security.shutdown_hash_executor()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Registrations per second through ``POST /auth/register``.
+
+Needs the database from DATABASE_URL with migrations applied. Run it on
+two commits to compare implementations; the statement count per
+registration is printed alongside the throughput.
+
+    python -m benchmarks.register --users 500 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from app.db.session import engine
+from app.main import app
+from benchmarks._common import QueryCounter, latency_summary, print_table
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    run_id = uuid.uuid4().hex[:8]
+    slots = asyncio.Semaphore(args.concurrency)
+    samples: list[float] = []
+
+    async def register(client: httpx.AsyncClient, n: int) -> None:
+        payload = {
+            "email": f"bench-{run_id}-{n}@example.com",
+            "username": f"bench_{run_id}_{n}",
+            "password": "benchmark-password",
+        }
+        async with slots:
+            started = time.perf_counter()
+            response = await client.post("/auth/register", json=payload)
+            samples.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 201, response.text
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        with QueryCounter(engine) as queries:
+            started = time.perf_counter()
+            await asyncio.gather(*(register(client, n) for n in range(args.users)))
+            elapsed = time.perf_counter() - started
+
+    summary = latency_summary(samples)
+    summary["registrations_per_s"] = round(args.users / elapsed, 1)
+    summary["statements_per_registration"] = round(queries.count / args.users, 2)
+    print_table("POST /auth/register", {"register": summary})
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
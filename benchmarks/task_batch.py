@@ -0,0 +1,73 @@
+"""Throughput of the batch task endpoints at batch sizes 1, 100 and 10k.
+
+For each batch size, sends enough requests to create ``--tasks`` tasks
+through ``POST /workspaces/{id}/tasks/batch``, then updates and completes
+them through the PATCH and complete endpoints. Needs the database from
+DATABASE_URL with migrations applied; the workspace is deleted afterwards.
+
+    python -m benchmarks.task_batch --tasks 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.db.session import engine
+from app.main import app
+from benchmarks._common import print_table
+from benchmarks._fixtures import auth_headers, cleanup, seed_workspace
+
+
+async def _timed(client: httpx.AsyncClient, method: str, url: str, batches: list, headers: dict) -> tuple[float, list]:
+    ids = []
+    started = time.perf_counter()
+    for batch in batches:
+        response = await client.request(method, url, json=batch, headers=headers)
+        response.raise_for_status()
+        ids.extend(item["id"] for item in response.json()["results"] if item["ok"])
+    return time.perf_counter() - started, ids
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace()
+    headers = auth_headers(user_id)
+    url = f"/workspaces/{workspace_id}/tasks/batch"
+    results: dict[str, dict] = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for size in args.sizes:
+                payloads = [{"title": f"batch {size} #{n}", "priority": "high"} for n in range(args.tasks)]
+                create_s, ids = await _timed(client, "POST", url, _chunks(payloads, size), headers)
+
+                updates = [{"id": task_id, "title": "renamed", "due_date": None} for task_id in ids]
+                update_s, _ = await _timed(client, "PATCH", url, _chunks(updates, size), headers)
+
+                completes = [{"ids": chunk} for chunk in _chunks(ids, size)]
+                complete_s, _ = await _timed(client, "POST", f"{url}/complete", completes, headers)
+
+                results[f"batch size {size}"] = {
+                    "create_per_s": round(len(ids) / create_s, 1),
+                    "update_per_s": round(len(ids) / update_s, 1),
+                    "complete_per_s": round(len(ids) / complete_s, 1),
+                }
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+    print_table(f"{args.tasks:,} tasks per batch size", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
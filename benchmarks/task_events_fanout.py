@@ -0,0 +1,111 @@
+"""Fan-out latency of task change events to thousands of local subscribers.
+
+Subscribes ``--subscribers`` simulated clients spread over ``--workspaces``
+workspaces to a TaskEventHub, publishes ``--events`` change events round
+robin across the workspaces, and measures the time from publish to each
+subscriber receiving the event. ``--slow`` of the subscribers sleep
+between reads to show that a slow consumer only loses its own (oldest)
+events. By default events are handed to the hub in-process; with
+``--notify`` they go through ``pg_notify`` and the hub's LISTEN
+connection, which needs the database from DATABASE_URL.
+
+    python -m benchmarks.task_events_fanout --subscribers 5000 --workspaces 50
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.db.session import async_session, engine
+from app.services.task_events import TASK_EVENTS_CHANNEL, TaskEventHub
+from benchmarks._common import latency_summary, print_table
+
+NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+
+
+async def _subscriber(hub: TaskEventHub, workspace_id: uuid.UUID, received: list, delay: float) -> None:
+    subscription = hub.subscribe(workspace_id)
+    try:
+        while True:
+            payload = await subscription.get()
+            received.append((payload, time.perf_counter()))
+            if delay:
+                await asyncio.sleep(delay)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--workspaces", type=int, default=50)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--slow", type=float, default=0.01, help="fraction of subscribers that read slowly")
+    parser.add_argument("--notify", action="store_true", help="publish through PostgreSQL NOTIFY")
+    args = parser.parse_args()
+
+    hub = TaskEventHub(queue_size=args.queue_size)
+    workspaces = [uuid.uuid4() for _ in range(args.workspaces)]
+    slow_every = round(1 / args.slow) if args.slow else 0
+    fast_received: list[tuple[str, float]] = []
+    slow_received: list[tuple[str, float]] = []
+    subscribers = [
+        asyncio.create_task(
+            _subscriber(hub, workspaces[n % len(workspaces)], slow_received, 0.05)
+            if slow_every and n % slow_every == 0
+            else _subscriber(hub, workspaces[n % len(workspaces)], fast_received, 0)
+        )
+        for n in range(args.subscribers)
+    ]
+    await asyncio.sleep(0)
+
+    if args.notify:
+        hub.start()
+        await asyncio.sleep(1)  # let the listener connect
+
+    sent_at: dict[str, float] = {}
+    try:
+        async with async_session() as db:
+            for version in range(1, args.events + 1):
+                workspace_id = workspaces[version % len(workspaces)]
+                payload = json.dumps(
+                    {"type": "changed", "workspace_id": str(workspace_id), "version": version}
+                )
+                sent_at[payload] = time.perf_counter()
+                if args.notify:
+                    await db.execute(NOTIFY_SQL, {"channel": TASK_EVENTS_CHANNEL, "payload": payload})
+                    await db.commit()
+                else:
+                    hub.publish(payload)
+                await asyncio.sleep(args.interval_ms / 1000)
+        await asyncio.sleep(1)
+        stats = hub.stats()
+    finally:
+        for task in subscribers:
+            task.cancel()
+        await asyncio.gather(*subscribers, return_exceptions=True)
+        await hub.stop()
+        await engine.dispose()
+
+    def latencies(received: list[tuple[str, float]]) -> list[float]:
+        return [(at - sent_at[payload]) * 1000 for payload, at in received if payload in sent_at]
+
+    print_table(
+        f"{args.subscribers:,} subscribers, {args.workspaces} workspaces, {args.events} events"
+        f" ({'NOTIFY' if args.notify else 'in-process'})",
+        {
+            "fast subscribers": latency_summary(latencies(fast_received)),
+            "slow subscribers": latency_summary(latencies(slow_received)),
+            "hub": stats,
+        },
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
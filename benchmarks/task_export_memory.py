@@ -0,0 +1,75 @@
+"""Peak memory of the streaming task export for small and large workspaces.
+
+Seeds one workspace per size, then drains ``stream_task_export`` (the
+generator behind ``GET /workspaces/{id}/tasks/export``) and records the
+peak Python heap via tracemalloc plus the growth of process max RSS.
+The peak should stay flat as the workspace grows. Exits with status 1 if
+the largest export peaks more than ``--tolerance`` times above the
+smallest. Needs the database from DATABASE_URL with migrations applied.
+
+    python -m benchmarks.task_export_memory --sizes 1000 1000000 --format csv --gzip
+"""
+
+import argparse
+import asyncio
+import resource
+import sys
+import time
+import tracemalloc
+
+from app.db.session import engine
+from app.services.task_export import stream_task_export
+from benchmarks._common import print_table
+from benchmarks._fixtures import cleanup, seed_workspace
+
+
+def _max_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _drain(workspace_id, fmt: str, compress: bool) -> dict[str, float]:
+    rss_before = _max_rss_mib()
+    tracemalloc.start()
+    total_bytes = 0
+    started = time.perf_counter()
+    async for chunk in stream_task_export(workspace_id, fmt, compress=compress):
+        total_bytes += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 2),
+        "heap_peak_mib": round(peak / 2**20, 2),
+        "max_rss_growth_mib": round(_max_rss_mib() - rss_before, 2),
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 1_000_000])
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    for size in sorted(args.sizes):
+        workspace_id, user_id = await seed_workspace(size)
+        try:
+            results[f"{size:,} tasks"] = await _drain(workspace_id, args.format, args.gzip)
+        finally:
+            await cleanup(workspace_id, user_id)
+    await engine.dispose()
+
+    print_table(f"{args.format} export{' (gzip)' if args.gzip else ''}", results)
+    peaks = [summary["heap_peak_mib"] for summary in results.values()]
+    if peaks[-1] > peaks[0] * args.tolerance:
+        print(f"FAIL: heap peak grew from {peaks[0]} to {peaks[-1]} MiB")
+        return 1
+    print("OK: heap peak is independent of workspace size")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
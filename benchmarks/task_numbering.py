@@ -0,0 +1,136 @@
+"""Insert throughput with many writers numbering tasks in one workspace.
+
+Runs ``--writers`` concurrent writers for ``--seconds`` against a single
+fresh workspace, each inserting ``--batch`` tasks per transaction, with
+two numbering strategies: the counter row (``reserve_task_numbers``,
+what the API uses) and a naive ``MAX(number) + 1`` that retries when the
+unique index rejects a duplicate. Afterwards checks that the numbers are
+unique and reports gaps. Concurrency at the database is capped by the
+engine's pool (pool_size + max_overflow). Needs the database from
+DATABASE_URL with migrations applied; the workspace is deleted afterwards.
+
+    python -m benchmarks.task_numbering --writers 64 --seconds 10
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.db.session import async_session, engine
+from app.repositories.task import insert_tasks, reserve_task_numbers
+from benchmarks._common import latency_summary, print_table
+from benchmarks._fixtures import cleanup, seed_workspace
+
+MAX_PLUS_ONE_SQL = text(
+    """
+    INSERT INTO tasks (workspace_id, user_id, number, title)
+    SELECT :workspace_id, :user_id,
+           (SELECT coalesce(max(number), 0) FROM tasks WHERE workspace_id = :workspace_id) + n,
+           'task'
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+NUMBERS_SQL = text(
+    "SELECT count(*), count(DISTINCT number), coalesce(max(number), 0) - coalesce(min(number), 1) + 1 "
+    "FROM tasks WHERE workspace_id = :workspace_id"
+)
+
+
+async def _counter_batch(db, workspace_id, user_id, count: int) -> int:
+    first = await reserve_task_numbers(db, workspace_id, count)
+    await insert_tasks(
+        db,
+        [
+            {"workspace_id": workspace_id, "user_id": user_id, "number": first + n, "title": "task"}
+            for n in range(count)
+        ],
+    )
+    await db.commit()
+    return 0
+
+
+async def _max_plus_one_batch(db, workspace_id, user_id, count: int) -> int:
+    retries = 0
+    while True:
+        try:
+            await db.execute(
+                MAX_PLUS_ONE_SQL,
+                {"workspace_id": workspace_id, "user_id": user_id, "count": count},
+            )
+            await db.commit()
+            return retries
+        except IntegrityError:
+            await db.rollback()
+            retries += 1
+
+
+async def _writer(
+    insert_batch,
+    workspace_id,
+    user_id,
+    batch: int,
+    deadline: float,
+) -> tuple[list[float], int, int]:
+    latencies: list[float] = []
+    inserted = retries = 0
+    async with async_session() as db:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            retries += await insert_batch(db, workspace_id, user_id, batch)
+            latencies.append((time.perf_counter() - started) * 1000)
+            inserted += batch
+    return latencies, inserted, retries
+
+
+async def _run(insert_batch, args: argparse.Namespace) -> dict:
+    workspace_id, user_id = await seed_workspace()
+    try:
+        started = time.perf_counter()
+        deadline = started + args.seconds
+        results = await asyncio.gather(
+            *(
+                _writer(insert_batch, workspace_id, user_id, args.batch, deadline)
+                for _ in range(args.writers)
+            )
+        )
+        elapsed = time.perf_counter() - started
+        async with async_session() as db:
+            rows, distinct, span = (await db.execute(NUMBERS_SQL, {"workspace_id": workspace_id})).one()
+    finally:
+        await cleanup(workspace_id, user_id)
+
+    inserted = sum(result[1] for result in results)
+    return {
+        "tasks_per_second": round(inserted / elapsed, 1),
+        **latency_summary([latency for result in results for latency in result[0]]),
+        "retries": sum(result[2] for result in results),
+        "duplicates": rows - distinct,
+        "gaps": span - distinct,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--batch", type=int, default=1, help="tasks per transaction")
+    args = parser.parse_args()
+
+    try:
+        counter = await _run(_counter_batch, args)
+        max_plus_one = await _run(_max_plus_one_batch, args)
+    finally:
+        await engine.dispose()
+
+    print_table(
+        f"{args.writers} writers, one workspace, {args.batch} task(s) per transaction, {args.seconds:g}s",
+        {"counter row": counter, "MAX(number) + 1": max_plus_one},
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Keyset vs OFFSET latency at increasing page depth.
+
+Seeds a throwaway workspace with ``--tasks`` synthetic tasks in the
+database from DATABASE_URL, then times fetching one page at several
+depths with the keyset repository query and with the equivalent
+LIMIT/OFFSET query. The workspace is deleted afterwards.
+
+    python -m benchmarks.task_pagination --tasks 500000 --page-size 50
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import select
+
+from app.db.session import async_session, engine
+from app.models.task import Task
+from app.repositories.task import TaskKey, list_tasks
+from benchmarks._common import latency_summary, print_table
+from benchmarks._fixtures import cleanup, seed_workspace
+
+
+def _ordered(workspace_id: uuid.UUID):
+    return (
+        select(Task)
+        .where(Task.workspace_id == workspace_id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+    )
+
+
+async def measure(workspace_id: uuid.UUID, depth: int, page_size: int, repeats: int) -> dict[str, dict]:
+    keyset_ms: list[float] = []
+    offset_ms: list[float] = []
+    async with async_session() as db:
+        anchor = (await db.execute(_ordered(workspace_id).offset(depth - 1).limit(1))).scalar_one()
+        after = TaskKey(created_at=anchor.created_at, id=anchor.id)
+
+        for _ in range(repeats):
+            started = time.perf_counter()
+            await list_tasks(db, workspace_id, limit=page_size, after=after)
+            keyset_ms.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            (await db.execute(_ordered(workspace_id).offset(depth).limit(page_size))).scalars().all()
+            offset_ms.append((time.perf_counter() - started) * 1000)
+            db.expunge_all()
+
+    return {
+        f"keyset  @ row {depth:>9,}": latency_summary(keyset_ms),
+        f"offset  @ row {depth:>9,}": latency_summary(offset_ms),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace(args.tasks)
+    try:
+        results: dict[str, dict] = {}
+        depth = 1
+        while depth < args.tasks - args.page_size:
+            results.update(await measure(workspace_id, depth, args.page_size, args.repeats))
+            depth *= 10
+        print_table(f"page of {args.page_size} from {args.tasks:,} tasks", results)
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,198 @@
+"""Query latency and VACUUM time: plain vs hash-partitioned tasks.
+
+Builds two scratch tables shaped like ``tasks`` (without foreign keys),
+``bench_tasks_plain`` and ``bench_tasks_hash`` with ``--partitions``
+hash partitions on workspace_id, fills both with ``--rows`` tasks
+spread over ``--workspaces`` workspaces and creates the hot indexes.
+Then measures, for random workspaces: the first page of the task list,
+the overdue count and a lookup by id. Finally it updates every task of
+``--hot-workspaces`` workspaces and times VACUUM of the whole table and,
+for the partitioned one, of just the partitions those workspaces live
+in. Needs the database from DATABASE_URL; the tables are dropped
+afterwards. Loading 50M rows takes a while and ~30 GB of disk.
+
+    python -m benchmarks.task_partitioning --rows 50000000 --partitions 16
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from benchmarks._common import latency_summary, print_table
+
+TABLES = ("bench_tasks_plain", "bench_tasks_hash")
+
+COLUMNS_SQL = """
+    id uuid NOT NULL,
+    workspace_id uuid NOT NULL,
+    number bigint NOT NULL,
+    title varchar(200) NOT NULL,
+    description text,
+    is_completed boolean NOT NULL DEFAULT false,
+    priority smallint NOT NULL DEFAULT 2,
+    due_date timestamptz,
+    user_id uuid NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now()
+"""
+
+# Workspace k has id md5('ws' || k)::uuid, so queries can name one
+# without keeping a list around.
+FILL_SQL = """
+    INSERT INTO {table} (id, workspace_id, number, title, is_completed, priority, due_date,
+                         user_id, created_at)
+    SELECT gen_random_uuid(),
+           md5('ws' || (g % :workspaces))::uuid,
+           g / :workspaces + 1,
+           'task ' || g,
+           g % 10 < 7,
+           1 + g % 3,
+           now() + ((g % 180) - 90) * interval '1 day',
+           md5('user' || (g % 1000))::uuid,
+           now() - (g % 10000000) * interval '1 second'
+    FROM generate_series(:start, :stop - 1) AS g
+"""
+
+INDEXES = (
+    "CREATE INDEX ON {table} (workspace_id, created_at, id)",
+    "CREATE INDEX ON {table} (workspace_id, due_date) WHERE is_completed = false",
+    "CREATE INDEX ON {table} (is_completed)",
+    "CREATE UNIQUE INDEX ON {table} (workspace_id, number)",
+)
+
+QUERIES = {
+    "first page": """
+        SELECT * FROM {table} WHERE workspace_id = md5('ws' || :k)::uuid
+        ORDER BY created_at DESC, id DESC LIMIT 50
+    """,
+    "overdue count": """
+        SELECT count(*) FROM {table}
+        WHERE workspace_id = md5('ws' || :k)::uuid AND is_completed = false AND due_date < now()
+    """,
+    "lookup by id": "SELECT * FROM {table} WHERE workspace_id = :workspace_id AND id = :id",
+}
+
+
+async def _execute(sql: str, params: dict | None = None):
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        return await conn.execute(text(sql), params or {})
+
+
+async def _create_tables(args: argparse.Namespace) -> None:
+    await _execute(f"CREATE UNLOGGED TABLE bench_tasks_plain ({COLUMNS_SQL}, PRIMARY KEY (id))")
+    await _execute(
+        f"CREATE UNLOGGED TABLE bench_tasks_hash ({COLUMNS_SQL}, PRIMARY KEY (id, workspace_id)) "
+        "PARTITION BY HASH (workspace_id)"
+    )
+    for remainder in range(args.partitions):
+        await _execute(
+            f"CREATE UNLOGGED TABLE bench_tasks_hash_p{remainder} PARTITION OF bench_tasks_hash "
+            f"FOR VALUES WITH (MODULUS {args.partitions}, REMAINDER {remainder})"
+        )
+
+
+async def _fill(table: str, args: argparse.Namespace) -> float:
+    started = time.perf_counter()
+    for start in range(0, args.rows, args.chunk):
+        await _execute(
+            FILL_SQL.format(table=table),
+            {"workspaces": args.workspaces, "start": start, "stop": min(start + args.chunk, args.rows)},
+        )
+    for index in INDEXES:
+        await _execute(index.format(table=table))
+    await _execute(f"VACUUM ANALYZE {table}")
+    return time.perf_counter() - started
+
+
+async def _latencies(table: str, args: argparse.Namespace) -> dict[str, dict]:
+    sample = (
+        await _execute(f"SELECT workspace_id, id FROM {table} TABLESAMPLE SYSTEM (0.1) LIMIT :n", {"n": args.queries})
+    ).all()
+    rng = random.Random(0)
+    results = {}
+    async with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            statement = text(sql.format(table=table))
+            samples: list[float] = []
+            for i in range(args.queries):
+                workspace_id, task_id = sample[i % len(sample)]
+                params = {"k": rng.randrange(args.workspaces), "workspace_id": workspace_id, "id": task_id}
+                started = time.perf_counter()
+                (await conn.execute(statement, params)).all()
+                samples.append((time.perf_counter() - started) * 1000)
+            results[name] = latency_summary(samples)
+        await conn.rollback()
+    return results
+
+
+async def _vacuum(table: str, args: argparse.Namespace) -> dict[str, float]:
+    hot = list(range(args.hot_workspaces))
+    timings = {}
+    await _execute(
+        f"UPDATE {table} SET is_completed = NOT is_completed, updated_at = now() "
+        "WHERE workspace_id IN (SELECT md5('ws' || k)::uuid FROM unnest(CAST(:hot AS int[])) AS k)",
+        {"hot": hot},
+    )
+    if table == "bench_tasks_hash":
+        partitions = (
+            await _execute(
+                f"SELECT DISTINCT tableoid::regclass::text FROM {table} "
+                "WHERE workspace_id IN (SELECT md5('ws' || k)::uuid FROM unnest(CAST(:hot AS int[])) AS k)",
+                {"hot": hot},
+            )
+        ).scalars().all()
+        started = time.perf_counter()
+        for partition in partitions:
+            await _execute(f"VACUUM {partition}")
+        timings["vacuum_touched_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        timings["partitions_touched"] = len(partitions)
+        # Same dead tuples again, so the full VACUUM below has work to do.
+        await _execute(
+            f"UPDATE {table} SET is_completed = NOT is_completed, updated_at = now() "
+            "WHERE workspace_id IN (SELECT md5('ws' || k)::uuid FROM unnest(CAST(:hot AS int[])) AS k)",
+            {"hot": hot},
+        )
+    started = time.perf_counter()
+    await _execute(f"VACUUM {table}")
+    timings["vacuum_table_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--workspaces", type=int, default=10_000)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="rows per INSERT while loading")
+    parser.add_argument("--queries", type=int, default=2000, help="samples per query type")
+    parser.add_argument("--hot-workspaces", type=int, default=10, help="workspaces updated before VACUUM")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    try:
+        await _create_tables(args)
+        for table in TABLES:
+            load_seconds = await _fill(table, args)
+            latencies = await _latencies(table, args)
+            vacuum = await _vacuum(table, args)
+            for name, summary in latencies.items():
+                results[f"{table} {name}"] = summary
+            results[f"{table} maintenance"] = {"load_s": round(load_seconds, 1), **vacuum}
+    finally:
+        for table in TABLES:
+            await _execute(f"DROP TABLE IF EXISTS {table}")
+        await engine.dispose()
+
+    print_table(
+        f"{args.rows} tasks, {args.workspaces} workspaces, {args.partitions} partitions",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""Polling throughput of the task list with and without If-None-Match.
+
+Seeds a throwaway workspace with ``--tasks`` tasks, then has ``--clients``
+concurrent pollers fetch ``GET /workspaces/{id}/tasks`` ``--polls`` times
+each: once unconditionally, and once sending the ETag from their previous
+response, so unchanged lists come back as 304 without touching the tasks.
+Needs the database from DATABASE_URL with migrations applied; the
+workspace is deleted afterwards.
+
+    python -m benchmarks.task_polling --clients 20 --polls 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.db.session import engine
+from app.main import app
+from benchmarks._common import latency_summary, print_table
+from benchmarks._fixtures import auth_headers, cleanup, seed_workspace
+
+
+async def _poller(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict,
+    polls: int,
+    conditional: bool,
+) -> tuple[list[float], int, int]:
+    latencies: list[float] = []
+    received = not_modified = 0
+    etag = None
+    for _ in range(polls):
+        request_headers = {**headers, "If-None-Match": etag} if conditional and etag else headers
+        started = time.perf_counter()
+        response = await client.get(url, headers=request_headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code == 304:
+            not_modified += 1
+        else:
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+        received += len(response.content)
+    return latencies, received, not_modified
+
+
+async def _run(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict,
+    args: argparse.Namespace,
+    conditional: bool,
+) -> dict:
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_poller(client, url, headers, args.polls, conditional) for _ in range(args.clients))
+    )
+    elapsed = time.perf_counter() - started
+    latencies = [sample for samples, _, _ in results for sample in samples]
+    total = args.clients * args.polls
+    return {
+        "req_per_s": round(total / elapsed, 1),
+        "kib_received": round(sum(received for _, received, _ in results) / 1024, 1),
+        "not_modified": sum(count for _, _, count in results),
+        **latency_summary(latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace(args.tasks)
+    headers = auth_headers(user_id)
+    url = f"/workspaces/{workspace_id}/tasks?limit={args.limit}"
+    results: dict[str, dict] = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            (await client.get(url, headers=headers)).raise_for_status()  # warm up
+            results["unconditional"] = await _run(client, url, headers, args, conditional=False)
+            results["If-None-Match"] = await _run(client, url, headers, args, conditional=True)
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+    print_table(f"{args.clients} clients x {args.polls} polls, page of {args.limit}", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""Open tasks by urgency with and without the partial priority index.
+
+Seeds a throwaway workspace with ``--tasks`` synthetic tasks, then runs
+EXPLAIN (ANALYZE, BUFFERS) for the ``list_open_tasks_by_urgency`` query
+twice: as shipped, and after dropping ix_tasks_workspace_open_priority_due
+inside a transaction that is rolled back, which is the plan the query got
+before the index existed. Also compares the size of the (workspace_id,
+priority, created_at, id) index with the same index built over the old
+text values. Needs the database from DATABASE_URL with migrations
+applied; the workspace is deleted afterwards.
+
+    python -m benchmarks.task_priority --tasks 1000000
+"""
+
+import argparse
+import asyncio
+import json
+
+from sqlalchemy import text
+
+from app.db.session import async_session, engine
+from benchmarks._common import print_table
+from benchmarks._fixtures import cleanup, seed_workspace
+
+URGENCY_SQL = (
+    "SELECT * FROM tasks WHERE workspace_id = :workspace_id AND is_completed = false "
+    "ORDER BY priority DESC, due_date LIMIT :limit"
+)
+
+SET_DUE_DATES = text(
+    """
+    UPDATE tasks SET due_date = now() + make_interval(hours => (hashtext(id::text) % 5000))
+    WHERE workspace_id = :workspace_id AND hashtext(id::text) % 3 <> 0
+    """
+)
+
+TEXT_INDEX = text(
+    "CREATE INDEX ix_bench_priority_text ON tasks "
+    "(workspace_id, ((ARRAY['low', 'medium', 'high'])[priority]), created_at, id)"
+)
+
+
+def _summarize(plan: dict) -> dict[str, float | str]:
+    nodes = []
+    node = plan["Plan"]
+    while node:
+        nodes.append(node["Node Type"] + (f" {node['Index Name']}" if "Index Name" in node else ""))
+        node = (node.get("Plans") or [None])[0]
+    return {
+        "execution_ms": round(plan["Execution Time"], 3),
+        "buffers": plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0),
+        "plan": " > ".join(nodes),
+    }
+
+
+async def _explain(db, workspace_id, limit: int) -> dict:
+    result = await db.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {URGENCY_SQL}"),
+        {"workspace_id": workspace_id, "limit": limit},
+    )
+    raw = result.scalar_one()
+    return _summarize((json.loads(raw) if isinstance(raw, str) else raw)[0])
+
+
+async def _index_size(db, name: str) -> int:
+    return await db.scalar(text("SELECT pg_relation_size(CAST(:name AS regclass))"), {"name": name})
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace(args.tasks)
+    try:
+        async with async_session() as db:
+            await db.execute(SET_DUE_DATES, {"workspace_id": workspace_id})
+            await db.commit()
+            await db.execute(text("ANALYZE tasks"))
+            await db.commit()
+
+        async with async_session() as db:
+            await _explain(db, workspace_id, args.limit)  # warm the cache
+            after = await _explain(db, workspace_id, args.limit)
+            await db.execute(text("DROP INDEX ix_tasks_workspace_open_priority_due"))
+            before = await _explain(db, workspace_id, args.limit)
+            await db.rollback()
+
+            smallint_size = await _index_size(db, "ix_tasks_workspace_priority_created")
+            await db.execute(TEXT_INDEX)
+            text_size = await _index_size(db, "ix_bench_priority_text")
+            await db.rollback()
+
+        print_table(
+            f"open tasks by urgency, {args.tasks:,} tasks, top {args.limit}",
+            {"without partial index": before, "with partial index": after},
+        )
+
+        print("\nix_tasks_workspace_priority_created size")
+        print(f"  {'priority as text':<24} {text_size / 2**20:.1f} MiB")
+        print(f"  {'priority as smallint':<24} {smallint_size / 2**20:.1f} MiB")
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
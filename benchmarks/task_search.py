@@ -0,0 +1,98 @@
+"""Full-text search vs ILIKE over task titles and descriptions.
+
+Seeds a throwaway workspace with ``--tasks`` synthetic tasks whose titles
+and descriptions are drawn from a small vocabulary, then times the ranked
+``search_tasks`` query against an ``ILIKE '%term%'`` scan for a few terms
+of different selectivity. Needs the database from DATABASE_URL with
+migrations applied; the workspace is deleted afterwards.
+
+    python -m benchmarks.task_search --tasks 3000000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import or_, select, text
+
+from app.db.session import async_session, engine
+from app.models.task import Task
+from app.repositories.task import search_tasks
+from benchmarks._common import latency_summary, print_table
+from benchmarks._fixtures import cleanup, seed_workspace
+
+VOCABULARY = [
+    "report", "invoice", "deploy", "review", "budget", "migration", "onboarding",
+    "release", "incident", "backup", "audit", "roadmap", "payroll", "contract",
+    "benchmark", "kubernetes", "postgres", "frontend", "security", "quarterly",
+]
+
+SEED_SQL = text(
+    """
+    INSERT INTO tasks (workspace_id, user_id, title, description)
+    SELECT :workspace_id, :user_id,
+           w[1 + n % 20] || ' ' || w[1 + (n / 20) % 20] || ' #' || n,
+           CASE WHEN n % 3 = 0 THEN NULL
+                ELSE 'Prepare ' || w[1 + (n / 7) % 20] || ' and ' || w[1 + (n / 400) % 20]
+                     || CASE WHEN n % 997 = 0 THEN ' zeppelin' ELSE '' END
+           END
+    FROM generate_series(1, :count) AS n, (SELECT CAST(:words AS text[]) AS w) AS vocabulary
+    """
+)
+
+TERMS = ["report", "kubernetes deploy", "zeppelin"]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=3_000_000)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace()
+    try:
+        async with async_session() as db:
+            await db.execute(
+                SEED_SQL,
+                {"workspace_id": workspace_id, "user_id": user_id, "count": args.tasks, "words": VOCABULARY},
+            )
+            await db.commit()
+            await db.execute(text("ANALYZE tasks"))
+            await db.commit()
+
+        results: dict[str, dict] = {}
+        async with async_session() as db:
+            for term in TERMS:
+                fts_ms: list[float] = []
+                ilike_ms: list[float] = []
+                pattern = f"%{term.split()[0]}%"
+                for _ in range(args.repeats):
+                    started = time.perf_counter()
+                    await search_tasks(db, workspace_id, term, limit=args.limit)
+                    fts_ms.append((time.perf_counter() - started) * 1000)
+
+                    started = time.perf_counter()
+                    await db.execute(
+                        select(Task.id)
+                        .where(
+                            Task.workspace_id == workspace_id,
+                            or_(Task.title.ilike(pattern), Task.description.ilike(pattern)),
+                        )
+                        .order_by(Task.created_at.desc())
+                        .limit(args.limit)
+                    )
+                    ilike_ms.append((time.perf_counter() - started) * 1000)
+                    db.expunge_all()
+
+                results[f"fts   '{term}'"] = latency_summary(fts_ms)
+                results[f"ilike '{pattern}'"] = latency_summary(ilike_ms)
+
+        print_table(f"search over {args.tasks:,} tasks, top {args.limit}", results)
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Delta sync vs full re-download of a workspace.
+
+Seeds a throwaway workspace with ``--tasks`` tasks, does one full sync
+through ``GET /workspaces/{id}/tasks/changes``, then for each of
+``--changes`` edits (and deletes a tenth as many) tasks and times the
+incremental sync from the previous cursor against a fresh full sync.
+Needs the database from DATABASE_URL with migrations applied; the
+workspace is deleted afterwards.
+
+    python -m benchmarks.task_sync --tasks 200000 --changes 1 100 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlalchemy import text
+
+from app.db.session import async_session, engine
+from app.main import app
+from benchmarks._common import print_table
+from benchmarks._fixtures import auth_headers, cleanup, seed_workspace
+
+TOUCH_SQL = text(
+    """
+    UPDATE tasks SET title = title || '*'
+    WHERE id IN (SELECT id FROM tasks WHERE workspace_id = :workspace_id ORDER BY random() LIMIT :count)
+    """
+)
+DELETE_SQL = text(
+    """
+    DELETE FROM tasks
+    WHERE id IN (SELECT id FROM tasks WHERE workspace_id = :workspace_id ORDER BY random() LIMIT :count)
+    """
+)
+
+
+async def _sync(client: httpx.AsyncClient, url: str, headers: dict, since: str | None) -> tuple[str, dict]:
+    received = items = requests = 0
+    started = time.perf_counter()
+    while True:
+        params = {"limit": 1000, **({"since": since} if since else {})}
+        response = await client.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        page = response.json()
+        requests += 1
+        received += len(response.content)
+        items += len(page["items"])
+        since = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    return since, {
+        "ms": round((time.perf_counter() - started) * 1000, 1),
+        "requests": requests,
+        "items": items,
+        "kib": round(received / 1024, 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--changes", type=int, nargs="+", default=[1, 100, 10_000])
+    args = parser.parse_args()
+
+    workspace_id, user_id = await seed_workspace(args.tasks)
+    headers = auth_headers(user_id)
+    url = f"/workspaces/{workspace_id}/tasks/changes"
+    results: dict[str, dict] = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            cursor, results["initial full sync"] = await _sync(client, url, headers, None)
+            for count in args.changes:
+                async with async_session() as db:
+                    await db.execute(TOUCH_SQL, {"workspace_id": workspace_id, "count": count})
+                    await db.execute(DELETE_SQL, {"workspace_id": workspace_id, "count": max(1, count // 10)})
+                    await db.commit()
+                cursor, results[f"delta after {count:,} edits"] = await _sync(client, url, headers, cursor)
+                _, results[f"full after {count:,} edits"] = await _sync(client, url, headers, None)
+    finally:
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+    print_table(f"sync of a {args.tasks:,}-task workspace", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+"""Cost of the workspace role check, per check and per request.
+
+Seeds ``--members`` memberships spread over ``--workspaces`` workspaces
+and ``--users`` users, then times ``get_workspace_role`` for random
+members three ways: after dropping the membership indexes inside a
+transaction that is rolled back (the sequential scan every request paid
+before), with the indexes but an empty cache, and from the cache. Then
+measures ``GET /workspaces/{id}/tasks/stats`` with a cold and a warm
+cache, counting statements per request. Needs the database from
+DATABASE_URL with migrations applied; everything seeded is deleted
+afterwards.
+
+    python -m benchmarks.workspace_authz --members 500000 --checks 2000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+import httpx
+from sqlalchemy import text
+
+from app.core.dependencies import get_workspace_role, membership_cache
+from app.db.session import async_session, engine
+from app.main import app
+from benchmarks._common import QueryCounter, latency_summary, print_table
+from benchmarks._fixtures import auth_headers, cleanup, seed_workspace
+
+SEED_USERS_SQL = text(
+    """
+    INSERT INTO users (email, username, hashed_password)
+    SELECT :prefix || n || '@example.com', :prefix || n, 'x'
+    FROM generate_series(0, :count - 1) AS n
+    """
+)
+
+SEED_WORKSPACES_SQL = text(
+    """
+    INSERT INTO workspaces (name, key)
+    SELECT :prefix || n, :key_prefix || lpad(n::text, 6, '0')
+    FROM generate_series(0, :count - 1) AS n
+    """
+)
+
+# Member n joins workspace n % workspaces as user n / workspaces, so every
+# (workspace, user) pair is distinct.
+SEED_MEMBERS_SQL = text(
+    """
+    INSERT INTO workspace_members (workspace_id, user_id, role)
+    SELECT w.id, u.id, 'MEMBER'
+    FROM generate_series(0, :count - 1) AS n
+    JOIN workspaces w ON w.key = :key_prefix || lpad((n % :workspaces)::text, 6, '0')
+    JOIN users u ON u.username = :prefix || (n / :workspaces)
+    """
+)
+
+SAMPLE_MEMBERS_SQL = text(
+    """
+    SELECT m.workspace_id, m.user_id FROM workspace_members m
+    JOIN users u ON u.id = m.user_id
+    WHERE u.username LIKE :prefix || '%'
+    ORDER BY random() LIMIT :limit
+    """
+)
+
+
+async def _time_checks(db, pairs: list[tuple[uuid.UUID, uuid.UUID]], cached: bool) -> dict:
+    latencies = []
+    for key in pairs:
+        if not cached:
+            membership_cache.invalidate(key)
+        started = time.perf_counter()
+        role = await get_workspace_role(db, *key)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert role is not None
+    return latency_summary(latencies)
+
+
+async def _time_requests(client, url: str, headers: dict, requests: int, cached: bool) -> dict:
+    latencies = []
+    with QueryCounter(engine) as counter:
+        for _ in range(requests):
+            if not cached:
+                membership_cache.clear()
+            started = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+    return {**latency_summary(latencies), "queries_per_request": round(counter.count / requests, 2)}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=500_000)
+    parser.add_argument("--workspaces", type=int, default=5_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--checks", type=int, default=2_000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    if args.members > args.workspaces * args.users:
+        parser.error("--members must not exceed --workspaces * --users")
+
+    suffix = uuid.uuid4().hex[:3]
+    prefix = f"authz_{suffix}_"
+    key_prefix = f"Z{suffix.upper()}"
+    workspace_id, user_id = await seed_workspace()
+    try:
+        async with async_session() as db:
+            await db.execute(SEED_USERS_SQL, {"prefix": prefix, "count": args.users})
+            await db.execute(
+                SEED_WORKSPACES_SQL,
+                {"prefix": prefix, "key_prefix": key_prefix, "count": args.workspaces},
+            )
+            await db.execute(
+                SEED_MEMBERS_SQL,
+                {
+                    "prefix": prefix,
+                    "key_prefix": key_prefix,
+                    "workspaces": args.workspaces,
+                    "count": args.members,
+                },
+            )
+            await db.commit()
+            await db.execute(text("ANALYZE workspace_members"))
+            await db.commit()
+            pairs = [
+                tuple(row)
+                for row in await db.execute(SAMPLE_MEMBERS_SQL, {"prefix": prefix, "limit": args.checks})
+            ]
+            random.shuffle(pairs)
+
+        async with async_session() as db:
+            await db.execute(text("DROP INDEX uq_workspace_members_workspace_user"))
+            await db.execute(text("DROP INDEX ix_workspace_members_user_id"))
+            without_index = await _time_checks(db, pairs, cached=False)
+            await db.rollback()
+
+        async with async_session() as db:
+            uncached = await _time_checks(db, pairs, cached=False)
+            cached = await _time_checks(db, pairs, cached=True)
+
+        print_table(
+            f"role check, {args.members:,} memberships, {len(pairs):,} checks",
+            {"no index": without_index, "index, cache miss": uncached, "cache hit": cached},
+        )
+
+        url = f"/workspaces/{workspace_id}/tasks/stats"
+        headers = auth_headers(user_id)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await client.get(url, headers=headers)  # warm up
+            cold = await _time_requests(client, url, headers, args.requests, cached=False)
+            warm = await _time_requests(client, url, headers, args.requests, cached=True)
+
+        print_table(
+            f"GET {url.replace(str(workspace_id), '{id}')}, {args.requests} requests",
+            {"membership cache cold": cold, "membership cache warm": warm},
+        )
+    finally:
+        async with async_session() as db:
+            await db.execute(text("DELETE FROM workspaces WHERE key LIKE :p"), {"p": f"{key_prefix}%"})
+            await db.execute(text("DELETE FROM users WHERE username LIKE :p"), {"p": f"{prefix}%"})
+            await db.commit()
+        await cleanup(workspace_id, user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())